@@ -0,0 +1,35 @@
+"""Add migration_history table
+
+Revision ID: 5b7e9a13c2d4
+Revises: 8c4d2e7f1a90
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e9a13c2d4'
+down_revision: Union[str, None] = '8c4d2e7f1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Records one-off migrations (e.g. youtube_fields) so startup checks are a
+    # primary-key lookup instead of column introspection. init_db() may have
+    # created it already.
+    if sa.inspect(op.get_bind()).has_table('migration_history'):
+        return
+    op.create_table(
+        'migration_history',
+        sa.Column('version', sa.String(length=100), nullable=False),
+        sa.Column('applied_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('version')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('migration_history')
@@ -0,0 +1,39 @@
+"""Cover processing_logs.created_at index with id
+
+Revision ID: 8c4d2e7f1a90
+Revises: 3a2ff4ffe400
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4d2e7f1a90'
+down_revision: Union[str, None] = '3a2ff4ffe400'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _processing_logs_exists() -> bool:
+    return sa.inspect(op.get_bind()).has_table('processing_logs')
+
+
+def upgrade() -> None:
+    # Covering index so the age-based cleanup (created_at < cutoff -> id) is
+    # an index-only range scan. INCLUDE is PostgreSQL 11+ only; other
+    # databases keep the plain created_at index from the model.
+    if op.get_bind().dialect.name != 'postgresql' or not _processing_logs_exists():
+        return
+    op.execute('DROP INDEX IF EXISTS ix_processing_logs_created_at')
+    op.create_index('ix_processing_logs_created_at', 'processing_logs', ['created_at'],
+                    unique=False, postgresql_include=['id'])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql' or not _processing_logs_exists():
+        return
+    op.drop_index('ix_processing_logs_created_at', table_name='processing_logs')
+    op.create_index('ix_processing_logs_created_at', 'processing_logs', ['created_at'], unique=False)
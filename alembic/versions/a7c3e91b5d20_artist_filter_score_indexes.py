@@ -0,0 +1,45 @@
+"""Composite and partial artist indexes for filtered score ordering
+
+Revision ID: a7c3e91b5d20
+Revises: d41f6c2a9e37
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91b5d20'
+down_revision: Union[str, None] = 'd41f6c2a9e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_indexes() -> set:
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('artists')}
+
+
+def upgrade() -> None:
+    # /api/leads and /api/export filter on tier/region or "has a YouTube
+    # channel" and order by total_score DESC; these let both be an index range
+    # scan instead of a scan plus sort. init_db() may have created them
+    # already from the model.
+    existing = _existing_indexes()
+    if 'idx_artists_tier_region_score' not in existing:
+        op.create_index('idx_artists_tier_region_score', 'artists',
+                        ['lead_tier', 'region', 'total_score'], unique=False)
+    if 'idx_artists_has_youtube_score' not in existing:
+        op.create_index('idx_artists_has_youtube_score', 'artists', ['total_score'], unique=False,
+                        postgresql_where=sa.text('youtube_channel_id IS NOT NULL'),
+                        sqlite_where=sa.text('youtube_channel_id IS NOT NULL'))
+    
+    # Refresh planner statistics so the new indexes are considered right away
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ANALYZE artists')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_artists_has_youtube_score', table_name='artists')
+    op.drop_index('idx_artists_tier_region_score', table_name='artists')
@@ -0,0 +1,37 @@
+"""Trigram index on artists.name for substring search
+
+Revision ID: d41f6c2a9e37
+Revises: 5b7e9a13c2d4
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f6c2a9e37'
+down_revision: Union[str, None] = '5b7e9a13c2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    # /api/leads?search= filters with name ILIKE '%term%', which a B-tree
+    # index cannot serve. A pg_trgm GIN index can; other databases get the
+    # plain index the model declares. init_db() may have created it already.
+    if _is_postgresql():
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('artists')}
+    if 'ix_artists_name_trgm' not in existing:
+        op.create_index('ix_artists_name_trgm', 'artists', ['name'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_artists_name_trgm', table_name='artists')
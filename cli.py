@@ -331,6 +331,14 @@ def stats():
     except Exception as e:
         click.echo(f"❌ Failed to fetch statistics: {e}")
 
+@cli.command()
+@click.option('--days', default=30, help='Delete processing logs older than this many days')
+def cleanup_logs(days):
+    """Delete old processing logs"""
+    db = DatabaseManager()
+    deleted = db.cleanup_processing_logs(days=days)
+    click.echo(f"🧹 Removed {deleted} processing logs older than {days} days")
+
 @cli.command()
 def status():
     """Show system status including YouTube API and rate limits"""
@@ -2,11 +2,24 @@
 Configuration modules for Precise Digital Lead Generation Tool
 """
 
-from .settings import settings
-from .database import DatabaseManager, init_db
+import importlib
+
+# Names are resolved on first access so that `import config.settings` does not
+# also pull in SQLAlchemy and open a database engine via config.database.
+# The settings instance lives at `config.settings.settings`; the package
+# attribute `config.settings` is the submodule itself.
+_LAZY_EXPORTS = {
+    'DatabaseManager': ('.database', 'DatabaseManager'),
+    'init_db': ('.database', 'init_db'),
+}
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_EXPORTS[name]
+    return getattr(importlib.import_module(module_name, __name__), attr)
 
 __all__ = [
-    'settings',
     'DatabaseManager',
     'init_db'
-]
\ No newline at end of file
+]
@@ -6,15 +6,16 @@ Replace your existing config/database.py with this corrected version
 import os
 import logging
 from contextlib import contextmanager
-from datetime import datetime
+from pathlib import Path
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from sqlalchemy import (
     create_engine, Column, Integer, String, Float, DateTime, 
-    Boolean, Text, ForeignKey, Index, text, JSON
+    Boolean, Text, ForeignKey, Index, text, JSON, delete, inspect, event, DDL
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship, Session
 from sqlalchemy.sql import func
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -92,8 +93,24 @@ class Artist(Base):
         Index('idx_artists_outreach_status', 'outreach_status'),
         Index('idx_artists_youtube_subscribers', 'youtube_subscribers'),
         Index('idx_artists_social_handles_gin', 'social_handles', postgresql_using='gin'),
+        # Trigram index for name ILIKE '%term%' searches (plain B-tree elsewhere)
+        Index('ix_artists_name_trgm', 'name', postgresql_using='gin',
+              postgresql_ops={'name': 'gin_trgm_ops'}),
+        # Tier/region filters in score order (leads list, export); DESC is a
+        # backward scan of the same index
+        Index('idx_artists_tier_region_score', 'lead_tier', 'region', 'total_score'),
+        # Partial index for the has-channel YouTube filter, in score order
+        Index('idx_artists_has_youtube_score', 'total_score',
+              postgresql_where=text('youtube_channel_id IS NOT NULL'),
+              sqlite_where=text('youtube_channel_id IS NOT NULL')),
     )
 
+# gin_trgm_ops comes from pg_trgm, which must exist before create_all() builds the index
+event.listen(
+    Artist.__table__, 'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
+
 class Track(Base):
     """Track model with ISRC and platform data"""
     __tablename__ = 'tracks'
@@ -212,10 +229,45 @@ class ProcessingLog(Base):
               postgresql_where=text('data_sources_used IS NOT NULL')),
         # Additional useful indexes
         Index('ix_processing_logs_success', 'success'),
-        Index('ix_processing_logs_created_at', 'created_at'),
+        # Covers the cleanup's created_at < cutoff -> id lookup (PostgreSQL 11+)
+        Index('ix_processing_logs_created_at', 'created_at', postgresql_include=['id']),
         Index('ix_processing_logs_isrc', 'isrc_processed'),
     )
 
+class MigrationHistory(Base):
+    """One-off schema migrations applied outside Alembic, keyed by version"""
+    __tablename__ = 'migration_history'
+    
+    version = Column(String(100), primary_key=True)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Column whitelists for dict-driven updates. Filtering against these instead of
+# probing hasattr() skips SQLAlchemy descriptor lookups for unknown keys and
+# never assigns relationship attributes (which would trigger lazy loads).
+_ARTIST_COLUMNS = frozenset(c.name for c in Artist.__table__.columns) - {'id'}
+_TRACK_COLUMNS = frozenset(c.name for c in Track.__table__.columns) - {'id', 'artist_id'}
+
+# Rows per INSERT ... ON CONFLICT statement in DatabaseManager.upsert_tracks()
+TRACK_UPSERT_BATCH = 500
+
+_DELETE_PROCESSING_LOG_BATCH = text(
+    "DELETE FROM processing_logs WHERE id IN ("
+    "SELECT id FROM processing_logs WHERE created_at < :cutoff LIMIT :batch_size)"
+)
+
+_SELECT_MIGRATION = text("SELECT 1 FROM migration_history WHERE version = :version")
+
+YOUTUBE_MIGRATION = 'youtube_fields'
+
+_DATA_DIR_READY = False
+
+def _ensure_data_dir():
+    """Create the local data directory (SQLite storage) once per process"""
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        Path('data').mkdir(parents=True, exist_ok=True)
+        _DATA_DIR_READY = True
+
 class DatabaseManager:
     """Database connection and session management"""
     
@@ -224,7 +276,9 @@ class DatabaseManager:
         if not self.database_url:
             # Fallback to SQLite for development
             self.database_url = 'sqlite:///data/precise_leads.db'
-            os.makedirs('data', exist_ok=True)
+        
+        if self.database_url.startswith('sqlite'):
+            _ensure_data_dir()
         
         # Handle Render.com PostgreSQL URL format
         if self.database_url.startswith('postgres://'):
@@ -238,27 +292,23 @@ class DatabaseManager:
     def _setup_database(self):
         """Setup database engine and session"""
         try:
-            # Create engine with proper PostgreSQL settings
+            from config.settings import settings
+            
+            # Pool sizing comes from DatabaseConfig (DB_POOL_SIZE, DB_MAX_OVERFLOW, ...)
+            engine_options = settings.database.engine_options(self.database_url)
             if 'postgresql://' in self.database_url:
-                self.engine = create_engine(
-                    self.database_url,
-                    pool_pre_ping=True,
-                    pool_recycle=300,
-                    echo=False,  # Set to True for SQL debugging
-                    connect_args={
-                        "options": "-c timezone=UTC"
-                    }
-                )
-            else:
-                # SQLite settings
-                self.engine = create_engine(
-                    self.database_url,
-                    echo=False,
-                    connect_args={"check_same_thread": False}
-                )
+                engine_options['connect_args'] = {
+                    "options": "-c timezone=UTC"
+                }
+            self.engine = create_engine(self.database_url, **engine_options)
             
-            self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
-            self.session = self.SessionLocal()
+            # expire_on_commit=False keeps loaded attributes usable after commit
+            # instead of re-SELECTing them on next access
+            self.SessionLocal = sessionmaker(
+                autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+            )
+            # Thread-local session behind `self.session` / `with db_manager as db:`
+            self.session = scoped_session(self.SessionLocal)
             
             logger.info(f"✅ Database connection established: {self.database_url.split('@')[0]}@***")
             
@@ -271,11 +321,16 @@ class DatabaseManager:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            if exc_type:
-                self.session.rollback()
-            else:
-                self.session.commit()
-            self.session.close()
+            try:
+                if exc_type:
+                    self.session.rollback()
+                else:
+                    self.session.commit()
+            finally:
+                if isinstance(self.session, scoped_session):
+                    self.session.remove()
+                else:
+                    self.session.close()
     
     @contextmanager
     def get_session(self):
@@ -289,7 +344,116 @@ class DatabaseManager:
             raise
         finally:
             session.close()
-    
+
+    def save_artist_data(self, artist_data: Dict[str, Any]) -> int:
+        """
+        Create or update an artist with its scores, track and contacts
+
+        Uses the manager's session; the caller's context manager commits.
+        Returns the artist ID.
+        """
+        session = self.session
+
+        existing_artist = None
+        for key in ('musicbrainz_id', 'spotify_id'):
+            if artist_data.get(key):
+                existing_artist = session.query(Artist).filter(
+                    getattr(Artist, key) == artist_data[key]
+                ).first()
+                if existing_artist:
+                    break
+        if existing_artist is None:
+            existing_artist = session.query(Artist).filter(Artist.name == artist_data['name']).first()
+        if existing_artist is None:
+            existing_artist = Artist()
+            session.add(existing_artist)
+
+        for k, v in artist_data.items():
+            if k in _ARTIST_COLUMNS:
+                setattr(existing_artist, k, v)
+
+        scores = artist_data.get('scores') or {}
+        if scores:
+            existing_artist.total_score = scores.get('total_score', 0)
+            existing_artist.independence_score = scores.get('independence_score', 0)
+            existing_artist.opportunity_score = scores.get('opportunity_score', 0)
+            existing_artist.geographic_score = scores.get('geographic_score', 0)
+            existing_artist.lead_tier = scores.get('tier', 'D')
+
+        session.flush()
+
+        track_data = artist_data.get('track_data') or {}
+        if track_data.get('isrc'):
+            track = session.query(Track).filter(Track.isrc == track_data['isrc']).first()
+            if track is None:
+                track = Track(isrc=track_data['isrc'])
+                session.add(track)
+            track.artist_id = existing_artist.id
+            for k, v in track_data.items():
+                if k in _TRACK_COLUMNS:
+                    setattr(track, k, v)
+            if not track.title:
+                track.title = 'Unknown Track'
+
+        for contact in artist_data.get('contacts') or []:
+            if not contact.get('value'):
+                continue
+            session.add(ContactAttempt(
+                artist_id=existing_artist.id,
+                contact_method=contact.get('type', 'unknown'),
+                contact_value=str(contact['value'])[:255],
+                source=contact.get('source', 'unknown'),
+                confidence_score=contact.get('confidence', 0)
+            ))
+
+        session.flush()
+        return existing_artist.id
+
+    def upsert_tracks(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update tracks by ISRC, TRACK_UPSERT_BATCH rows per statement
+
+        Each row needs 'isrc' and 'artist_id'; other keys outside the Track
+        columns are ignored. Uses the manager's session; the caller's context
+        manager commits. Returns the number of distinct ISRCs written.
+        """
+        session = self.session
+
+        # Last row wins per ISRC: one statement may not update a row twice
+        by_isrc = {row['isrc']: row for row in rows if row.get('isrc')}
+        if not by_isrc:
+            return 0
+
+        columns = {'isrc', 'artist_id', 'title'}
+        for row in by_isrc.values():
+            columns.update(k for k in row if k in _TRACK_COLUMNS)
+        columns -= {'created_at', 'updated_at'}
+        values = [
+            {c: row.get(c) for c in columns} | {'title': row.get('title') or 'Unknown Track'}
+            for row in by_isrc.values()
+        ]
+
+        dialect = session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            for row in values:
+                track = session.query(Track).filter(Track.isrc == row['isrc']).first() or Track()
+                for k, v in row.items():
+                    setattr(track, k, v)
+                session.add(track)
+            session.flush()
+            return len(values)
+
+        for start in range(0, len(values), TRACK_UPSERT_BATCH):
+            stmt = insert(Track.__table__).values(values[start:start + TRACK_UPSERT_BATCH])
+            updates = {c: stmt.excluded[c] for c in columns if c != 'isrc'}
+            updates['updated_at'] = func.now()
+            session.execute(stmt.on_conflict_do_update(index_elements=['isrc'], set_=updates))
+        return len(values)
+
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Get dashboard statistics including YouTube metrics"""
         try:
@@ -298,10 +462,12 @@ class DatabaseManager:
                 total_artists = session.query(Artist).count()
                 total_tracks = session.query(Track).count()
                 
-                # Lead tier distribution
-                tier_stats = {}
-                for tier in ['A', 'B', 'C', 'D']:
-                    count = session.query(Artist).filter(Artist.lead_tier == tier).count()
+                # Lead tier distribution (one grouped query instead of one per tier)
+                tier_stats = {'A': 0, 'B': 0, 'C': 0, 'D': 0}
+                tiers = session.query(Artist.lead_tier, func.count(Artist.id)).filter(
+                    Artist.lead_tier.in_(tier_stats.keys())
+                ).group_by(Artist.lead_tier).all()
+                for tier, count in tiers:
                     tier_stats[tier] = count
                 
                 # Geographic distribution
@@ -338,6 +504,42 @@ class DatabaseManager:
             logger.error(f"Failed to get dashboard stats: {e}")
             return {}
     
+    def cleanup_processing_logs(self, days: int = 30, batch_size: int = 10000) -> int:
+        """
+        Delete processing logs older than `days` and return how many were removed
+        
+        Rows are deleted in bulk without loading them into the session. On
+        PostgreSQL the delete runs in id batches, each in its own transaction,
+        to keep individual transactions (and WAL) small.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        deleted = 0
+        
+        try:
+            if self.engine.dialect.name == 'postgresql':
+                while True:
+                    with self.get_session() as session:
+                        result = session.execute(_DELETE_PROCESSING_LOG_BATCH, {
+                            'cutoff': cutoff, 'batch_size': batch_size
+                        })
+                    deleted += result.rowcount
+                    if result.rowcount < batch_size:
+                        break
+            else:
+                with self.get_session() as session:
+                    result = session.execute(
+                        delete(ProcessingLog).where(ProcessingLog.created_at < cutoff),
+                        execution_options={'synchronize_session': False}
+                    )
+                deleted = result.rowcount
+            
+            logger.info(f"🧹 Removed {deleted} processing logs older than {days} days")
+            return deleted
+            
+        except Exception as e:
+            logger.error(f"Failed to clean up processing logs: {e}")
+            return deleted
+    
     def get_youtube_opportunities(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get artists with YouTube opportunities"""
         try:
@@ -377,8 +579,9 @@ class DatabaseManager:
                 
                 # Update YouTube fields
                 for field, value in youtube_data.items():
-                    if hasattr(artist, f'youtube_{field}'):
-                        setattr(artist, f'youtube_{field}', value)
+                    column = f'youtube_{field}'
+                    if column in _ARTIST_COLUMNS:
+                        setattr(artist, column, value)
                 
                 artist.updated_at = datetime.utcnow()
                 return True
@@ -390,6 +593,7 @@ class DatabaseManager:
 def init_db():
     """Initialize database tables"""
     try:
+        _ensure_data_dir()
         db_manager = DatabaseManager()
         
         logger.info("🔄 Initializing database...")
@@ -406,16 +610,90 @@ def init_db():
                 logger.info("✅ Database connection test successful")
             else:
                 logger.error("❌ Database connection test failed")
+        
+        # Tables created from the current models already have the YouTube columns
+        if not _youtube_columns_missing(db_manager.engine):
+            _record_migration(db_manager.engine, YOUTUBE_MIGRATION)
+        
+        # Close pooled connections so forked (--preload) workers don't inherit them
+        db_manager.engine.dispose()
                 
     except Exception as e:
         logger.error(f"❌ Database initialization failed: {e}")
         raise
 
+def is_migration_applied(version: str, engine=None) -> bool:
+    """Check the migration_history table for a version (a single primary-key lookup)"""
+    engine = engine or db_manager.engine
+    try:
+        with engine.connect() as conn:
+            return conn.execute(_SELECT_MIGRATION, {'version': version}).first() is not None
+    except SQLAlchemyError:
+        # No history table yet (database created before it existed)
+        return False
+
+def _record_migration(engine, version: str):
+    """Mark a migration as applied, creating the history table if needed"""
+    MigrationHistory.__table__.create(engine, checkfirst=True)
+    with Session(engine) as session:
+        session.merge(MigrationHistory(version=version))
+        session.commit()
+
+def _youtube_columns_missing(engine) -> List[Any]:
+    """Artist YouTube columns absent from the live artists table"""
+    existing = {column['name'] for column in inspect(engine).get_columns('artists')}
+    return [
+        column for column in Artist.__table__.columns
+        if column.name.startswith('youtube_') and column.name not in existing
+    ]
+
+def check_youtube_migration_needed() -> bool:
+    """Check whether the artists table still lacks the YouTube columns"""
+    engine = db_manager.engine
+    if is_migration_applied(YOUTUBE_MIGRATION, engine):
+        return False
+    
+    # Databases that predate migration_history: inspect once, then record the result
+    try:
+        if _youtube_columns_missing(engine):
+            return True
+        _record_migration(engine, YOUTUBE_MIGRATION)
+        return False
+    except SQLAlchemyError as e:
+        logger.error(f"❌ YouTube migration check failed: {e}")
+        return True
+
+def migrate_youtube_fields():
+    """Add any missing YouTube columns to the artists table and record the migration"""
+    engine = db_manager.engine
+    try:
+        missing = _youtube_columns_missing(engine)
+        with engine.begin() as conn:
+            for column in missing:
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE artists ADD COLUMN {column.name} {column_type}'))
+        _record_migration(engine, YOUTUBE_MIGRATION)
+        logger.info(f"✅ YouTube migration applied ({len(missing)} columns added)")
+    except SQLAlchemyError as e:
+        logger.error(f"❌ YouTube migration failed: {e}")
+        raise
+
+def reset_db():
+    """Drop and recreate all tables (deletes all data)"""
+    try:
+        Base.metadata.drop_all(db_manager.engine)
+        logger.info("🗑️  Database tables dropped")
+        init_db()
+    except Exception as e:
+        logger.error(f"❌ Database reset failed: {e}")
+        raise
+
 # Create global database manager instance
 db_manager = DatabaseManager()
 
 # Export models and manager
 __all__ = [
     'Base', 'Artist', 'Track', 'ContactAttempt', 'OutreachLog', 'ProcessingLog',
-    'DatabaseManager', 'db_manager', 'init_db'
+    'MigrationHistory', 'DatabaseManager', 'db_manager', 'init_db', 'reset_db',
+    'is_migration_applied', 'check_youtube_migration_needed', 'migrate_youtube_fields'
 ]
\ No newline at end of file
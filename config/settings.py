@@ -2,20 +2,26 @@
 Application settings and configuration for Precise Digital Lead Generation Tool
 Centralized configuration management with environment variable support
 """
+import functools
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """Configuration for external API"""
     api_key: str = ""
     base_url: str = ""
     requests_per_minute: int = 60
     requests_per_day: int = None
-    headers: Dict[str, str] = field(default_factory=dict)
+    headers: Mapping[str, str] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        # Shared across every request, so expose the headers read-only
+        object.__setattr__(self, 'headers', MappingProxyType(dict(self.headers)))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration"""
     url: str = "sqlite:///data/precise_leads.db"
@@ -23,8 +29,33 @@ class DatabaseConfig:
     pool_size: int = 5
     max_overflow: int = 10
     pool_pre_ping: bool = True
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    
+    def engine_options(self, url: str = None) -> Dict[str, Any]:
+        """Keyword arguments for sqlalchemy.create_engine() matching this config"""
+        url = url or self.url
+        if url.startswith('sqlite'):
+            options = {
+                'echo': self.echo,
+                'connect_args': {'check_same_thread': False}
+            }
+            if url in ('sqlite://', 'sqlite:///:memory:'):
+                # An in-memory database only exists on its one connection
+                from sqlalchemy.pool import StaticPool
+                options['poolclass'] = StaticPool
+            return options
+        
+        return {
+            'echo': self.echo,
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_pre_ping': self.pool_pre_ping,
+            'pool_timeout': self.pool_timeout,
+            'pool_recycle': self.pool_recycle
+        }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration"""
     debug: bool = False
@@ -32,30 +63,170 @@ class AppConfig:
     port: int = 5000
     secret_key: str = "dev-secret-key-change-in-production"
 
+def _load_dotenv():
+    """Load a local .env file if python-dotenv is installed (existing variables win)"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(override=False)
+
+def _bool(env: Dict[str, str], key: str, default: bool = False) -> bool:
+    """Parse a 'true'/'false' environment flag"""
+    value = env.get(key)
+    return default if value is None else value.lower() == 'true'
+
+def _int(env: Dict[str, str], key: str, default: int) -> int:
+    """Parse an integer environment variable"""
+    value = env.get(key)
+    return default if value is None else int(value)
+
+def _load_env() -> Dict[str, Any]:
+    """Read every environment variable the settings depend on, exactly once"""
+    _load_dotenv()
+    env = dict(os.environ)
+    
+    config = {
+        'debug': _bool(env, 'FLASK_DEBUG'),
+        'host': env.get('HOST', '0.0.0.0'),
+        'port': _int(env, 'PORT', 5000),
+        'secret_key': env.get('SECRET_KEY', 'dev-secret-key-change-in-production'),
+        'database_url': env.get('DATABASE_URL', 'sqlite:///data/precise_leads.db'),
+        'database_echo': _bool(env, 'DATABASE_ECHO'),
+        'db_pool_size': _int(env, 'DB_POOL_SIZE', 5),
+        'db_max_overflow': _int(env, 'DB_MAX_OVERFLOW', 10),
+        'db_pool_timeout': _int(env, 'DB_POOL_TIMEOUT', 30),
+        'db_pool_recycle': _int(env, 'DB_POOL_RECYCLE', 1800),
+        'lastfm_api_key': env.get('LASTFM_API_KEY', ''),
+        'youtube_api_key': env.get('YOUTUBE_API_KEY', ''),
+        'spotify_client_id': env.get('SPOTIFY_CLIENT_ID', ''),
+        'spotify_client_secret': env.get('SPOTIFY_CLIENT_SECRET', ''),
+        'contact_email': env.get('CONTACT_EMAIL', 'contact@precise.digital'),
+        'max_bulk_isrcs': _int(env, 'MAX_BULK_ISRCS', 1000),
+        'bulk_max_workers': _int(env, 'BULK_MAX_WORKERS', 8),
+        'request_timeout': _int(env, 'REQUEST_TIMEOUT', 30),
+    }
+    
+    # Environment-specific overrides
+    if env.get('RENDER'):  # Render.com deployment
+        config.update(host='0.0.0.0', port=_int(env, 'PORT', 10000), debug=False)
+    elif env.get('HEROKU'):  # Heroku deployment
+        config.update(host='0.0.0.0', port=_int(env, 'PORT', 5000), debug=False)
+    
+    return config
+
+# Target regions for geographic scoring. Country sets are frozen and inverted
+# once into a code -> region map so lookups are a single dict get.
+_TARGET_REGIONS = {
+    'new_zealand': frozenset(['NZ', 'NEW ZEALAND']),
+    'australia': frozenset(['AU', 'AUSTRALIA']),
+    'pacific_islands': frozenset(['FJ', 'PG', 'SB', 'VU', 'NC', 'PF', 'WS', 'TO', 'TV', 'KI', 'NR', 'PW', 'MH', 'FM']),
+    'other': frozenset()  # All other countries
+}
+_REGION_BY_CODE = {
+    code: region for region, codes in _TARGET_REGIONS.items() for code in codes
+}
+
+# Major platforms for opportunity scoring (a tuple keeps the reporting order stable)
+_MAJOR_PLATFORMS = (
+    'spotify', 'apple_music', 'youtube_music', 'amazon_music',
+    'deezer', 'tidal', 'bandcamp', 'soundcloud'
+)
+
+# Scoring weights for lead qualification
+_SCORING_WEIGHTS = MappingProxyType({
+    'independence': MappingProxyType({
+        'self_released': 40,
+        'small_distributor': 35,
+        'indie_label': 25,
+        'major_distributed': 0
+    }),
+    'opportunity': MappingProxyType({
+        'missing_platforms': 20,
+        'basic_distribution_only': 15,
+        'no_publishing_admin': 10,
+        'growing_streams': 15,
+        'recent_activity': 10,
+        'low_professional_presence': 10,
+        'youtube_opportunities': 15  # NEW: YouTube-specific opportunities
+    }),
+    'geographic': MappingProxyType({
+        'new_zealand': 30,
+        'australia': 25,
+        'pacific_islands': 20,
+        'other': 5
+    })
+})
+
+# YouTube-specific settings
+_YOUTUBE_SETTINGS = MappingProxyType({
+    'min_subscriber_threshold': 100,
+    'high_potential_threshold': 10000,
+    'engagement_rate_threshold': 0.05,
+    'upload_frequency_scoring': MappingProxyType({
+        'very_active': 10,
+        'active': 8,
+        'moderate': 5,
+        'low': 2,
+        'inactive': 0
+    })
+})
+
+# Contact discovery settings
+_CONTACT_DISCOVERY = MappingProxyType({
+    'max_contacts_per_artist': 15,
+    'min_confidence_threshold': 20,
+    'website_scraping_enabled': True,
+    'social_platform_priority': (
+        'youtube', 'instagram', 'twitter', 'facebook', 
+        'soundcloud', 'bandcamp', 'tiktok'
+    )
+})
+
+# Prism Analytics branding
+_PRISM_BRANDING = MappingProxyType({
+    'company_name': 'Precise Digital',
+    'analytics_engine': 'Prism Analytics Engine',
+    'tagline': 'Transforming Music Data into Actionable Insights',
+    'primary_color': '#1A1A1A',  # Prism Black
+    'accent_color': '#E50914',   # Precise Red
+    'logo_usage': 'Use Prism logo with proper spacing and color guidelines'
+})
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Main settings class with all configuration"""
     
-    def __init__(self):
-        # App configuration
-        self.app = AppConfig(
-            debug=os.getenv('FLASK_DEBUG', 'False').lower() == 'true',
-            host=os.getenv('HOST', '0.0.0.0'),
-            port=int(os.getenv('PORT', 5000)),
-            secret_key=os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-        )
-        
-        # Database configuration
-        self.database = DatabaseConfig(
-            url=os.getenv('DATABASE_URL', 'sqlite:///data/precise_leads.db'),
-            echo=os.getenv('DATABASE_ECHO', 'False').lower() == 'true'
-        )
+    app: AppConfig
+    database: DatabaseConfig
+    apis: Dict[str, APIConfig]
+    api_headers: Mapping[str, Mapping[str, str]]
+    api_configured: Mapping[str, bool]
+    spotify_client_id: str
+    spotify_client_secret: str
+    contact_email: str
+    max_bulk_isrcs: int
+    bulk_max_workers: int
+    request_timeout: int
+    target_regions: Dict[str, frozenset]
+    region_by_code: Dict[str, str]
+    major_platforms: Tuple[str, ...]
+    scoring_weights: Mapping[str, Mapping[str, int]]
+    youtube_settings: Mapping[str, Any]
+    contact_discovery: Mapping[str, Any]
+    prism_branding: Mapping[str, str]
+    
+    @classmethod
+    def from_env(cls, env: Dict[str, Any] = None) -> 'Settings':
+        """Build settings from a `_load_env()` snapshot"""
+        if env is None:
+            env = _load_env()
         
         # API configurations
-        self.apis = {
+        apis = {
             'musicbrainz': APIConfig(
                 base_url='https://musicbrainz.org/ws/2/',
-                requests_per_minute=1,  # Be respectful to MusicBrainz
-                headers={'User-Agent': 'PreciseDigitalLeadGen/1.0 (contact@precise.digital)'}
+                requests_per_minute=1  # Be respectful to MusicBrainz
             ),
             'spotify': APIConfig(
                 base_url='https://api.spotify.com/v1/',
@@ -63,133 +234,112 @@ class Settings:
                 requests_per_day=None
             ),
             'lastfm': APIConfig(
-                api_key=os.getenv('LASTFM_API_KEY', ''),
+                api_key=env['lastfm_api_key'],
                 base_url='https://ws.audioscrobbler.com/2.0/',
                 requests_per_minute=5,
                 requests_per_day=None
             ),
             'youtube': APIConfig(
-                api_key=os.getenv('YOUTUBE_API_KEY', ''),
+                api_key=env['youtube_api_key'],
                 base_url='https://www.googleapis.com/youtube/v3/',
                 requests_per_minute=100,
                 requests_per_day=10000  # Free tier quota
             )
         }
+        user_agent = f"PreciseDigitalLeadGen/1.0 ({env['contact_email']})"
         
-        # Spotify credentials (separate from API config due to OAuth)
-        self.spotify_client_id = os.getenv('SPOTIFY_CLIENT_ID', '')
-        self.spotify_client_secret = os.getenv('SPOTIFY_CLIENT_SECRET', '')
-        
-        # Contact information
-        self.contact_email = os.getenv('CONTACT_EMAIL', 'contact@precise.digital')
-        
-        # Processing limits
-        self.max_bulk_isrcs = int(os.getenv('MAX_BULK_ISRCS', 1000))
-        self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', 30))
-        
-        # Target regions for geographic scoring
-        self.target_regions = {
-            'new_zealand': ['NZ', 'NEW ZEALAND'],
-            'australia': ['AU', 'AUSTRALIA'],
-            'pacific_islands': ['FJ', 'PG', 'SB', 'VU', 'NC', 'PF', 'WS', 'TO', 'TV', 'KI', 'NR', 'PW', 'MH', 'FM'],
-            'other': []  # All other countries
-        }
-        
-        # Major platforms for opportunity scoring
-        self.major_platforms = [
-            'spotify', 'apple_music', 'youtube_music', 'amazon_music',
-            'deezer', 'tidal', 'bandcamp', 'soundcloud'
-        ]
-        
-        # Scoring weights for lead qualification
-        self.scoring_weights = {
-            'independence': {
-                'self_released': 40,
-                'small_distributor': 35,
-                'indie_label': 25,
-                'major_distributed': 0
-            },
-            'opportunity': {
-                'missing_platforms': 20,
-                'basic_distribution_only': 15,
-                'no_publishing_admin': 10,
-                'growing_streams': 15,
-                'recent_activity': 10,
-                'low_professional_presence': 10,
-                'youtube_opportunities': 15  # NEW: YouTube-specific opportunities
-            },
-            'geographic': {
-                'new_zealand': 30,
-                'australia': 25,
-                'pacific_islands': 20,
-                'other': 5
-            }
-        }
-        
-        # YouTube-specific settings
-        self.youtube_settings = {
-            'min_subscriber_threshold': 100,
-            'high_potential_threshold': 10000,
-            'engagement_rate_threshold': 0.05,
-            'upload_frequency_scoring': {
-                'very_active': 10,
-                'active': 8,
-                'moderate': 5,
-                'low': 2,
-                'inactive': 0
-            }
-        }
-        
-        # Contact discovery settings
-        self.contact_discovery = {
-            'max_contacts_per_artist': 15,
-            'min_confidence_threshold': 20,
-            'website_scraping_enabled': True,
-            'social_platform_priority': [
-                'youtube', 'instagram', 'twitter', 'facebook', 
-                'soundcloud', 'bandcamp', 'tiktok'
-            ]
-        }
-        
-        # Prism Analytics branding
-        self.prism_branding = {
-            'company_name': 'Precise Digital',
-            'analytics_engine': 'Prism Analytics Engine',
-            'tagline': 'Transforming Music Data into Actionable Insights',
-            'primary_color': '#1A1A1A',  # Prism Black
-            'accent_color': '#E50914',   # Precise Red
-            'logo_usage': 'Use Prism logo with proper spacing and color guidelines'
-        }
+        return cls(
+            # App configuration
+            app=AppConfig(
+                debug=env['debug'],
+                host=env['host'],
+                port=env['port'],
+                secret_key=env['secret_key']
+            ),
+            
+            # Database configuration
+            database=DatabaseConfig(
+                url=env['database_url'],
+                echo=env['database_echo'],
+                pool_size=env['db_pool_size'],
+                max_overflow=env['db_max_overflow'],
+                pool_timeout=env['db_pool_timeout'],
+                pool_recycle=env['db_pool_recycle']
+            ),
+            
+            # API configurations
+            apis=apis,
+            
+            # Complete per-API request headers, built once and shared read-only
+            api_headers=MappingProxyType({
+                'default': MappingProxyType({'User-Agent': user_agent}),
+                **{
+                    name: MappingProxyType({'User-Agent': user_agent, **config.headers})
+                    for name, config in apis.items()
+                }
+            }),
+            
+            # Availability is fixed for the life of the settings, so resolve it once
+            api_configured=MappingProxyType({
+                'musicbrainz': True,  # Always available
+                'spotify': bool(env['spotify_client_id'] and env['spotify_client_secret']),
+                'lastfm': bool(env['lastfm_api_key']),
+                'youtube': bool(env['youtube_api_key'])
+            }),
+            
+            # Spotify credentials (separate from API config due to OAuth)
+            spotify_client_id=env['spotify_client_id'],
+            spotify_client_secret=env['spotify_client_secret'],
+            
+            # Contact information
+            contact_email=env['contact_email'],
+            
+            # Processing limits
+            max_bulk_isrcs=env['max_bulk_isrcs'],
+            bulk_max_workers=env['bulk_max_workers'],
+            request_timeout=env['request_timeout'],
+            
+            # Target regions for geographic scoring
+            target_regions=_TARGET_REGIONS,
+            region_by_code=_REGION_BY_CODE,
+            
+            # Constant tables are shared, read-only module-level objects
+            major_platforms=_MAJOR_PLATFORMS,
+            scoring_weights=_SCORING_WEIGHTS,
+            youtube_settings=_YOUTUBE_SETTINGS,
+            contact_discovery=_CONTACT_DISCOVERY,
+            prism_branding=_PRISM_BRANDING
+        )
     
     def get_api_config(self, api_name: str) -> APIConfig:
         """Get configuration for specific API"""
-        return self.apis.get(api_name, APIConfig())
+        config = self.apis.get(api_name)
+        return config if config is not None else APIConfig()
+    
+    def get_headers(self, api_name: str) -> Mapping[str, str]:
+        """Prebuilt request headers for an API (shared, read-only)"""
+        headers = self.api_headers.get(api_name)
+        return headers if headers is not None else self.api_headers['default']
+    
+    def get_region_for_country(self, country: str) -> str:
+        """Map a country code (or name) to its target region, 'other' if none"""
+        return self.region_by_code.get(str(country).strip().upper(), 'other')
     
     def is_api_configured(self, api_name: str) -> bool:
         """Check if API is properly configured"""
-        config = self.get_api_config(api_name)
-        
-        if api_name == 'musicbrainz':
-            return True  # Always available
-        elif api_name == 'spotify':
-            return bool(self.spotify_client_id and self.spotify_client_secret)
-        elif api_name in ['lastfm', 'youtube']:
-            return bool(config.api_key)
-        
-        return False
+        return self.api_configured.get(api_name, False)
     
     def get_database_url(self) -> str:
-        """Get database URL with proper formatting"""
-        url = self.database.url
-        
-        # Handle special case for SQLite in production
-        if url.startswith('sqlite:///') and not os.path.exists('data'):
-            os.makedirs('data', exist_ok=True)
-        
-        return url
+        """Get database URL (the SQLite data directory is created by config.database)"""
+        return self.database.url
     
-    def validate_configuration(self) -> Dict[str, Any]:
-        """Validate current configuration and return status"""
+    def validate_configuration(self, engine=None) -> Dict[str, Any]:
+        """
+        Validate current configuration and return status
+        
+        Pass the application's engine to probe it directly; otherwise a cached
+        probe engine for the configured URL is reused across calls.
+        """
         status = {
             'database': {
                 'configured': bool(self.database.url),
@@ -210,10 +360,11 @@ class Settings:
         
         # Test database accessibility
         try:
-            import sqlalchemy
-            engine = sqlalchemy.create_engine(self.get_database_url())
+            if engine is None:
+                engine = _probe_engine(self.get_database_url(), self.database)
             with engine.connect():
                 status['database']['accessible'] = True
+            status['database']['pool_status'] = engine.pool.status()
         except Exception as e:
             status['database']['error'] = str(e)
         
@@ -233,19 +384,22 @@ class Settings:
         
         return status
 
-# Global settings instance
-settings = Settings()
+@functools.lru_cache(maxsize=4)
+def _probe_engine(url: str, database: DatabaseConfig):
+    """Engine used by validate_configuration() when none is supplied"""
+    import sqlalchemy
+    return sqlalchemy.create_engine(url, **database.engine_options(url))
 
-# Environment-specific overrides
-if os.getenv('RENDER'):  # Render.com deployment
-    settings.app.host = '0.0.0.0'
-    settings.app.port = int(os.getenv('PORT', 10000))
-    settings.app.debug = False
-    
-elif os.getenv('HEROKU'):  # Heroku deployment
-    settings.app.host = '0.0.0.0'
-    settings.app.port = int(os.getenv('PORT', 5000))
-    settings.app.debug = False
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, built from the environment on first use"""
+    return Settings.from_env()
+
+def __getattr__(name: str):
+    # `from config.settings import settings` resolves lazily to the cached instance
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Logging configuration
 LOGGING_CONFIG = {
@@ -268,9 +422,13 @@ LOGGING_CONFIG = {
         'file': {
             'level': 'DEBUG',
             'formatter': 'detailed',
-            'class': 'logging.FileHandler',
+            'class': 'logging.handlers.RotatingFileHandler',
             'filename': 'logs/precise_digital.log',
             'mode': 'a',
+            'maxBytes': 10485760,  # 10 MB
+            'backupCount': 5,
+            'encoding': 'utf-8',
+            'delay': True,  # Open the file on first write, not at startup
         }
     },
     'loggers': {
@@ -290,6 +448,7 @@ LOGGING_CONFIG = {
 # Export commonly used settings
 __all__ = [
     'settings',
+    'get_settings',
     'Settings',
     'APIConfig',
     'DatabaseConfig',
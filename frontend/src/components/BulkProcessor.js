@@ -144,6 +144,7 @@ const BulkProcessor = () => {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Accept': 'text/csv',
         },
         body: JSON.stringify({
           filters: {}, // Export all results from bulk processing
@@ -151,15 +152,15 @@ const BulkProcessor = () => {
         }),
       });
       
-      const data = await response.json();
-      
-      if (data.csv_data) {
-        // Create download link
-        const blob = new Blob([data.csv_data], { type: 'text/csv' });
+      if (response.ok) {
+        // The server streams the CSV; take the filename from Content-Disposition
+        const blob = await response.blob();
+        const disposition = response.headers.get('Content-Disposition') || '';
+        const match = disposition.match(/filename=([^;]+)/);
         const url = window.URL.createObjectURL(blob);
         const link = document.createElement('a');
         link.href = url;
-        link.download = data.filename || 'bulk_processing_results.csv';
+        link.download = match ? match[1] : 'bulk_processing_results.csv';
         document.body.appendChild(link);
         link.click();
         document.body.removeChild(link);
@@ -106,6 +106,7 @@ const LeadsList = () => {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Accept': 'text/csv',
         },
         body: JSON.stringify({
           filters: filters,
@@ -113,14 +114,15 @@ const LeadsList = () => {
         }),
       });
       
-      const data = await response.json();
-      
-      if (data.csv_data) {
-        const blob = new Blob([data.csv_data], { type: 'text/csv' });
+      if (response.ok) {
+        // The server streams the CSV; take the filename from Content-Disposition
+        const blob = await response.blob();
+        const disposition = response.headers.get('Content-Disposition') || '';
+        const match = disposition.match(/filename=([^;]+)/);
         const url = window.URL.createObjectURL(blob);
         const link = document.createElement('a');
         link.href = url;
-        link.download = data.filename || 'leads_export.csv';
+        link.download = match ? match[1] : 'leads_export.csv';
         document.body.appendChild(link);
         link.click();
         document.body.removeChild(link);
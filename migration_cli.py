@@ -9,11 +9,13 @@ import argparse
 import subprocess
 from pathlib import Path
 
+ALEMBIC = [sys.executable, '-m', 'alembic']
+
 def run_command(cmd, description):
-    """Run a command with nice output"""
+    """Run a command (argv list, no shell) with nice output"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         if result.stdout:
             print(f"   {result.stdout.strip()}")
         print(f"✅ {description} completed successfully")
@@ -34,7 +36,7 @@ def install_alembic():
         return True
     except ImportError:
         print("📦 Installing Alembic...")
-        return run_command(f"{sys.executable} -m pip install alembic", "Alembic installation")
+        return run_command([sys.executable, '-m', 'pip', 'install', 'alembic'], "Alembic installation")
 
 def init_migrations():
     """Initialize migrations for the first time"""
@@ -44,7 +46,7 @@ def init_migrations():
         return False
     
     # Run the setup script
-    return run_command(f"{sys.executable} setup_migrations.py", "Migration setup")
+    return run_command([sys.executable, 'setup_migrations.py'], "Migration setup")
 
 def create_migration(message):
     """Create a new migration"""
@@ -52,13 +54,13 @@ def create_migration(message):
         message = input("Enter migration description: ")
     
     return run_command(
-        f"alembic revision --autogenerate -m \"{message}\"", 
+        ALEMBIC + ['revision', '--autogenerate', '-m', message],
         f"Creating migration: {message}"
     )
 
 def upgrade_database():
     """Upgrade database to latest migration"""
-    return run_command("alembic upgrade head", "Database upgrade")
+    return run_command(ALEMBIC + ['upgrade', 'head'], "Database upgrade")
 
 def downgrade_database(revision="base"):
     """Downgrade database to specific revision"""
@@ -67,18 +69,34 @@ def downgrade_database(revision="base"):
         print("Cancelled.")
         return True
     
-    return run_command(f"alembic downgrade {revision}", f"Database downgrade to {revision}")
+    return run_command(ALEMBIC + ['downgrade', revision], f"Database downgrade to {revision}")
 
 def migration_status():
     """Show current migration status"""
     print("📊 Migration Status:")
-    run_command("alembic current", "Current revision")
-    run_command("alembic heads", "Latest available revision")
-    run_command("alembic history", "Migration history")
+    try:
+        from alembic import command
+        from alembic.config import Config
+    except ImportError:
+        run_command(ALEMBIC + ['current'], "Current revision")
+        run_command(ALEMBIC + ['heads'], "Latest available revision")
+        run_command(ALEMBIC + ['history'], "Migration history")
+        return
+    
+    # One in-process Alembic config instead of three interpreter start-ups
+    cfg = Config('alembic.ini')
+    for step, description in ((command.current, "Current revision"),
+                              (command.heads, "Latest available revision"),
+                              (command.history, "Migration history")):
+        print(f"🔄 {description}...")
+        try:
+            step(cfg)
+        except Exception as e:
+            print(f"❌ {description} failed: {e}")
 
 def quick_fix():
     """Quick fix for the spotify_id issue"""
-    return run_command(f"{sys.executable} migrate.py", "Quick fix for spotify_id column")
+    return run_command([sys.executable, 'migrate.py'], "Quick fix for spotify_id column")
 
 def main():
     parser = argparse.ArgumentParser(description="Prism Analytics Engine - Database Migration CLI")
@@ -7,61 +7,176 @@ This is the main entry point for the ISRC-based lead generation system.
 Includes comprehensive startup validation and graceful error handling.
 """
 
+import functools
 import os
 import sys
-import logging
-import signal
-import traceback
 from pathlib import Path
 
+# Checked before any project import; the config dataclasses need Python 3.10+
+_PY_OK = sys.version_info >= (3, 10)
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-def setup_logging():
-    """Setup logging configuration"""
+# Project modules imported on first use, so commands such as `run.py help`
+# never load SQLAlchemy, Flask or the API clients
+_MODULES = {}
+
+def _lazy(name):
+    """Import a module once and return the cached handle on later calls"""
+    module = _MODULES.get(name)
+    if module is None:
+        import importlib
+        module = _MODULES[name] = importlib.import_module(name)
+    return module
+
+# Working directories the app writes to; created once per process
+_RUNTIME_DIRS = ('data', 'logs', 'exports')
+_DIRS_READY = False
+
+def _ensure_dirs():
+    """Create the runtime directories on first call; later calls are no-ops"""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for directory in _RUNTIME_DIRS:
+        Path(directory).mkdir(exist_ok=True)
+    _DIRS_READY = True
+
+# Background thread that drains queued log records to the file handler
+_log_listener = None
+
+def _start_log_listener(queue_handler, handlers):
+    """Give queue_handler a fresh queue drained by a listener thread owned by this process"""
+    global _log_listener
+    import atexit
+    import queue
+    from logging.handlers import QueueListener
+    
+    if _log_listener is not None:
+        # Forked child: the parent's thread didn't come along, and its queue
+        # may hold the parent's records or a lock taken mid-operation
+        atexit.unregister(_log_listener.stop)
+    
+    queue_handler.queue = queue.SimpleQueue()
+    _log_listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+def _queue_file_logging(logger):
+    """Move the logger's file handlers behind a QueueHandler so callers never block on disk I/O"""
+    import logging
+    from logging.handlers import QueueHandler
+    
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    if not file_handlers or _log_listener is not None:
+        return
+    
+    for handler in file_handlers:
+        logger.removeHandler(handler)
+    queue_handler = QueueHandler(None)  # queue set by _start_log_listener()
+    logger.addHandler(queue_handler)
+    _start_log_listener(queue_handler, file_handlers)
+    
+    # Threads don't survive fork(), so Gunicorn --preload workers would keep
+    # queueing records nobody writes; each child starts its own listener
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=lambda: _start_log_listener(queue_handler, file_handlers))
+
+def setup_logging_minimal():
+    """Console-only logging for short-lived commands such as `run.py test`"""
+    import logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+    )
+    return logging.getLogger('precise_digital')
+
+def setup_logging_full():
+    """Setup logging configuration for the server (console + rotating file)"""
     try:
         # Ensure logs directory exists
-        os.makedirs('logs', exist_ok=True)
+        _ensure_dirs()
         
         # Import logging config
-        from config.settings import LOGGING_CONFIG
-        import logging.config
+        LOGGING_CONFIG = _lazy('config.settings').LOGGING_CONFIG
         
+        import logging.config
         logging.config.dictConfig(LOGGING_CONFIG)
         logger = logging.getLogger('precise_digital')
+        _queue_file_logging(logger)
         logger.info("🎵 Prism Analytics Engine - Logging initialized")
         return logger
         
     except Exception as e:
         # Fallback to basic logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
-        )
-        logger = logging.getLogger('precise_digital')
+        logger = setup_logging_minimal()
         logger.warning(f"Failed to setup advanced logging: {e}")
         return logger
 
+# Short-lived cache for startup probes so quick restarts (and the reloader)
+# don't repeat them; keyed on the environment the probes depend on
+_PROBE_CACHE = Path('logs/.availability_cache.json')
+_PROBE_CACHE_TTL = 60
+_PROBE_ENV_KEYS = (
+    'DATABASE_URL', 'SPOTIFY_CLIENT_ID', 'SPOTIFY_CLIENT_SECRET',
+    'YOUTUBE_API_KEY', 'LASTFM_API_KEY'
+)
+
+def _cached_probe(name, probe):
+    """Return probe()'s result, reusing a cached copy younger than the TTL"""
+    import hashlib
+    import json
+    import time
+    
+    env_key = hashlib.sha256(
+        '\0'.join(os.getenv(key, '') for key in _PROBE_ENV_KEYS).encode('utf-8')
+    ).hexdigest()
+    
+    try:
+        cache = json.loads(_PROBE_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    
+    entry = cache.get(name)
+    if entry and entry.get('env') == env_key and time.time() - entry.get('written', 0) < _PROBE_CACHE_TTL:
+        return entry['value']
+    
+    value = probe()
+    cache[name] = {'env': env_key, 'written': time.time(), 'value': value}
+    try:
+        _ensure_dirs()
+        _PROBE_CACHE.write_text(json.dumps(cache, default=str))
+    except OSError:
+        pass
+    return value
+
 def validate_environment():
     """Validate environment and configuration"""
     print("🔍 Validating environment...")
     
     try:
-        # Test critical imports
-        from config.settings import settings
-        from config.database import init_db
-        from src.utils.startup_validation import validate_startup_configuration
+        settings = _lazy('config.settings').settings
+        validate_startup_configuration = _lazy('src.utils.startup_validation').validate_startup_configuration
         
         # Run startup validation
-        validation_passed = validate_startup_configuration()
+        validation_passed = validate_startup_configuration(verify_clients=_verify_requested())
         
         if not validation_passed:
             print("⚠️  Some validation checks failed, but application can still run")
             print("   Check the validation output above for details")
         
-        # Validate configuration
-        config_status = settings.validate_configuration()
+        # Validate configuration (only the fields reported below are cached,
+        # so the database URL never lands on disk)
+        def probe_configuration():
+            status = settings.validate_configuration()
+            return {
+                'database': {'accessible': status['database']['accessible']},
+                'apis': {name: {'configured': api['configured']} for name, api in status['apis'].items()}
+            }
+        
+        config_status = _cached_probe('configuration', probe_configuration)
         
         print("\n📊 Configuration Status:")
         print(f"  Database: {'✅ Connected' if config_status['database']['accessible'] else '❌ Not accessible'}")
@@ -71,34 +186,84 @@ def validate_environment():
             print(f"  {api_name.title()}: {icon}{'Configured' if api_status['configured'] else 'Not configured'}")
         
         # Create required directories
-        for directory in ['data', 'logs', 'exports']:
-            os.makedirs(directory, exist_ok=True)
+        _ensure_dirs()
         
         return True
         
     except Exception as e:
         print(f"❌ Environment validation failed: {e}")
+        import traceback
         traceback.print_exc()
         return False
 
-def initialize_database():
+# Written after a successful init_db() on SQLite; holds a hash of the database URL
+_DB_SENTINEL = Path('data/.db_initialized')
+
+def _sqlite_path(database_url: str):
+    """Path of a file-backed SQLite database URL, else None"""
+    prefix = 'sqlite:///'
+    if not database_url.startswith(prefix) or database_url == prefix + ':memory:':
+        return None
+    return Path(database_url[len(prefix):])
+
+def _url_digest(database_url: str) -> str:
+    import hashlib
+    return hashlib.sha256(database_url.encode('utf-8')).hexdigest()
+
+@functools.lru_cache(maxsize=1)
+def _db_ready(database_url: str) -> bool:
+    """
+    True if this SQLite database was already initialized with the current models
+    
+    The sentinel must name the same URL and be newer than config/database.py,
+    so schema changes still trigger init_db(), and the database file itself
+    must still exist. Server databases always run init_db(): a local file
+    can't tell whether the server behind the URL is a fresh one. Stats run
+    once per process.
+    """
+    db_path = _sqlite_path(database_url)
+    if db_path is None or not db_path.is_file():
+        return False
+    try:
+        sentinel = _DB_SENTINEL.stat()
+        models = (project_root / 'config' / 'database.py').stat()
+        return sentinel.st_mtime >= models.st_mtime and _DB_SENTINEL.read_text() == _url_digest(database_url)
+    except OSError:
+        return False
+
+def initialize_database(settings):
     """Initialize database with proper error handling"""
     print("\n🗄️  Initializing database...")
     
+    database_url = settings.get_database_url()
+    if _db_ready(database_url):
+        print("✅ Database already initialized")
+        return True
+    
     try:
-        from config.database import init_db
-        db_manager = init_db()
+        _lazy('config.database').init_db()
+        if _sqlite_path(database_url) is not None:
+            _ensure_dirs()
+            _DB_SENTINEL.write_text(_url_digest(database_url))
         print("✅ Database initialized successfully")
-        return db_manager
+        return True
         
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
         print("   Make sure you have write permissions in the data directory")
+        import traceback
         traceback.print_exc()
-        return None
+        return False
 
 def setup_signal_handlers(app=None):
     """Setup graceful shutdown signal handlers"""
+    import signal
+    import threading
+    
+    # signal.signal() raises ValueError outside the main thread
+    if threading.current_thread() is not threading.main_thread():
+        return
+    
     def signal_handler(signum, frame):
         print(f"\n🛑 Received signal {signum}, shutting down gracefully...")
         
@@ -115,11 +280,10 @@ def setup_signal_handlers(app=None):
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-def create_app():
+def create_app(settings):
     """Create and configure Flask application"""
     try:
-        from src.api.routes import app
-        from config.settings import settings
+        app = _lazy('src.api.routes').app
         
         # Additional app configuration
         app.config.update({
@@ -134,12 +298,12 @@ def create_app():
         
     except Exception as e:
         print(f"❌ Failed to create Flask app: {e}")
+        import traceback
         traceback.print_exc()
         return None
 
-def print_startup_banner():
-    """Print startup banner with Prism branding"""
-    banner = """
+# Startup banner, written in a single call
+_BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║    ██████╗ ██████╗ ██╗███████╗███╗   ███╗                   ║
@@ -153,88 +317,161 @@ def print_startup_banner():
 ║         Transforming Music Data into Actionable Insights    ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
+
 """
-    print(banner)
 
-def print_api_status():
-    """Print API integration status"""
+def _interactive_output():
+    """True when cosmetic startup output has a reader (a TTY, or PRISM_VERBOSE is set)"""
+    return sys.stdout.isatty() or bool(os.getenv('PRISM_VERBOSE'))
+
+def print_startup_banner():
+    """Print startup banner with Prism branding"""
+    if not _interactive_output():
+        return
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
+
+# (display name, API key, description, priority, label when unconfigured, setup hint)
+_INTEGRATIONS = (
+    ('MusicBrainz', 'musicbrainz', 'Music metadata', 'Essential', None, None),
+    ('Spotify', 'spotify', 'Streaming data', 'High', 'Needs API keys',
+     'Set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET environment variables'),
+    ('YouTube', 'youtube', 'Video analytics', 'Medium', 'Needs API key',
+     'Set YOUTUBE_API_KEY environment variable'),
+    ('Last.fm', 'lastfm', 'Social listening', 'Low', 'Optional', None),
+)
+
+def _verify_requested():
+    """True when startup should probe the API clients (--verify or PDL_VERIFY_STARTUP)"""
+    return '--verify' in sys.argv or bool(os.getenv('PDL_VERIFY_STARTUP'))
+
+def print_api_status(settings):
+    """Print API integration status (skipped, with its live probes, when not interactive)"""
+    if not _interactive_output():
+        import logging
+        logging.getLogger('precise_digital').info(
+            "API configuration: %s",
+            ', '.join(f"{key}={'on' if configured else 'off'}" for key, configured in settings.api_configured.items())
+        )
+        return
     try:
-        from src.integrations.base_client import check_client_availability
-        from config.settings import settings
-        
-        availability = check_client_availability()
-        
-        print("\n🔌 API Integration Status:")
-        integrations = {
-            'MusicBrainz': {
-                'available': availability['musicbrainz'],
-                'description': 'Music metadata (always available)',
-                'priority': 'Essential'
-            },
-            'Spotify': {
-                'available': availability['spotify'],
-                'description': f"Streaming data ({'Configured' if settings.spotify_client_id else 'Needs API keys'})",
-                'priority': 'High'
-            },
-            'YouTube': {
-                'available': availability['youtube'],
-                'description': f"Video analytics ({'Configured' if settings.apis['youtube'].api_key else 'Needs API key'})",
-                'priority': 'Medium'
-            },
-            'Last.fm': {
-                'available': availability['lastfm'],
-                'description': f"Social listening ({'Configured' if settings.apis['lastfm'].api_key else 'Optional'})",
-                'priority': 'Low'
-            }
-        }
-        
-        for name, info in integrations.items():
-            status = "✅ Active" if info['available'] else "❌ Inactive"
-            print(f"  {name:12} {status:12} - {info['description']}")
+        if _verify_requested():
+            check_client_availability = _lazy('src.integrations.base_client').check_client_availability
+            availability = _cached_probe('clients', check_client_availability)
+            lines = ["\n🔌 API Integration Status:"]
+        else:
+            # Configuration only: the client modules (spotipy, Google API client)
+            # are not imported and nothing is probed
+            availability = settings.api_configured
+            lines = ["\n🔌 API Integration Status (configuration only; --verify to probe clients):"]
+        hints = []
+        has_missing = False
+        for name, key, description, priority, unconfigured, hint in _INTEGRATIONS:
+            available = availability[key]
+            if unconfigured is None:
+                detail = 'always available'
+            elif settings.api_configured[key]:
+                detail = 'Configured'
+            else:
+                detail = unconfigured
+                if hint:
+                    hints.append(hint)
+            if not available and priority != 'Low':
+                has_missing = True
+            lines.append(f"  {name:12} {'✅ Active' if available else '❌ Inactive':12} - {description} ({detail})")
         
         # Show configuration instructions for missing APIs
-        missing_apis = [name for name, info in integrations.items() if not info['available'] and info['priority'] != 'Low']
-        if missing_apis:
-            print(f"\n⚠️  Configure missing APIs for full functionality:")
-            if not settings.spotify_client_id:
-                print(f"   Set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET environment variables")
-            if not settings.apis['youtube'].api_key:
-                print(f"   Set YOUTUBE_API_KEY environment variable")
+        if has_missing:
+            lines.append("\n⚠️  Configure missing APIs for full functionality:")
+            lines.extend(f"   {hint}" for hint in hints)
+        
+        # One write for the whole block
+        sys.stdout.write("\n".join(lines) + "\n")
     
     except Exception as e:
         print(f"Error checking API status: {e}")
 
-def print_startup_info():
+def print_startup_info(host, port, debug, db_url):
     """Print startup information"""
-    from config.settings import settings
-    
+    if not _interactive_output():
+        import logging
+        logging.getLogger('precise_digital').info(
+            "Starting on %s:%s (%s)", host, port, 'Development' if debug else 'Production'
+        )
+        return
+    base_url = f"http://{host}:{port}"
     print(f"\n🚀 Starting Prism Analytics Engine...")
-    print(f"   Environment: {'Development' if settings.app.debug else 'Production'}")
-    print(f"   Host: {settings.app.host}")
-    print(f"   Port: {settings.app.port}")
-    print(f"   Database: {settings.database.url}")
+    print(f"   Environment: {'Development' if debug else 'Production'}")
+    print(f"   Host: {host}")
+    print(f"   Port: {port}")
+    print(f"   Database: {db_url}")
     
-    if settings.app.debug:
+    if debug:
         print(f"   Debug Mode: Enabled")
         print(f"   Auto-reload: Enabled")
     
     print(f"\n📋 Available Endpoints:")
-    print(f"   Health Check: http://{settings.app.host}:{settings.app.port}/api/health")
-    print(f"   API Status:   http://{settings.app.host}:{settings.app.port}/api/status")
-    print(f"   ISRC Analyze: http://{settings.app.host}:{settings.app.port}/api/analyze-isrc")
-    print(f"   Leads:        http://{settings.app.host}:{settings.app.port}/api/leads")
+    print(f"   Health Check: {base_url}/api/health")
+    print(f"   API Status:   {base_url}/api/status")
+    print(f"   ISRC Analyze: {base_url}/api/analyze-isrc")
+    print(f"   Leads:        {base_url}/api/leads")
 
-def run_development_server():
-    """Run the development server"""
-    from config.settings import settings
+def _worker_tmp_dir():
+    """Directory for Gunicorn worker heartbeat files: RAM-backed /dev/shm when present"""
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    import tempfile
+    return tempfile.gettempdir()
+
+def load_app():
+    """Application factory for Gunicorn workers (`run:load_app()`)"""
+    return create_app(_lazy('config.settings').settings)
+
+def _run_gunicorn_dev_server(host, port):
+    """
+    Serve through one reloading Gunicorn worker where fork() is available
+    
+    Only the worker re-imports on code changes; this process keeps its
+    completed startup checks. Returns False if Gunicorn can't be used.
+    """
+    if not hasattr(os, 'fork'):
+        return False
+    try:
+        import gunicorn.app.wsgiapp as wsgi
+    except ImportError:
+        return False
+    
+    print(f"\n🎵 Prism Analytics Engine is running! (Gunicorn, auto-reload)")
+    print(f"   Access the API at: http://{host}:{port}")
+    print(f"   Press Ctrl+C to stop the server")
     
+    sys.argv = [
+        'gunicorn',
+        '--bind', f'{host}:{port}',
+        '--workers', '1',
+        '--worker-class', 'gthread',
+        '--threads', '8',
+        '--reload',
+        '--timeout', '120',
+        '--worker-tmp-dir', _worker_tmp_dir(),
+        'run:load_app()'
+    ]
+    
+    wsgi.run()
+    return True
+
+def run_development_server(settings, host, port, debug):
+    """Run the development server"""
     try:
-        app = create_app()
+        if debug and _run_gunicorn_dev_server(host, port):
+            return True
+        
+        app = create_app(settings)
         if not app:
             return False
         
         print(f"\n🎵 Prism Analytics Engine is running!")
-        print(f"   Access the API at: http://{settings.app.host}:{settings.app.port}")
+        print(f"   Access the API at: http://{host}:{port}")
         print(f"   Press Ctrl+C to stop the server")
         
         # Setup signal handlers
@@ -242,10 +479,10 @@ def run_development_server():
         
         # Run the Flask development server
         app.run(
-            host=settings.app.host,
-            port=settings.app.port,
-            debug=settings.app.debug,
-            use_reloader=settings.app.debug,
+            host=host,
+            port=port,
+            debug=debug,
+            use_reloader=debug,
             threaded=True
         )
         
@@ -253,30 +490,35 @@ def run_development_server():
         
     except Exception as e:
         print(f"❌ Failed to start development server: {e}")
+        import traceback
         traceback.print_exc()
         return False
 
-def run_production_server():
-    """Run the production server (using Gunicorn if available)"""
-    from config.settings import settings
-    
+def run_production_server(settings, host, port):
+    """Run the production server (Gunicorn, else Waitress, else the Flask dev server)"""
     try:
         # Try to use Gunicorn for production
         import gunicorn.app.wsgiapp as wsgi
         
-        app = create_app()
+        app = create_app(settings)
         if not app:
             return False
         
         print(f"\n🎵 Starting Prism Analytics Engine (Production Mode)")
         
-        # Gunicorn configuration
+        # Gunicorn configuration: threaded workers, since bulk ISRC processing
+        # mostly waits on external APIs
+        workers = os.getenv('WORKERS', '4')
+        threads = os.getenv('THREADS', '8')
+        
         sys.argv = [
             'gunicorn',
-            '--bind', f'{settings.app.host}:{settings.app.port}',
-            '--workers', '4',
-            '--worker-class', 'sync',
+            '--bind', f'{host}:{port}',
+            '--workers', workers,
+            '--worker-class', 'gthread',
+            '--threads', threads,
             '--timeout', '120',
+            '--worker-tmp-dir', _worker_tmp_dir(),
             '--keep-alive', '2',
             '--max-requests', '1000',
             '--max-requests-jitter', '100',
@@ -288,21 +530,52 @@ def run_production_server():
         return True
         
     except ImportError:
-        print("⚠️  Gunicorn not available, falling back to development server")
-        return run_development_server()
+        pass
+    except Exception as e:
+        print(f"❌ Failed to start production server: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    # No Gunicorn (e.g. on Windows): Waitress is a pure-Python production server
+    try:
+        from waitress import serve
+    except ImportError:
+        print("⚠️  Gunicorn and Waitress not available, falling back to development server")
+        return run_development_server(settings, host, port, False)
+    
+    try:
+        app = create_app(settings)
+        if not app:
+            return False
+        
+        print(f"\n🎵 Starting Prism Analytics Engine (Production Mode, Waitress)")
+        serve(app, host=host, port=port, threads=int(os.getenv('THREADS', '8')), connection_limit=256)
+        return True
+        
     except Exception as e:
         print(f"❌ Failed to start production server: {e}")
+        import traceback
         traceback.print_exc()
         return False
 
 def main():
     """Main entry point"""
     try:
+        # Werkzeug's reloader re-executes this script in a child process; the
+        # parent has already validated, initialized and reported, so only the
+        # server needs to come up here
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            settings = _lazy('config.settings').settings
+            setup_logging_full()
+            app = settings.app
+            return 0 if run_development_server(settings, app.host, app.port, app.debug) else 1
+        
         # Print startup banner
         print_startup_banner()
         
         # Setup logging
-        logger = setup_logging()
+        logger = setup_logging_full()
         logger.info("Starting Precise Digital Lead Generation Tool")
         
         # Validate environment
@@ -310,24 +583,26 @@ def main():
             print("❌ Environment validation failed. Exiting.")
             return 1
         
+        # Settings are resolved once here and handed to the helpers below
+        settings = _lazy('config.settings').settings
+        host, port, debug = settings.app.host, settings.app.port, settings.app.debug
+        
         # Initialize database
-        if not initialize_database():
+        if not initialize_database(settings):
             print("❌ Database initialization failed. Exiting.")
             return 1
         
         # Print API status
-        print_api_status()
+        print_api_status(settings)
         
         # Print startup info
-        print_startup_info()
+        print_startup_info(host, port, debug, settings.database.url)
         
         # Determine if we're in production or development
-        from config.settings import settings
-        
-        if settings.app.debug:
-            success = run_development_server()
+        if debug:
+            success = run_development_server(settings, host, port, debug)
         else:
-            success = run_production_server()
+            success = run_production_server(settings, host, port)
         
         if not success:
             logger.error("Failed to start server")
@@ -340,18 +615,20 @@ def main():
         return 0
     except Exception as e:
         print(f"\n❌ Startup failed: {e}")
+        import traceback
         traceback.print_exc()
         return 1
 
 def test_mode():
     """Run in test mode for debugging"""
     print("🧪 Running Prism Analytics Engine in Test Mode\n")
+    setup_logging_minimal()
     
     # Test imports
     try:
-        from src.core.pipeline import LeadAggregationPipeline
-        from src.core.rate_limiter import RateLimitManager
-        from src.utils.validators import validate_isrc
+        LeadAggregationPipeline = _lazy('src.core.pipeline').LeadAggregationPipeline
+        RateLimitManager = _lazy('src.core.rate_limiter').RateLimitManager
+        validate_isrc = _lazy('src.utils.validators').validate_isrc
         
         print("✅ Core imports successful")
         
@@ -360,14 +637,23 @@ def test_mode():
         is_valid, result = validate_isrc(test_isrc)
         print(f"✅ ISRC validation test: {test_isrc} -> {'Valid' if is_valid else 'Invalid'}")
         
+        # Microbenchmark the validator hot loop
+        import time
+        iterations = 100_000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validate_isrc(test_isrc)
+        elapsed = time.perf_counter() - start
+        print(f"✅ ISRC validation benchmark: {iterations:,} calls in {elapsed:.3f}s "
+              f"({elapsed / iterations * 1e6:.2f}µs/call)")
+        
         # Test rate limiter
         rate_limiter = RateLimitManager()
         status = rate_limiter.get_rate_limit_status()
         print(f"✅ Rate limiter test: {len(status)} APIs configured")
         
         # Test database
-        from config.database import init_db
-        db_manager = init_db()
+        db_manager = _lazy('config.database').init_db()
         print("✅ Database test successful")
         
         # Test pipeline initialization
@@ -381,32 +667,41 @@ def test_mode():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
+        import traceback
         traceback.print_exc()
         return 1
 
+def _cmd_help():
+    """Print command line usage"""
+    print("Prism Analytics Engine - Precise Digital Lead Generation Tool")
+    print()
+    print("Usage:")
+    print("  python run.py          Start the application")
+    print("  python run.py --verify Start after probing every API client")
+    print("  python run.py test     Run in test mode")
+    print("  python run.py help     Show this help message")
+    print()
+    print("Environment Variables:")
+    print("  SPOTIFY_CLIENT_ID      Spotify API client ID")
+    print("  SPOTIFY_CLIENT_SECRET  Spotify API client secret")
+    print("  YOUTUBE_API_KEY        YouTube Data API key")
+    print("  LASTFM_API_KEY         Last.fm API key (optional)")
+    print("  DATABASE_URL           Database connection URL")
+    print("  FLASK_DEBUG            Enable debug mode with auto-reload (true/false)")
+    print("  PORT                   Server port (default: 5000)")
+    print("  PRISM_VERBOSE          Print banner/API status even without a terminal")
+    print("  PDL_VERIFY_STARTUP     Probe API clients at startup (same as --verify)")
+    print()
+    return 0
+
+# Command dispatch; each handler does its own imports so `help` stays cheap
+_COMMANDS = {
+    'test': test_mode, '--test': test_mode, '-t': test_mode,
+    'help': _cmd_help, '--help': _cmd_help, '-h': _cmd_help,
+}
+
 if __name__ == "__main__":
-    # Check for command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['test', '--test', '-t']:
-            sys.exit(test_mode())
-        elif sys.argv[1] in ['help', '--help', '-h']:
-            print("Prism Analytics Engine - Precise Digital Lead Generation Tool")
-            print()
-            print("Usage:")
-            print("  python run.py          Start the application")
-            print("  python run.py test     Run in test mode")
-            print("  python run.py help     Show this help message")
-            print()
-            print("Environment Variables:")
-            print("  SPOTIFY_CLIENT_ID      Spotify API client ID")
-            print("  SPOTIFY_CLIENT_SECRET  Spotify API client secret")
-            print("  YOUTUBE_API_KEY        YouTube Data API key")
-            print("  LASTFM_API_KEY         Last.fm API key (optional)")
-            print("  DATABASE_URL           Database connection URL")
-            print("  FLASK_DEBUG            Enable debug mode (true/false)")
-            print("  PORT                   Server port (default: 5000)")
-            print()
-            sys.exit(0)
-    
-    # Run the main application
-    sys.exit(main())
\ No newline at end of file
+    if not _PY_OK:
+        sys.exit("❌ Python 3.10 or higher is required")
+    command = _COMMANDS.get(sys.argv[1], main) if len(sys.argv) > 1 else main
+    sys.exit(command())
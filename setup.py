@@ -6,15 +6,57 @@ Run this to set up the environment completely
 
 import os
 import sys
+import shutil
 import subprocess
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Tuple
+
+# (environment variable, Env attribute, required)
+_API_KEYS = (
+    ('SPOTIFY_CLIENT_ID', 'spotify_client_id', True),
+    ('SPOTIFY_CLIENT_SECRET', 'spotify_client_secret', True),
+    ('YOUTUBE_API_KEY', 'youtube_api_key', False),
+    ('LASTFM_API_KEY', 'lastfm_api_key', False),
+)
+
+def _env(key):
+    return field(default_factory=lambda: os.environ.get(key, ''))
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """API keys read once from the environment, with presence checked up front"""
+    spotify_client_id: str = _env('SPOTIFY_CLIENT_ID')
+    spotify_client_secret: str = _env('SPOTIFY_CLIENT_SECRET')
+    youtube_api_key: str = _env('YOUTUBE_API_KEY')
+    lastfm_api_key: str = _env('LASTFM_API_KEY')
+    missing_required: Tuple[str, ...] = field(init=False)
+    missing_optional: Tuple[str, ...] = field(init=False)
+    
+    def __post_init__(self):
+        # Single pass over the keys, partitioning the missing ones
+        missing = {True: [], False: []}
+        for key, attr, required in _API_KEYS:
+            if not getattr(self, attr):
+                missing[required].append(key)
+        object.__setattr__(self, 'missing_required', tuple(missing[True]))
+        object.__setattr__(self, 'missing_optional', tuple(missing[False]))
+
+ENV = Env()
 
 def install_dependencies():
     """Install all required dependencies"""
     print("📦 Installing dependencies...")
     
+    # uv resolves and installs much faster than pip when it's on PATH
+    uv = shutil.which("uv")
+    if uv:
+        command = [uv, "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+    else:
+        command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+    
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        subprocess.check_call(command)
         print("✅ Dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -26,10 +68,7 @@ def initialize_database():
     print("📊 Initializing database...")
     
     try:
-        # Ensure data directory exists
-        os.makedirs('data', exist_ok=True)
-        
-        # Import after dependencies are installed
+        # Import after dependencies are installed (init_db creates data/ for SQLite)
         from config.database import init_db, check_youtube_migration_needed, migrate_youtube_fields
         
         # Initialize basic database
@@ -53,12 +92,7 @@ def validate_api_keys():
     """Check if API keys are configured"""
     print("🔐 Checking API configuration...")
     
-    missing_keys = []
-    
-    if not os.getenv('SPOTIFY_CLIENT_ID'):
-        missing_keys.append('SPOTIFY_CLIENT_ID')
-    if not os.getenv('SPOTIFY_CLIENT_SECRET'):
-        missing_keys.append('SPOTIFY_CLIENT_SECRET')
+    missing_keys = ENV.missing_required
     
     if missing_keys:
         print("⚠️  Missing required API keys:")
@@ -69,11 +103,7 @@ def validate_api_keys():
     
     print("✅ Required API keys configured!")
     
-    optional_keys = []
-    if not os.getenv('YOUTUBE_API_KEY'):
-        optional_keys.append('YOUTUBE_API_KEY')
-    if not os.getenv('LASTFM_API_KEY'):
-        optional_keys.append('LASTFM_API_KEY')
+    optional_keys = ENV.missing_optional
     
     if optional_keys:
         print("📝 Optional API keys not configured:")
@@ -8,25 +8,92 @@ and full YouTube integration capabilities.
 """
 
 import os
+import json
 import time
 import logging
+import threading
+import functools
 import csv
 import io
+import tempfile
+import orjson
+import hashlib
+import gzip
+import uuid
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, request, jsonify, send_file
+from types import MappingProxyType
+from flask import Flask, Response, g, request, jsonify, send_file, stream_with_context, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
-from typing import Optional, Dict, Any, List
+from cachetools import TTLCache
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Mapping, Tuple
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import text
+from sqlalchemy import text, func, select, bindparam, cast, and_, Text
+from sqlalchemy.orm import load_only, selectinload, raiseload
+from sqlalchemy.engine import make_url
+from pydantic import ValidationError
 
 # Import core components
 from src.core.rate_limiter import rate_limiter, get_rate_limits
-from src.core.pipeline import LeadAggregationPipeline
-from src.utils.validators import validate_isrc
-from config.database import db_manager, Artist, Track, ContactAttempt, OutreachLog, ProcessingLog
+from src.utils.validators import validate_isrc, validate_isrc_batch, OutreachUpdate
+from config.database import db_manager, Artist, Track, OutreachLog
 from config.settings import settings
 
+if TYPE_CHECKING:
+    from src.core.pipeline import LeadAggregationPipeline
+
+# Settings are immutable, so integration flags are resolved once per process
+_YT_ENABLED = settings.is_api_configured('youtube')
+_YT_API_STATUS = 'available' if _YT_ENABLED else 'not_configured'
+
+# Cache check for /api/analyze-isrc, built once so only parameter binding
+# happens per request; projects just the columns the check reads
+_TRACK_BY_ISRC = (
+    select(Track.artist_id, Track.updated_at)
+    .where(Track.isrc == bindparam('isrc'))
+    .limit(1)
+)
+
+# In-process front for the same check: sha256(isrc) -> (artist_id, updated_at).
+# Per worker only; a shared store (e.g. Redis) could use the same keys.
+CACHE_FRESHNESS_SECONDS = 86400  # 24 hours
+_isrc_cache = TTLCache(maxsize=10_000, ttl=CACHE_FRESHNESS_SECONDS)
+_isrc_cache_lock = threading.RLock()
+
+def _isrc_cache_key(isrc: str) -> bytes:
+    return hashlib.sha256(isrc.encode()).digest()
+
+class _AccessFrequency:
+    """Per-key access counts over a few rolling time buckets"""
+    
+    def __init__(self, buckets: int = 5, bucket_seconds: int = 60):
+        self.buckets = buckets
+        self.bucket_seconds = bucket_seconds
+        self._counts = deque(maxlen=buckets)  # (bucket number, Counter)
+        self._lock = threading.Lock()
+    
+    def hit(self, key) -> int:
+        """Record one access and return the key's count across the window"""
+        bucket = int(time.time() // self.bucket_seconds)
+        with self._lock:
+            if not self._counts or self._counts[-1][0] != bucket:
+                self._counts.append((bucket, Counter()))
+            self._counts[-1][1][key] += 1
+            oldest = bucket - self.buckets + 1
+            return sum(counts[key] for number, counts in self._counts if number >= oldest)
+
+# /api/leads?search= responses are cached briefly, but only once a query has
+# been repeated SEARCH_CACHE_ADMIT_HITS times in the last 5 minutes, so
+# one-off searches don't evict the popular ones. Entries are (etag, body) so
+# cache hits revalidate like the uncached path.
+SEARCH_CACHE_ADMIT_HITS = 3
+_search_frequency = _AccessFrequency()
+_search_cache = TTLCache(maxsize=512, ttl=30)
+_search_cache_lock = threading.RLock()
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -64,16 +131,92 @@ app.config.update({
     'SECRET_KEY': os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production'),
     'MAX_CONTENT_LENGTH': 16 * 1024 * 1024,  # 16MB max file size
     'JSON_SORT_KEYS': False,
-    'JSONIFY_PRETTYPRINT_REGULAR': True
+    'JSONIFY_PRETTYPRINT_REGULAR': False
 })
 
+def _dumps(obj) -> bytes:
+    """Compact orjson encoding; datetimes serialize natively (ISO 8601)"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+def _ojson(obj, status: int = 200) -> Response:
+    """jsonify() replacement for the large responses"""
+    return Response(_dumps(obj), status=status, mimetype='application/json')
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Routes jsonify() and app.json.dumps() through orjson; parsing stays stdlib"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return _dumps(obj).decode('utf-8')
+    
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_dumps(obj), mimetype=self.mimetype)
+
+app.json = OrjsonProvider(app)
+
 # Initialize services
-try:
-    pipeline = LeadAggregationPipeline(rate_limiter)
-    logger.info("✅ Pipeline initialized successfully")
-except Exception as e:
-    logger.error(f"❌ Pipeline initialization failed: {e}")
-    pipeline = None
+# The pipeline (scoring engine plus its own database engine) is built on first
+# use rather than at import, so the server can bind and answer health checks
+# before it exists. The pipeline module (scoring engine, integration clients)
+# is only imported then too.
+_pipeline: Optional['LeadAggregationPipeline'] = None
+_pipeline_lock = threading.Lock()
+
+def get_pipeline() -> Optional['LeadAggregationPipeline']:
+    """Return the shared pipeline, creating it on first call (None if that fails)"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                try:
+                    from src.core.pipeline import LeadAggregationPipeline
+                    _pipeline = LeadAggregationPipeline(rate_limiter)
+                    logger.info("✅ Pipeline initialized successfully")
+                except Exception as e:
+                    logger.error(f"❌ Pipeline initialization failed: {e}")
+    return _pipeline
+
+# Enhanced track metadata fans out to MusicBrainz, Spotify, Discogs, Last.fm
+# and the lyrics APIs, so results are kept per cleaned ISRC for the same
+# window as _isrc_cache. The collector holds only API configuration and is
+# shared.
+_track_metadata_cache = TTLCache(maxsize=10_000, ttl=CACHE_FRESHNESS_SECONDS)
+_track_metadata_lock = threading.RLock()
+_enhanced_collector = None
+
+def get_track_metadata(isrc: str):
+    """Comprehensive TrackMetadata for a cleaned ISRC, served from cache when fresh"""
+    global _enhanced_collector
+    with _track_metadata_lock:
+        cached = _track_metadata_cache.get(isrc)
+        if cached is not None:
+            return cached
+        if _enhanced_collector is None:
+            from src.services.enhanced_track_metadata import EnhancedTrackMetadataCollector
+            _enhanced_collector = EnhancedTrackMetadataCollector(rate_limiter)
+    
+    # Collected outside the lock; concurrent misses for one ISRC may both fetch
+    track_metadata = _enhanced_collector.collect_comprehensive_track_data(isrc)
+    
+    # Every source fetcher returns {} on failure, so a result with no sources
+    # is an outage (or an unknown ISRC) and must not be served for a day
+    if track_metadata.data_sources:
+        with _track_metadata_lock:
+            _track_metadata_cache[isrc] = track_metadata
+    return track_metadata
+
+# One lazily opened session per request, shared by the handler's reads and
+# closed in teardown
+def get_db_session():
+    if 'db' not in g:
+        g.db = db_manager.SessionLocal()
+    return g.db
+
+@app.teardown_request
+def _close_db_session(exc):
+    session = g.pop('db', None)
+    if session is not None:
+        session.close()
 
 # Utility functions
 def safe_db_operation(operation_func, *args, **kwargs):
@@ -87,6 +230,23 @@ def safe_db_operation(operation_func, *args, **kwargs):
         logger.error(f"Unexpected error in database operation: {e}")
         raise
 
+def _json_body():
+    """Request body decoded with orjson; None when empty or not valid JSON"""
+    body = request.get_data(cache=True)
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+
+def _validation_message(error: ValidationError) -> str:
+    """One-line summary of a pydantic ValidationError for the 400 body"""
+    return '; '.join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'body'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
 def validate_request_data(data, required_fields):
     """Validate request data has required fields"""
     if not data:
@@ -126,118 +286,146 @@ def file_too_large(error):
     }), 413
 
 # ROOT WELCOME MESSAGE
+# The root and documentation bodies only vary by timestamp (integration flags
+# come from the frozen settings), so the dicts are built once and each request
+# serializes a shallow copy with the timestamp added
+_ROOT_INFO = MappingProxyType({
+    'service': 'Prism Analytics Engine',
+    'company': 'Precise Digital',
+    'tagline': 'Transforming Music Data into Actionable Insights',
+    'message': 'Welcome to the Music Industry Lead Generation API',
+    'version': '1.0.0',
+    'deployment_type': 'separate_services',
+    'api_documentation': '/api/',
+    'health_check': '/api/health',
+    'core_endpoints': {
+        'analyze_single_isrc': 'POST /api/analyze-isrc',
+        'bulk_analysis': 'POST /api/analyze-bulk',
+        'file_upload': 'POST /api/upload-isrcs',
+        'get_leads': 'GET /api/leads',
+        'export_data': 'POST /api/export',
+        'youtube_integration': 'POST /api/youtube/test'
+    },
+    'integrations': {
+        'spotify': '✅ Configured' if settings.is_api_configured('spotify') else '❌ Not configured',
+        'youtube': '✅ Configured' if settings.is_api_configured('youtube') else '❌ Not configured',
+        'lastfm': '✅ Configured' if settings.is_api_configured('lastfm') else '⚠️  Optional',
+        'musicbrainz': '✅ Always available'
+    },
+    'status': 'operational'
+})
+
+_API_DOCUMENTATION = MappingProxyType({
+    'service': 'Prism Analytics Engine API',
+    'company': 'Precise Digital',
+    'version': '1.0.0',
+    'status': 'running',
+    'deployment': 'separate_backend_service',
+    'description': 'Music industry lead generation through ISRC analysis and multi-platform data aggregation',
+    'endpoints': {
+        'health_monitoring': {
+            'health': 'GET /api/health',
+            'status': 'GET /api/status',
+            'dashboard_stats': 'GET /api/dashboard/stats'
+        },
+        'isrc_analysis': {
+            'single_isrc': 'POST /api/analyze-isrc',
+            'bulk_processing': 'POST /api/analyze-bulk',
+            'file_upload': 'POST /api/upload-isrcs'
+        },
+        'lead_management': {
+            'list_leads': 'GET /api/leads',
+            'get_artist': 'GET /api/artist/<id>',
+            'update_outreach': 'PUT /api/artist/<id>/outreach',
+            'export_leads': 'POST /api/export'
+        },
+        'youtube_integration': {
+            'test_api': 'POST /api/youtube/test',
+            'get_stats': 'GET /api/youtube/stats',
+            'get_opportunities': 'GET /api/youtube/opportunities',
+            'refresh_artist': 'POST /api/artist/<id>/youtube/refresh'
+        },
+        'api_testing': {
+            'test_musicbrainz': 'POST /api/musicbrainz/test',
+            'test_lastfm': 'POST /api/lastfm/test',
+            'rate_limits': 'GET /api/rate-limits'
+        }
+    },
+    'integrations': {
+        'musicbrainz': {'status': 'always_available', 'description': 'Free music metadata database'},
+        'spotify': {
+            'status': 'configured' if settings.is_api_configured('spotify') else 'not_configured',
+            'description': 'Music streaming platform with artist/track data'
+        },
+        'youtube': {
+            'status': 'configured' if settings.is_api_configured('youtube') else 'not_configured',
+            'description': 'Video platform with channel analytics and engagement data'
+        },
+        'lastfm': {
+            'status': 'configured' if settings.is_api_configured('lastfm') else 'optional',
+            'description': 'Social music platform with listening data'
+        }
+    },
+    'data_sources': {
+        'primary': ['MusicBrainz', 'Spotify Web API'],
+        'secondary': ['YouTube Data API', 'Last.fm API'],
+        'target_regions': ['New Zealand', 'Australia', 'Pacific Islands'],
+        'lead_scoring': ['Independence', 'Opportunity', 'Geographic']
+    }
+})
+
+def _with_timestamp(info: Mapping) -> Response:
+    return Response(_dumps({**info, 'timestamp': datetime.utcnow()}), mimetype='application/json')
+
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint with Prism Analytics Engine welcome message"""
-    return jsonify({
-        'service': 'Prism Analytics Engine',
-        'company': 'Precise Digital',
-        'tagline': 'Transforming Music Data into Actionable Insights',
-        'message': 'Welcome to the Music Industry Lead Generation API',
-        'version': '1.0.0',
-        'deployment_type': 'separate_services',
-        'api_documentation': '/api/',
-        'health_check': '/api/health',
-        'core_endpoints': {
-            'analyze_single_isrc': 'POST /api/analyze-isrc',
-            'bulk_analysis': 'POST /api/analyze-bulk',
-            'file_upload': 'POST /api/upload-isrcs',
-            'get_leads': 'GET /api/leads',
-            'export_data': 'POST /api/export',
-            'youtube_integration': 'POST /api/youtube/test'
-        },
-        'integrations': {
-            'spotify': '✅ Configured' if os.getenv('SPOTIFY_CLIENT_ID') else '❌ Not configured',
-            'youtube': '✅ Configured' if os.getenv('YOUTUBE_API_KEY') else '❌ Not configured',
-            'lastfm': '✅ Configured' if os.getenv('LASTFM_API_KEY') else '⚠️  Optional',
-            'musicbrainz': '✅ Always available'
-        },
-        'status': 'operational',
-        'timestamp': datetime.utcnow().isoformat()
-    })
+    return _with_timestamp(_ROOT_INFO)
 
 # API Documentation
 @app.route('/api/', methods=['GET'])
 def api_documentation():
     """Comprehensive API documentation and status for Prism Analytics Engine"""
-    return jsonify({
-        'service': 'Prism Analytics Engine API',
-        'company': 'Precise Digital',
-        'version': '1.0.0',
-        'status': 'running',
-        'deployment': 'separate_backend_service',
-        'description': 'Music industry lead generation through ISRC analysis and multi-platform data aggregation',
-        'endpoints': {
-            'health_monitoring': {
-                'health': 'GET /api/health',
-                'status': 'GET /api/status',
-                'dashboard_stats': 'GET /api/dashboard/stats'
-            },
-            'isrc_analysis': {
-                'single_isrc': 'POST /api/analyze-isrc',
-                'bulk_processing': 'POST /api/analyze-bulk',
-                'file_upload': 'POST /api/upload-isrcs'
-            },
-            'lead_management': {
-                'list_leads': 'GET /api/leads',
-                'get_artist': 'GET /api/artist/<id>',
-                'update_outreach': 'PUT /api/artist/<id>/outreach',
-                'export_leads': 'POST /api/export'
-            },
-            'youtube_integration': {
-                'test_api': 'POST /api/youtube/test',
-                'get_stats': 'GET /api/youtube/stats',
-                'get_opportunities': 'GET /api/youtube/opportunities',
-                'refresh_artist': 'POST /api/artist/<id>/youtube/refresh'
-            },
-            'api_testing': {
-                'test_musicbrainz': 'POST /api/musicbrainz/test',
-                'test_lastfm': 'POST /api/lastfm/test',
-                'rate_limits': 'GET /api/rate-limits'
-            }
-        },
-        'integrations': {
-            'musicbrainz': {'status': 'always_available', 'description': 'Free music metadata database'},
-            'spotify': {
-                'status': 'configured' if os.getenv('SPOTIFY_CLIENT_ID') else 'not_configured',
-                'description': 'Music streaming platform with artist/track data'
-            },
-            'youtube': {
-                'status': 'configured' if os.getenv('YOUTUBE_API_KEY') else 'not_configured',
-                'description': 'Video platform with channel analytics and engagement data'
-            },
-            'lastfm': {
-                'status': 'configured' if os.getenv('LASTFM_API_KEY') else 'optional',
-                'description': 'Social music platform with listening data'
-            }
-        },
-        'data_sources': {
-            'primary': ['MusicBrainz', 'Spotify Web API'],
-            'secondary': ['YouTube Data API', 'Last.fm API'],
-            'target_regions': ['New Zealand', 'Australia', 'Pacific Islands'],
-            'lead_scoring': ['Independence', 'Opportunity', 'Geographic']
-        },
-        'timestamp': datetime.utcnow().isoformat()
-    })
+    return _with_timestamp(_API_DOCUMENTATION)
 
 # Health check endpoint
+# Load balancers poll /api/health every few seconds; a successful database
+# probe is reused for this long instead of running SELECT 1 on every ping
+HEALTH_PROBE_TTL_SECONDS = 10
+_health_probe = {'checked_at': 0.0, 'database_type': None}
+_health_probe_lock = threading.Lock()
+
+def _probe_database() -> Tuple[bool, str]:
+    """(connected, database type), served from the last good probe while fresh"""
+    with _health_probe_lock:
+        if (_health_probe['database_type'] is not None
+                and time.monotonic() - _health_probe['checked_at'] < HEALTH_PROBE_TTL_SECONDS):
+            return True, _health_probe['database_type']
+        
+        try:
+            with db_manager.get_session() as session:
+                result = session.execute(text("SELECT 1")).scalar()
+                database_type = str(session.bind.dialect.name)
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            _health_probe['database_type'] = None
+            return False, 'unknown'
+        
+        if result != 1:
+            _health_probe['database_type'] = None
+            return False, database_type
+        
+        # Only successful probes are cached, so failures re-probe every time
+        _health_probe.update(checked_at=time.monotonic(), database_type=database_type)
+        return True, database_type
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Comprehensive health check for Prism Analytics Engine"""
-    db_connected = True
-    database_type = 'unknown'
-    
-    try:
-        with db_manager.get_session() as session:
-            result = session.execute(text("SELECT 1")).scalar()
-            db_connected = (result == 1)
-            database_type = str(session.bind.dialect.name)
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_connected = False
+    db_connected, database_type = _probe_database()
     
     # Check pipeline status
-    pipeline_status = pipeline is not None
+    pipeline_status = get_pipeline() is not None
     
     # Check API integrations
     api_status = {
@@ -274,6 +462,33 @@ def health_check():
         'version': '1.0.0'
     })
 
+# Configuration health check
+@app.route('/api/health/config', methods=['GET'])
+def health_config():
+    """Validate configuration on demand against the application's database engine"""
+    try:
+        config_status = settings.validate_configuration(engine=db_manager.engine)
+        
+        # Never expose credentials embedded in the database URL
+        config_status['database']['url'] = make_url(
+            config_status['database']['url']
+        ).render_as_string(hide_password=True)
+        
+        healthy = config_status['database']['accessible']
+        return jsonify({
+            'status': 'healthy' if healthy else 'degraded',
+            'configuration': config_status,
+            'timestamp': datetime.utcnow().isoformat()
+        }), 200 if healthy else 503
+        
+    except Exception as e:
+        logger.error(f"Configuration health check failed: {e}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e),
+            'timestamp': datetime.utcnow().isoformat()
+        }), 500
+
 # System status endpoint
 @app.route('/api/status', methods=['GET'])
 def system_status():
@@ -288,16 +503,16 @@ def system_status():
         
         # Check YouTube integration
         youtube_integration = {
-            'status': 'available' if settings.apis['youtube'].api_key else 'not_configured',
-            'api_key_configured': bool(settings.apis['youtube'].api_key),
+            'status': _YT_API_STATUS,
+            'api_key_configured': _YT_ENABLED,
             'daily_quota_used': rate_status.get('youtube', {}).get('quota_used_today', 0),
             'daily_quota_limit': rate_status.get('youtube', {}).get('quota_limit_daily', 10000)
         }
         
-        return jsonify({
+        return _ojson({
             'service': 'Prism Analytics Engine',
             'status': 'online',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'database_status': {
                 'connected': db_status.get('connected', False),
                 'type': db_status.get('database_type', 'Unknown'),
@@ -352,27 +567,37 @@ def analyze_isrc():
         include_youtube = data.get('include_youtube', True)
         
         # Check for cached data if not forcing refresh
-        if not force_refresh and save_to_db:
+        cache_key = _isrc_cache_key(isrc)
+        if force_refresh:
+            with _isrc_cache_lock:
+                _isrc_cache.pop(cache_key, None)
+        elif save_to_db:
             try:
-                with db_manager.get_session() as session:
-                    existing_track = session.query(Track).filter_by(isrc=isrc).first()
-                    if existing_track and hasattr(existing_track, 'updated_at'):
-                        track_updated_at = existing_track.updated_at
-                        if track_updated_at:
-                            time_diff = datetime.utcnow() - track_updated_at
-                            if time_diff.total_seconds() < 86400:  # 24 hours
-                                return jsonify({
-                                    'isrc': isrc,
-                                    'status': 'cached',
-                                    'message': 'Returning cached data. Use force_refresh=true to reprocess.',
-                                    'artist_id': existing_track.artist_id,
-                                    'last_updated': track_updated_at.isoformat(),
-                                    'service': 'Prism Analytics Engine'
-                                })
+                with _isrc_cache_lock:
+                    cached = _isrc_cache.get(cache_key)
+                if cached is None:
+                    existing_track = get_db_session().execute(_TRACK_BY_ISRC, {'isrc': isrc}).first()
+                    if existing_track and existing_track.updated_at:
+                        cached = (existing_track.artist_id, existing_track.updated_at)
+                        with _isrc_cache_lock:
+                            _isrc_cache[cache_key] = cached
+                if cached:
+                    artist_id, track_updated_at = cached
+                    time_diff = datetime.utcnow() - track_updated_at
+                    if time_diff.total_seconds() < CACHE_FRESHNESS_SECONDS:
+                        return jsonify({
+                            'isrc': isrc,
+                            'status': 'cached',
+                            'message': 'Returning cached data. Use force_refresh=true to reprocess.',
+                            'artist_id': artist_id,
+                            'last_updated': track_updated_at.isoformat(),
+                            'service': 'Prism Analytics Engine'
+                        })
             except Exception as e:
                 logger.warning(f"Cache check failed: {e}")
         
         # Process the ISRC
+        pipeline = get_pipeline()
         if not pipeline:
             return jsonify({
                 'error': 'Processing pipeline not available',
@@ -391,13 +616,18 @@ def analyze_isrc():
         
         processing_time = round(time.time() - start_time, 2)
         
+        # Remember fresh writes so repeat requests skip the database
+        if save_to_db and result.get('status') == 'completed' and result.get('artist_id'):
+            with _isrc_cache_lock:
+                _isrc_cache[cache_key] = (result['artist_id'], datetime.utcnow())
+        
         # Add metadata to response
         result.update({
             'processing_time': processing_time,
             'youtube_integration': {
                 'enabled': include_youtube,
                 'data_found': bool(result.get('youtube_data')),
-                'api_status': 'available' if settings.apis['youtube'].api_key else 'not_configured'
+                'api_status': _YT_API_STATUS
             },
             'service': 'Prism Analytics Engine',
             'timestamp': datetime.utcnow().isoformat()
@@ -449,19 +679,9 @@ def analyze_bulk():
                 'service': 'Prism Analytics Engine'
             }), 400
         
-        # Validate and clean ISRCs
-        cleaned_isrcs = []
-        invalid_isrcs = []
-        
-        for isrc in isrcs:
-            if isinstance(isrc, str):
-                is_valid, result = validate_isrc(isrc)
-                if is_valid:
-                    cleaned_isrcs.append(result)
-                else:
-                    invalid_isrcs.append(isrc)
-            else:
-                invalid_isrcs.append(str(isrc))
+        # Validate and clean ISRCs; no JSON non-string stringifies to a valid one
+        cleaned_isrcs, invalid = validate_isrc_batch(isrcs)
+        invalid_isrcs = [str(item['isrc']) for item in invalid]
         
         if invalid_isrcs:
             return jsonify({
@@ -470,6 +690,7 @@ def analyze_bulk():
                 'service': 'Prism Analytics Engine'
             }), 400
         
+        pipeline = get_pipeline()
         if not pipeline:
             return jsonify({
                 'error': 'Processing pipeline not available',
@@ -478,34 +699,28 @@ def analyze_bulk():
         
         # Process batch
         batch_size = data.get('batch_size', 10)
-        include_youtube = data.get('include_youtube', True)
         
         logger.info(f"Starting bulk analysis of {len(cleaned_isrcs)} ISRCs")
         start_time = time.time()
         
-        result = pipeline.process_bulk_isrcs(
+        result = pipeline.process_bulk(
             isrcs=cleaned_isrcs,
-            batch_size=batch_size,
-            include_youtube=include_youtube
+            batch_size=batch_size
         )
         
         total_time = round(time.time() - start_time, 2)
         
         # Calculate YouTube statistics
+        youtube_data = [item['youtube_data'] for item in result.get('results', ()) if item.get('youtube_data')]
+        channels = [data['channel'] for data in youtube_data if data.get('channel')]
         youtube_stats = {
-            'artists_with_youtube': 0,
-            'youtube_data_collected': 0,
-            'total_youtube_subscribers': 0
+            'artists_with_youtube': len(channels),
+            'youtube_data_collected': len(youtube_data),
+            'total_youtube_subscribers': sum(
+                int(channel.get('statistics', {}).get('subscriber_count', 0) or 0) for channel in channels
+            )
         }
         
-        for item in result.get('results', []):
-            if item.get('youtube_data'):
-                youtube_stats['youtube_data_collected'] += 1
-                if item['youtube_data'].get('channel'):
-                    youtube_stats['artists_with_youtube'] += 1
-                    subs = item['youtube_data']['channel'].get('statistics', {}).get('subscriber_count', 0)
-                    youtube_stats['total_youtube_subscribers'] += int(subs or 0)
-        
         # Add metadata
         result.update({
             'total_time': total_time,
@@ -516,7 +731,7 @@ def analyze_bulk():
         })
         
         logger.info(f"Bulk analysis completed in {total_time}s")
-        return jsonify(result)
+        return _ojson(result)
         
     except Exception as e:
         logger.error(f"Error in analyze_bulk: {e}")
@@ -528,6 +743,31 @@ def analyze_bulk():
             'failed': len(data.get('isrcs', [])) if 'data' in locals() else 0
         }), 500
 
+_UPLOAD_VALIDATE_BLOCK = 1024  # TXT lines per validate_isrc_batch() call
+
+def _iter_uploaded_isrcs(stream, is_csv: bool):
+    """Yield cleaned, valid ISRCs from an uploaded text stream, one row/line at a time"""
+    if is_csv:
+        for row_num, row in enumerate(csv.reader(stream), 1):
+            if row_num == 1 and any('isrc' in cell.lower() for cell in row):
+                # Skip header row if it contains 'ISRC'
+                continue
+            
+            for cell in row:
+                is_valid, result = validate_isrc(cell)
+                if is_valid:
+                    yield result
+                    break  # Take first valid ISRC from row
+    else:
+        # TXT: one ISRC per line, validated a block of lines at a time
+        block = []
+        for line in stream:
+            block.append(line)
+            if len(block) == _UPLOAD_VALIDATE_BLOCK:
+                yield from validate_isrc_batch(block)[0]
+                block = []
+        yield from validate_isrc_batch(block)[0]
+
 # File upload for bulk processing
 @app.route('/api/upload-isrcs', methods=['POST'])
 def upload_isrcs():
@@ -556,48 +796,26 @@ def upload_isrcs():
                 'service': 'Prism Analytics Engine'
             }), 400
         
-        # Read file content
+        # Stream the upload instead of reading it into memory; utf-8-sig
+        # accepts UTF-8 with or without a BOM. Dedupe as we go and stop as soon
+        # as the file is known to exceed the bulk limit.
+        stream = io.TextIOWrapper(file.stream, encoding='utf-8-sig', newline='')
+        unique_isrcs = []
+        seen: set[str] = set()
         try:
-            file_content = file.read().decode('utf-8')
+            for isrc in _iter_uploaded_isrcs(stream, filename.lower().endswith('.csv')):
+                if isrc not in seen:
+                    seen.add(isrc)
+                    unique_isrcs.append(isrc)
+                    if len(unique_isrcs) > settings.max_bulk_isrcs:
+                        break
         except UnicodeDecodeError:
-            try:
-                file_content = file.read().decode('utf-8-sig')  # Try with BOM
-            except UnicodeDecodeError:
-                return jsonify({
-                    'error': 'File encoding not supported. Please use UTF-8.',
-                    'service': 'Prism Analytics Engine'
-                }), 400
-        
-        # Parse ISRCs from file
-        isrcs = []
-        
-        if filename.lower().endswith('.csv'):
-            # Parse CSV
-            csv_reader = csv.reader(io.StringIO(file_content))
-            for row_num, row in enumerate(csv_reader, 1):
-                if row_num == 1 and any('isrc' in cell.lower() for cell in row):
-                    # Skip header row if it contains 'ISRC'
-                    continue
-                
-                for cell in row:
-                    is_valid, result = validate_isrc(cell)
-                    if is_valid:
-                        isrcs.append(result)
-                        break  # Take first valid ISRC from row
-        else:
-            # Parse TXT (one ISRC per line)
-            for line in file_content.split('\n'):
-                is_valid, result = validate_isrc(line.strip())
-                if is_valid:
-                    isrcs.append(result)
-        
-        # Remove duplicates while preserving order
-        unique_isrcs = []
-        seen = set()
-        for isrc in isrcs:
-            if isrc not in seen:
-                unique_isrcs.append(isrc)
-                seen.add(isrc)
+            return jsonify({
+                'error': 'File encoding not supported. Please use UTF-8.',
+                'service': 'Prism Analytics Engine'
+            }), 400
+        finally:
+            stream.detach()
         
         if not unique_isrcs:
             return jsonify({
@@ -609,7 +827,9 @@ def upload_isrcs():
         if len(unique_isrcs) > settings.max_bulk_isrcs:
             return jsonify({
                 'error': f'Too many ISRCs in file. Maximum allowed: {settings.max_bulk_isrcs}',
+                # Reading stopped at the first ISRC over the limit
                 'found': len(unique_isrcs),
+                'truncated': True,
                 'service': 'Prism Analytics Engine'
             }), 400
         
@@ -629,6 +849,109 @@ def upload_isrcs():
             'service': 'Prism Analytics Engine'
         }), 500
 
+# Artist columns serialized by /api/leads
+_LEAD_COLUMNS = (
+    Artist.id, Artist.name, Artist.country, Artist.region, Artist.genre,
+    Artist.total_score, Artist.independence_score, Artist.opportunity_score,
+    Artist.geographic_score, Artist.lead_tier, Artist.monthly_listeners,
+    Artist.last_release_date, Artist.outreach_status, Artist.contact_email,
+    Artist.website, Artist.social_handles, Artist.youtube_channel_id,
+    Artist.youtube_channel_url, Artist.youtube_subscribers, Artist.youtube_total_views,
+    Artist.youtube_video_count, Artist.youtube_upload_frequency,
+    Artist.youtube_growth_potential, Artist.youtube_engagement_rate,
+    Artist.created_at, Artist.updated_at
+)
+
+def _serialize_lead(artist: Artist) -> Dict[str, Any]:
+    """One /api/leads row"""
+    return {
+        'id': artist.id,
+        'name': artist.name,
+        'country': artist.country,
+        'region': artist.region,
+        'genre': artist.genre,
+        'total_score': artist.total_score,
+        'independence_score': artist.independence_score,
+        'opportunity_score': artist.opportunity_score,
+        'geographic_score': artist.geographic_score,
+        'lead_tier': artist.lead_tier,
+        'monthly_listeners': artist.monthly_listeners,
+        'last_release_date': artist.last_release_date,
+        'outreach_status': artist.outreach_status,
+        'contact_email': artist.contact_email,
+        'website': artist.website,
+        'social_handles': artist.social_handles,
+        'youtube_summary': {
+            'has_channel': bool(artist.youtube_channel_id),
+            'channel_url': artist.youtube_channel_url,
+            'subscribers': artist.youtube_subscribers or 0,
+            'total_views': artist.youtube_total_views or 0,
+            'video_count': artist.youtube_video_count or 0,
+            'upload_frequency': artist.youtube_upload_frequency,
+            'growth_potential': artist.youtube_growth_potential,
+            'engagement_rate': artist.youtube_engagement_rate or 0.0
+        },
+        'created_at': artist.created_at,
+        'updated_at': artist.updated_at
+    }
+
+# /api/leads filter predicates by name; values are bound per request
+_LEADS_FILTERS = {
+    'tier': Artist.lead_tier == bindparam('tier'),
+    'region': Artist.region == bindparam('region'),
+    'min_score': Artist.total_score >= bindparam('min_score'),
+    'max_score': Artist.total_score <= bindparam('max_score'),
+    'search': Artist.name.ilike(bindparam('search')),
+    # YouTube filtering
+    'youtube:has_channel': Artist.youtube_channel_id.isnot(None),
+    'youtube:no_channel': Artist.youtube_channel_id.is_(None),
+    'youtube:high_potential': Artist.youtube_growth_potential == 'high_potential',
+    'youtube:underperforming': and_(
+        Artist.monthly_listeners > 10000,
+        Artist.youtube_subscribers < Artist.monthly_listeners * 0.3
+    ),
+    'youtube:active_uploaders': Artist.youtube_upload_frequency.in_(['very_active', 'active'])
+}
+
+# Known sort_by values; anything else sorts by total_score
+_LEADS_SORT_COLUMNS = {
+    'total_score': Artist.total_score,
+    'name': Artist.name,
+    'created_at': Artist.created_at,
+    'youtube_subscribers': Artist.youtube_subscribers,
+    'monthly_listeners': Artist.monthly_listeners
+}
+
+@functools.lru_cache(maxsize=64)
+def _leads_statements(shape: frozenset, sort_by: str, descending: bool):
+    """
+    (aggregate, page) statements for one combination of active filters
+    
+    Built once per shape and sort, so requests only bind values; the compiled
+    SQL is then reused from SQLAlchemy's statement cache. `sort_by` must be a
+    _LEADS_SORT_COLUMNS key so user input can't grow the cache.
+    """
+    conditions = [_LEADS_FILTERS[name] for name in sorted(shape)]
+    sort_column = _LEADS_SORT_COLUMNS[sort_by]
+    
+    aggregate = select(func.max(Artist.updated_at), func.count(Artist.id)).where(*conditions)
+    page = (
+        select(Artist)
+        .options(load_only(*_LEAD_COLUMNS))  # Load only the serialized columns
+        .where(*conditions)
+        .order_by(sort_column.desc() if descending else sort_column.asc())
+        .offset(bindparam('offset'))
+        .limit(bindparam('limit'))
+        .execution_options(yield_per=200)
+    )
+    return aggregate, page
+
+def _with_leads_validators(response: Response, etag: str) -> Response:
+    """ETag and revalidation headers shared by every /api/leads response"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, must-revalidate'
+    return response
+
 # Get leads with comprehensive filtering
 @app.route('/api/leads', methods=['GET'])
 def get_leads():
@@ -646,106 +969,60 @@ def get_leads():
         sort_by = request.args.get('sort_by', 'total_score')
         sort_order = request.args.get('sort_order', 'desc')
         
-        with db_manager.get_session() as session:
-            # Build query
-            query = session.query(Artist)
-            
-            # Apply filters
-            if tier:
-                query = query.filter(Artist.lead_tier == tier.upper())
-            
-            if region:
-                query = query.filter(Artist.region == region)
-            
-            if min_score is not None:
-                query = query.filter(Artist.total_score >= min_score)
-            
-            if max_score is not None:
-                query = query.filter(Artist.total_score <= max_score)
-            
-            if search:
-                query = query.filter(Artist.name.ilike(f'%{search}%'))
-            
-            # YouTube filtering
-            if youtube_filter:
-                if youtube_filter == 'has_channel':
-                    query = query.filter(Artist.youtube_channel_id.isnot(None))
-                elif youtube_filter == 'no_channel':
-                    query = query.filter(Artist.youtube_channel_id.is_(None))
-                elif youtube_filter == 'high_potential':
-                    query = query.filter(Artist.youtube_growth_potential == 'high_potential')
-                elif youtube_filter == 'underperforming':
-                    query = query.filter(
-                        Artist.monthly_listeners > 10000,
-                        Artist.youtube_subscribers < Artist.monthly_listeners * 0.3
-                    )
-                elif youtube_filter == 'active_uploaders':
-                    query = query.filter(Artist.youtube_upload_frequency.in_(['very_active', 'active']))
-            
-            # Apply sorting
-            sort_column = Artist.total_score  # Default
-            if sort_by == 'name':
-                sort_column = Artist.name
-            elif sort_by == 'created_at':
-                sort_column = Artist.created_at
-            elif sort_by == 'youtube_subscribers':
-                sort_column = Artist.youtube_subscribers
-            elif sort_by == 'monthly_listeners':
-                sort_column = Artist.monthly_listeners
-            
-            if sort_order.lower() == 'desc':
-                query = query.order_by(sort_column.desc())
-            else:
-                query = query.order_by(sort_column.asc())
-            
-            # Get total count before pagination
-            total_count = query.count()
-            
-            # Apply pagination
-            leads = query.offset(offset).limit(limit).all()
-            
-            # Format results
-            results = []
-            for artist in leads:
-                # Safe attribute access
-                last_release_date = getattr(artist, 'last_release_date', None)
-                created_at = getattr(artist, 'created_at', None)
-                updated_at = getattr(artist, 'updated_at', None)
-                
-                result_item = {
-                    'id': artist.id,
-                    'name': artist.name,
-                    'country': artist.country,
-                    'region': artist.region,
-                    'genre': artist.genre,
-                    'total_score': artist.total_score,
-                    'independence_score': artist.independence_score,
-                    'opportunity_score': artist.opportunity_score,
-                    'geographic_score': artist.geographic_score,
-                    'lead_tier': artist.lead_tier,
-                    'monthly_listeners': artist.monthly_listeners,
-                    'last_release_date': last_release_date.isoformat() if last_release_date else None,
-                    'outreach_status': artist.outreach_status,
-                    'contact_email': artist.contact_email,
-                    'website': artist.website,
-                    'social_handles': artist.social_handles,
-                    'youtube_summary': {
-                        'has_channel': bool(artist.youtube_channel_id),
-                        'channel_url': artist.youtube_channel_url,
-                        'subscribers': artist.youtube_subscribers or 0,
-                        'total_views': artist.youtube_total_views or 0,
-                        'video_count': artist.youtube_video_count or 0,
-                        'upload_frequency': artist.youtube_upload_frequency,
-                        'growth_potential': artist.youtube_growth_potential,
-                        'engagement_rate': artist.youtube_engagement_rate or 0.0
-                    },
-                    'created_at': created_at.isoformat() if created_at else None,
-                    'updated_at': updated_at.isoformat() if updated_at else None
-                }
-                results.append(result_item)
+        # Repeated searches are served from the admitted-search cache
+        search_key = None
+        if search:
+            # The args themselves, not a hash, so distinct queries never share an entry
+            search_key = tuple(sorted(request.args.items(multi=True)))
+            with _search_cache_lock:
+                cached = _search_cache.get(search_key)
+            if cached is not None:
+                etag, body = cached
+                if request.if_none_match.contains(etag):
+                    return _with_leads_validators(Response(status=304), etag)
+                return _with_leads_validators(Response(body, mimetype='application/json'), etag)
+            if _search_frequency.hit(search_key) < SEARCH_CACHE_ADMIT_HITS:
+                search_key = None
+        
+        # The session stays open while the response streams, so it is closed
+        # by the generator rather than a context manager
+        session = db_manager.SessionLocal()
+        try:
+            # Statements are cached per filter shape; only values vary
+            params = {
+                'tier': tier.upper() if tier else None,
+                'region': region,
+                'min_score': min_score,
+                'max_score': max_score,
+                'search': f'%{search}%' if search else None,
+                'offset': offset,
+                'limit': limit
+            }
+            shape = {name for name in ('tier', 'region', 'search') if params[name]}
+            shape.update(name for name in ('min_score', 'max_score') if params[name] is not None)
+            if youtube_filter and f'youtube:{youtube_filter}' in _LEADS_FILTERS:
+                shape.add(f'youtube:{youtube_filter}')
+            sort_key = sort_by if sort_by in _LEADS_SORT_COLUMNS else 'total_score'
+            aggregate, page = _leads_statements(frozenset(shape), sort_key, sort_order.lower() == 'desc')
             
-            return jsonify({
-                'leads': results,
+            # One aggregate gives the total and, with MAX(updated_at), a
+            # validator for the filtered set: unchanged leads answer 304
+            last_updated, total_count = session.execute(aggregate, params).one()
+        except Exception:
+            session.close()
+            raise
+        
+        etag = hashlib.blake2b(
+            f"{last_updated}|{total_count}|{sorted(request.args.items(multi=True))}".encode(),
+            digest_size=8
+        ).hexdigest()
+        if request.if_none_match.contains(etag):
+            session.close()
+            return _with_leads_validators(Response(status=304), etag)
+        
+        # Everything after the rows, once the total is known
+        def leads_tail(total_count):
+            return _dumps({
                 'pagination': {
                     'total': total_count,
                     'limit': limit,
@@ -765,9 +1042,36 @@ def get_leads():
                     'sort_order': sort_order
                 },
                 'service': 'Prism Analytics Engine',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcnow()
             })
         
+        def stream():
+            try:
+                yield b'{"leads":['
+                separator = b''
+                for artist in session.execute(page, params).scalars():
+                    yield separator + _dumps(_serialize_lead(artist))
+                    separator = b','
+                yield b'],' + leads_tail(total_count)[1:]
+            finally:
+                session.close()
+        
+        def stream_and_cache():
+            chunks = []
+            for chunk in stream():
+                chunks.append(chunk)
+                yield chunk
+            with _search_cache_lock:
+                _search_cache[search_key] = (etag, b''.join(chunks))
+        
+        # The generators only touch locals, so they run without the request
+        # context; closing the response also closes a never-started stream's
+        # session
+        body = stream_and_cache() if search_key is not None else stream()
+        response = Response(body, mimetype='application/json')
+        response.call_on_close(session.close)
+        return _with_leads_validators(response, etag)
+        
     except Exception as e:
         logger.error(f"Error in get_leads: {e}")
         return jsonify({
@@ -780,93 +1084,89 @@ def get_leads():
 def get_artist(artist_id):
     """Get detailed information for a specific artist including YouTube data"""
     try:
-        with db_manager.get_session() as session:
-            artist = session.query(Artist).filter_by(id=artist_id).first()
-            
-            if not artist:
-                return jsonify({
-                    'error': 'Artist not found',
-                    'service': 'Prism Analytics Engine'
-                }), 404
-            
-            # Get associated tracks
-            tracks = session.query(Track).filter_by(artist_id=artist_id).all()
-            
-            # Get contact attempts
-            contacts = session.query(ContactAttempt).filter_by(artist_id=artist_id).all()
-            
-            # Safe datetime access
-            last_release_date = getattr(artist, 'last_release_date', None)
-            youtube_last_upload = getattr(artist, 'youtube_last_upload', None)
-            created_at = getattr(artist, 'created_at', None)
-            updated_at = getattr(artist, 'updated_at', None)
-            last_scraped = getattr(artist, 'last_scraped', None)
-            
-            result = {
-                'id': artist.id,
-                'name': artist.name,
-                'musicbrainz_id': artist.musicbrainz_id,
-                'spotify_id': artist.spotify_id,
-                'country': artist.country,
-                'region': artist.region,
-                'genre': artist.genre,
-                'scores': {
-                    'total_score': artist.total_score,
-                    'independence_score': artist.independence_score,
-                    'opportunity_score': artist.opportunity_score,
-                    'geographic_score': artist.geographic_score,
-                    'lead_tier': artist.lead_tier
-                },
-                'metrics': {
-                    'monthly_listeners': artist.monthly_listeners,
-                    'follower_count': artist.follower_count,
-                    'release_count': artist.release_count,
-                    'last_release_date': last_release_date.isoformat() if last_release_date else None
-                },
-                'youtube_metrics': {
-                    'channel_id': artist.youtube_channel_id,
-                    'channel_url': artist.youtube_channel_url,
-                    'subscribers': artist.youtube_subscribers,
-                    'total_views': artist.youtube_total_views,
-                    'video_count': artist.youtube_video_count,
-                    'upload_frequency': artist.youtube_upload_frequency,
-                    'engagement_rate': artist.youtube_engagement_rate,
-                    'growth_potential': artist.youtube_growth_potential,
-                    'last_upload': youtube_last_upload.isoformat() if youtube_last_upload else None,
-                    'has_channel': bool(artist.youtube_channel_id)
-                },
-                'contact_info': {
-                    'email': artist.contact_email,
-                    'website': artist.website,
-                    'social_handles': artist.social_handles,
-                    'management_contact': artist.management_contact
-                },
-                'outreach_status': artist.outreach_status,
-                'tracks': [{
-                    'id': track.id,
-                    'isrc': track.isrc,
-                    'title': track.title,
-                    'release_date': (lambda rd: rd.isoformat() if rd else None)(getattr(track, 'release_date', None)),
-                    'label': track.label,
-                    'spotify_popularity': track.spotify_popularity
-                } for track in tracks],
-                'contact_attempts': [{
-                    'method': contact.contact_method,
-                    'value': contact.contact_value,
-                    'confidence': contact.confidence_score,
-                    'source': contact.source,
-                    'verified': contact.verified
-                } for contact in contacts],
-                'timestamps': {
-                    'created_at': created_at.isoformat() if created_at else None,
-                    'updated_at': updated_at.isoformat() if updated_at else None,
-                    'last_scraped': last_scraped.isoformat() if last_scraped else None
-                },
+        session = get_db_session()
+        
+        # Tracks and contact attempts arrive in two batched SELECTs; debug
+        # builds raise on any other lazy load instead of silently issuing it
+        options = [selectinload(Artist.tracks), selectinload(Artist.contact_attempts)]
+        if app.debug:
+            options.append(raiseload('*'))
+        artist = session.query(Artist).options(*options).filter_by(id=artist_id).first()
+        
+        if not artist:
+            return jsonify({
+                'error': 'Artist not found',
                 'service': 'Prism Analytics Engine'
-            }
-            
-            return jsonify(result)
+            }), 404
+        
+        tracks = artist.tracks
+        contacts = artist.contact_attempts
+        
+        result = {
+            'id': artist.id,
+            'name': artist.name,
+            'musicbrainz_id': artist.musicbrainz_id,
+            'spotify_id': artist.spotify_id,
+            'country': artist.country,
+            'region': artist.region,
+            'genre': artist.genre,
+            'scores': {
+                'total_score': artist.total_score,
+                'independence_score': artist.independence_score,
+                'opportunity_score': artist.opportunity_score,
+                'geographic_score': artist.geographic_score,
+                'lead_tier': artist.lead_tier
+            },
+            'metrics': {
+                'monthly_listeners': artist.monthly_listeners,
+                'follower_count': artist.follower_count,
+                'release_count': artist.release_count,
+                'last_release_date': artist.last_release_date
+            },
+            'youtube_metrics': {
+                'channel_id': artist.youtube_channel_id,
+                'channel_url': artist.youtube_channel_url,
+                'subscribers': artist.youtube_subscribers,
+                'total_views': artist.youtube_total_views,
+                'video_count': artist.youtube_video_count,
+                'upload_frequency': artist.youtube_upload_frequency,
+                'engagement_rate': artist.youtube_engagement_rate,
+                'growth_potential': artist.youtube_growth_potential,
+                'last_upload': artist.youtube_last_upload,
+                'has_channel': bool(artist.youtube_channel_id)
+            },
+            'contact_info': {
+                'email': artist.contact_email,
+                'website': artist.website,
+                'social_handles': artist.social_handles,
+                'management_contact': artist.management_contact
+            },
+            'outreach_status': artist.outreach_status,
+            'tracks': [{
+                'id': track.id,
+                'isrc': track.isrc,
+                'title': track.title,
+                'release_date': track.release_date,
+                'label': track.label,
+                'spotify_popularity': track.spotify_popularity
+            } for track in tracks],
+            'contact_attempts': [{
+                'method': contact.contact_method,
+                'value': contact.contact_value,
+                'confidence': contact.confidence_score,
+                'source': contact.source,
+                'verified': contact.verified
+            } for contact in contacts],
+            'timestamps': {
+                'created_at': artist.created_at,
+                'updated_at': artist.updated_at,
+                'last_scraped': artist.last_scraped
+            },
+            'service': 'Prism Analytics Engine'
+        }
         
+        return jsonify(result)
+    
     except Exception as e:
         logger.error(f"Error in get_artist: {e}")
         return jsonify({
@@ -879,24 +1179,23 @@ def get_artist(artist_id):
 def update_outreach_status(artist_id):
     """Update outreach status for an artist"""
     try:
-        data = request.get_json()
-        
-        is_valid, error_msg = validate_request_data(data, ['status'])
-        if not is_valid:
+        body = request.get_data()
+        if not body:
             return jsonify({
-                'error': error_msg,
+                'error': 'No data provided in request body',
                 'service': 'Prism Analytics Engine'
             }), 400
         
-        status = data['status']
-        valid_statuses = ['not_contacted', 'contacted', 'responded', 'interested', 'not_interested', 'converted']
-        
-        if status not in valid_statuses:
+        try:
+            update = OutreachUpdate.model_validate_json(body)
+        except ValidationError as e:
             return jsonify({
-                'error': f'Invalid status. Must be one of: {valid_statuses}',
+                'error': _validation_message(e),
                 'service': 'Prism Analytics Engine'
             }), 400
         
+        status = update.status
+        
         with db_manager.get_session() as session:
             artist = session.query(Artist).filter_by(id=artist_id).first()
             
@@ -911,13 +1210,12 @@ def update_outreach_status(artist_id):
             artist.updated_at = datetime.utcnow()
             
             # Log the outreach attempt if notes provided
-            notes = data.get('notes')
-            if notes:
+            if update.notes:
                 outreach_log = OutreachLog(
                     artist_id=artist_id,
                     contact_date=datetime.utcnow(),
-                    method=data.get('method', 'manual'),
-                    notes=notes,
+                    method=update.method,
+                    notes=update.notes,
                     conversion_status=status if status in ['interested', 'not_interested', 'converted'] else 'no_response'
                 )
                 session.add(outreach_log)
@@ -938,127 +1236,377 @@ def update_outreach_status(artist_id):
         }), 500
 
 # Export leads to CSV
+_EXPORT_BASIC_HEADERS = [
+    'Artist Name', 'Country', 'Region', 'Genre', 'Total Score',
+    'Independence Score', 'Opportunity Score', 'Geographic Score',
+    'Lead Tier', 'Monthly Listeners', 'Last Release Date',
+    'Outreach Status', 'Contact Email', 'Website', 'Social Handles',
+    'Created Date'
+]
+
+_EXPORT_YOUTUBE_HEADERS = [
+    'YouTube Channel ID', 'YouTube Channel URL', 'YouTube Subscribers', 
+    'YouTube Total Views', 'YouTube Video Count', 'YouTube Upload Frequency', 
+    'YouTube Growth Potential', 'YouTube Engagement Rate'
+]
+
+_EXPORT_CHUNK_SIZE = 64 * 1024
+_EXPORT_SPOOL_BYTES = 8 * 1024 * 1024  # COPY output spills to disk past this
+
+# Background exports ("async": true) are written gzipped to EXPORT_DIR by a
+# small worker pool so a large export doesn't hold an HTTP worker. Each job
+# has a <job_id>.json status file beside its <job_id>.csv.gz, so any Gunicorn
+# worker sharing the directory can answer status and download requests.
+# Both are removed after EXPORT_JOB_TTL_SECONDS.
+EXPORT_DIR = os.getenv('EXPORT_DIR', os.path.join(tempfile.gettempdir(), 'prism_exports'))
+EXPORT_JOB_TTL_SECONDS = 3600
+_export_executor = ThreadPoolExecutor(max_workers=int(os.getenv('EXPORT_MAX_WORKERS', 2)),
+                                      thread_name_prefix='export')
+
+def _filter_export_query(query, filters: Dict):
+    """Apply the /api/export filters to an Artist query"""
+    if filters.get('tier'):
+        query = query.filter(Artist.lead_tier == filters['tier'].upper())
+    
+    if filters.get('region'):
+        query = query.filter(Artist.region == filters['region'])
+    
+    if filters.get('min_score'):
+        query = query.filter(Artist.total_score >= filters['min_score'])
+    
+    if filters.get('max_score'):
+        query = query.filter(Artist.total_score <= filters['max_score'])
+    
+    # YouTube filtering for export
+    if filters.get('youtube_filter'):
+        youtube_filter = filters['youtube_filter']
+        if youtube_filter == 'has_channel':
+            query = query.filter(Artist.youtube_channel_id.isnot(None))
+        elif youtube_filter == 'no_channel':
+            query = query.filter(Artist.youtube_channel_id.is_(None))
+        elif youtube_filter == 'high_potential':
+            query = query.filter(Artist.youtube_growth_potential == 'high_potential')
+    
+    # Order by score
+    return query.order_by(Artist.total_score.desc())
+
+_EXPORT_BASIC_COLUMNS = [
+    Artist.name, Artist.country, Artist.region, Artist.genre,
+    Artist.total_score, Artist.independence_score, Artist.opportunity_score,
+    Artist.geographic_score, Artist.lead_tier, Artist.monthly_listeners,
+    Artist.last_release_date, Artist.outreach_status, Artist.contact_email,
+    Artist.website, Artist.social_handles, Artist.created_at
+]
+
+_EXPORT_YOUTUBE_COLUMNS = [
+    Artist.youtube_channel_id, Artist.youtube_channel_url, Artist.youtube_subscribers,
+    Artist.youtube_total_views, Artist.youtube_video_count, Artist.youtube_upload_frequency,
+    Artist.youtube_growth_potential, Artist.youtube_engagement_rate
+]
+
+def _export_columns(include_youtube_data: bool) -> List:
+    """Columns selected for an export, in CSV header order"""
+    if include_youtube_data:
+        return _EXPORT_BASIC_COLUMNS + _EXPORT_YOUTUBE_COLUMNS
+    return _EXPORT_BASIC_COLUMNS
+
+def _jsonb_text(value) -> str:
+    """JSON as PostgreSQL prints jsonb (keys by length, then bytes), matching the COPY export"""
+    def ordered(value):
+        if isinstance(value, dict):
+            keys = sorted(value, key=lambda key: (len(key.encode()), key.encode()))
+            return {key: ordered(value[key]) for key in keys}
+        if isinstance(value, list):
+            return [ordered(item) for item in value]
+        return value
+    return json.dumps(ordered(value), ensure_ascii=False)
+
+def _export_row(row, include_youtube_data: bool) -> List:
+    """One CSV row from a _export_columns() result row"""
+    (name, country, region, genre, total_score, independence_score, opportunity_score,
+     geographic_score, lead_tier, monthly_listeners, last_release_date, outreach_status,
+     contact_email, website, social_handles, created_at) = row[:16]
+    
+    values = [
+        name,
+        country or '',
+        region or '',
+        genre or '',
+        total_score,
+        independence_score,
+        opportunity_score,
+        geographic_score,
+        lead_tier,
+        monthly_listeners or 0,
+        last_release_date.strftime('%Y-%m-%d') if last_release_date else '',
+        outreach_status or '',
+        contact_email or '',
+        website or '',
+        _jsonb_text(social_handles) if social_handles else '',
+        created_at.strftime('%Y-%m-%d %H:%M:%S') if created_at else ''
+    ]
+    
+    if include_youtube_data:
+        (channel_id, channel_url, subscribers, total_views, video_count,
+         upload_frequency, growth_potential, engagement_rate) = row[16:]
+        values += [
+            channel_id or '',
+            channel_url or '',
+            subscribers or 0,
+            total_views or 0,
+            video_count or 0,
+            upload_frequency or '',
+            growth_potential or '',
+            engagement_rate or 0.0
+        ]
+    return values
+
+def _export_copy_columns(include_youtube_data: bool) -> List:
+    """_export_row() as PostgreSQL column expressions, labelled with the CSV headers"""
+    def blank(column):
+        return func.coalesce(column, '')
+    
+    def zero(column):
+        return func.coalesce(column, 0)
+    
+    columns = [
+        Artist.name,
+        blank(Artist.country),
+        blank(Artist.region),
+        blank(Artist.genre),
+        Artist.total_score,
+        Artist.independence_score,
+        Artist.opportunity_score,
+        Artist.geographic_score,
+        Artist.lead_tier,
+        zero(Artist.monthly_listeners),
+        blank(func.to_char(Artist.last_release_date, 'YYYY-MM-DD')),
+        blank(Artist.outreach_status),
+        blank(Artist.contact_email),
+        blank(Artist.website),
+        blank(cast(Artist.social_handles, Text)),
+        blank(func.to_char(Artist.created_at, 'YYYY-MM-DD HH24:MI:SS'))
+    ]
+    headers = list(_EXPORT_BASIC_HEADERS)
+    
+    if include_youtube_data:
+        columns += [
+            blank(Artist.youtube_channel_id),
+            blank(Artist.youtube_channel_url),
+            zero(Artist.youtube_subscribers),
+            zero(Artist.youtube_total_views),
+            zero(Artist.youtube_video_count),
+            blank(Artist.youtube_upload_frequency),
+            blank(Artist.youtube_growth_potential),
+            zero(Artist.youtube_engagement_rate)
+        ]
+        headers += _EXPORT_YOUTUBE_HEADERS
+    
+    return [column.label(header) for column, header in zip(columns, headers)]
+
+def _stream_export_csv(filters: Dict, include_youtube_data: bool):
+    """
+    Yield the export as CSV bytes
+    
+    PostgreSQL formats the rows itself via COPY ... TO STDOUT; psycopg2's
+    copy_expert() writes into a spooled temp file that is then streamed in
+    chunks. Other databases stream ORM rows through csv.writer.
+    """
+    with db_manager.get_session() as session:
+        query = _filter_export_query(session.query(Artist), filters)
+        
+        if session.get_bind().dialect.name == 'postgresql':
+            statement = query.with_entities(*_export_copy_columns(include_youtube_data)).statement
+            compiled = statement.compile(dialect=session.get_bind().dialect)
+            spool = tempfile.SpooledTemporaryFile(max_size=_EXPORT_SPOOL_BYTES)
+            cursor = session.connection().connection.cursor()
+            try:
+                # COPY takes no bind parameters, so psycopg2 quotes the filter
+                # values into the statement itself
+                select_sql = cursor.mogrify(str(compiled), compiled.params)
+                cursor.copy_expert(b'COPY (' + select_sql + b') TO STDOUT WITH CSV HEADER', spool)
+            finally:
+                cursor.close()
+        else:
+            spool = None
+            output = io.StringIO()
+            writer = csv.writer(output)
+            writer.writerow(_EXPORT_BASIC_HEADERS + (_EXPORT_YOUTUBE_HEADERS if include_youtube_data else []))
+            rows = query.with_entities(*_export_columns(include_youtube_data))
+            for row in rows.yield_per(500):
+                writer.writerow(_export_row(row, include_youtube_data))
+                if output.tell() >= _EXPORT_CHUNK_SIZE:
+                    yield output.getvalue().encode('utf-8')
+                    output.seek(0)
+                    output.truncate()
+            yield output.getvalue().encode('utf-8')
+    
+    # COPY output is streamed after the session has gone back to the pool
+    if spool is not None:
+        with spool:
+            spool.seek(0)
+            while chunk := spool.read(_EXPORT_CHUNK_SIZE):
+                yield chunk
+
+def _export_path(job_id: str, suffix: str) -> str:
+    return os.path.join(EXPORT_DIR, f'{job_id}{suffix}')
+
+def _write_export_status(job_id: str, record: Dict):
+    """Replace a job's status file atomically (write, then rename over it)"""
+    path = _export_path(job_id, '.json')
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_dumps(record))
+    os.replace(tmp_path, path)
+
+def _read_export_status(job_id: str) -> Optional[Dict]:
+    """A job's status record, or None if the id is unknown, malformed or expired"""
+    try:
+        if uuid.UUID(hex=job_id).hex != job_id:
+            return None
+    except ValueError:
+        return None
+    
+    path = _export_path(job_id, '.json')
+    try:
+        if os.path.getmtime(path) < time.time() - EXPORT_JOB_TTL_SECONDS:
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _purge_expired_exports():
+    """Delete status, data and leftover temp files older than the job TTL"""
+    cutoff = time.time() - EXPORT_JOB_TTL_SECONDS
+    for entry in os.scandir(EXPORT_DIR):
+        try:
+            if entry.name.endswith(('.json', '.csv.gz', '.tmp')) and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            # Already removed by another worker
+            pass
+
+def _run_export_job(job_id: str, filters: Dict, include_youtube_data: bool):
+    """Worker body: write the streamed CSV to EXPORT_DIR and record the outcome"""
+    job = _read_export_status(job_id)
+    if job is None:
+        return
+    job['status'] = 'running'
+    _write_export_status(job_id, job)
+    
+    path = _export_path(job_id, '.csv.gz')
+    tmp_path = f'{path}.tmp'
+    try:
+        with gzip.open(tmp_path, 'wb') as out:
+            for chunk in _stream_export_csv(filters, include_youtube_data):
+                out.write(chunk)
+        # Only complete files ever appear under the final name
+        os.replace(tmp_path, path)
+        job.update({'status': 'completed', 'finished_at': datetime.utcnow().isoformat()})
+        logger.info(f"📦 Export {job_id} written to {path}")
+    except Exception as e:
+        logger.error(f"Export job {job_id} failed: {e}")
+        job.update({'status': 'failed', 'error': str(e), 'finished_at': datetime.utcnow().isoformat()})
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    _write_export_status(job_id, job)
+
+def _submit_export_job(filters: Dict, include_youtube_data: bool, filename: str) -> Response:
+    """Queue a background export and answer 202 with where to poll"""
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    _purge_expired_exports()
+    
+    job_id = uuid.uuid4().hex
+    _write_export_status(job_id, {
+        'status': 'queued',
+        'filename': f'{filename}.gz',
+        'error': None,
+        'created_at': datetime.utcnow().isoformat(),
+        'finished_at': None
+    })
+    _export_executor.submit(_run_export_job, job_id, filters, include_youtube_data)
+    
+    status_url = url_for('export_status', job_id=job_id)
+    response = jsonify({
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': status_url,
+        'service': 'Prism Analytics Engine'
+    })
+    response.status_code = 202
+    response.headers['Location'] = status_url
+    return response
+
 @app.route('/api/export', methods=['POST'])
 def export_leads():
     """Export filtered leads to CSV including YouTube data"""
     try:
-        data = request.get_json() or {}
-        filters = data.get('filters', {})
-        include_youtube_data = data.get('include_youtube_data', True)
+        data = _json_body() or {}
+        filters = data.get('filters') or {}
+        include_youtube_data = bool(data.get('include_youtube_data', True))
         
-        with db_manager.get_session() as session:
-            # Build query with filters
-            query = session.query(Artist)
-            
-            if filters.get('tier'):
-                query = query.filter(Artist.lead_tier == filters['tier'].upper())
-            
-            if filters.get('region'):
-                query = query.filter(Artist.region == filters['region'])
-            
-            if filters.get('min_score'):
-                query = query.filter(Artist.total_score >= filters['min_score'])
-            
-            if filters.get('max_score'):
-                query = query.filter(Artist.total_score <= filters['max_score'])
-            
-            # YouTube filtering for export
-            if filters.get('youtube_filter'):
-                youtube_filter = filters['youtube_filter']
-                if youtube_filter == 'has_channel':
-                    query = query.filter(Artist.youtube_channel_id.isnot(None))
-                elif youtube_filter == 'no_channel':
-                    query = query.filter(Artist.youtube_channel_id.is_(None))
-                elif youtube_filter == 'high_potential':
-                    query = query.filter(Artist.youtube_growth_potential == 'high_potential')
-            
-            # Order by score
-            leads = query.order_by(Artist.total_score.desc()).all()
-            
-            if not leads:
-                return jsonify({
-                    'error': 'No leads found with current filters',
-                    'service': 'Prism Analytics Engine'
-                }), 404
-            
-            # Create CSV content
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Define headers
-            basic_headers = [
-                'Artist Name', 'Country', 'Region', 'Genre', 'Total Score',
-                'Independence Score', 'Opportunity Score', 'Geographic Score',
-                'Lead Tier', 'Monthly Listeners', 'Last Release Date',
-                'Outreach Status', 'Contact Email', 'Website', 'Social Handles',
-                'Created Date'
-            ]
-            
-            youtube_headers = [
-                'YouTube Channel ID', 'YouTube Channel URL', 'YouTube Subscribers', 
-                'YouTube Total Views', 'YouTube Video Count', 'YouTube Upload Frequency', 
-                'YouTube Growth Potential', 'YouTube Engagement Rate'
-            ]
-            
-            headers = basic_headers + (youtube_headers if include_youtube_data else [])
-            writer.writerow(headers)
-            
-            # Write data
-            for artist in leads:
-                # Safe datetime access
-                last_release_date = getattr(artist, 'last_release_date', None)
-                created_at = getattr(artist, 'created_at', None)
-                
-                basic_data = [
-                    artist.name,
-                    artist.country or '',
-                    artist.region or '',
-                    artist.genre or '',
-                    artist.total_score,
-                    artist.independence_score,
-                    artist.opportunity_score,
-                    artist.geographic_score,
-                    artist.lead_tier,
-                    artist.monthly_listeners or 0,
-                    last_release_date.strftime('%Y-%m-%d') if last_release_date else '',
-                    artist.outreach_status or '',
-                    artist.contact_email or '',
-                    artist.website or '',
-                    str(getattr(artist, 'social_handles', '')) if getattr(artist, 'social_handles', None) else '',
-                    created_at.strftime('%Y-%m-%d %H:%M:%S') if created_at else ''
-                ]
-                
-                youtube_data = [
-                    artist.youtube_channel_id or '',
-                    artist.youtube_channel_url or '',
-                    artist.youtube_subscribers or 0,
-                    artist.youtube_total_views or 0,
-                    artist.youtube_video_count or 0,
-                    artist.youtube_upload_frequency or '',
-                    artist.youtube_growth_potential or '',
-                    artist.youtube_engagement_rate or 0.0
-                ]
-                
-                row_data = basic_data + (youtube_data if include_youtube_data else [])
-                writer.writerow(row_data)
-            
-            csv_content = output.getvalue()
-            output.close()
-            
-            # Create filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'prism_analytics_leads_{timestamp}.csv'
-            
+        if not isinstance(filters, dict):
             return jsonify({
-                'csv_data': csv_content,
-                'filename': filename,
-                'count': len(leads),
-                'includes_youtube_data': include_youtube_data,
-                'filters_applied': filters,
-                'generated_at': datetime.utcnow().isoformat(),
+                'error': 'filters must be an object',
                 'service': 'Prism Analytics Engine'
-            })
+            }), 400
+        
+        # Create filename with timestamp
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f'prism_analytics_leads_{timestamp}.csv'
+        
+        session = get_db_session()
+        query = _filter_export_query(session.query(Artist), filters)
         
+        # One-row probe instead of loading the whole result to test emptiness
+        if query.with_entities(Artist.id).first() is None:
+            return jsonify({
+                'error': 'No leads found with current filters',
+                'service': 'Prism Analytics Engine'
+            }), 404
+        
+        # "async": true (or Prefer: respond-async) hands the export to a
+        # background worker and returns 202 with a status URL
+        if data.get('async') or 'respond-async' in request.headers.get('Prefer', ''):
+            return _submit_export_job(filters, include_youtube_data, filename)
+        
+        # format=csv (or Accept: text/csv) streams a text/csv download
+        # instead of the JSON envelope
+        wants_csv = (data.get('format') or request.args.get('format')) == 'csv' or \
+            request.accept_mimetypes.best == 'text/csv'
+        if wants_csv:
+            return Response(
+                stream_with_context(_stream_export_csv(filters, include_youtube_data)),
+                mimetype='text/csv',
+                headers={'Content-Disposition': f'attachment; filename={filename}'}
+            )
+        
+        # Create CSV content
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(_EXPORT_BASIC_HEADERS + (_EXPORT_YOUTUBE_HEADERS if include_youtube_data else []))
+        
+        # Plain column tuples, fetched in batches and counted as they're written
+        count = 0
+        rows = query.with_entities(*_export_columns(include_youtube_data))
+        for row in rows.yield_per(500):
+            writer.writerow(_export_row(row, include_youtube_data))
+            count += 1
+        
+        csv_content = output.getvalue()
+        output.close()
+        
+        return jsonify({
+            'csv_data': csv_content,
+            'filename': filename,
+            'count': count,
+            'includes_youtube_data': include_youtube_data,
+            'filters_applied': filters,
+            'generated_at': datetime.utcnow().isoformat(),
+            'service': 'Prism Analytics Engine'
+        })
+    
     except Exception as e:
         logger.error(f"Error in export_leads: {e}")
         return jsonify({
@@ -1066,15 +1614,130 @@ def export_leads():
             'service': 'Prism Analytics Engine'
         }), 500
 
+@app.route('/api/export/<job_id>', methods=['GET'])
+def export_status(job_id):
+    """Status of a background export; links the file once it's written"""
+    job = _read_export_status(job_id)
+    if job is None:
+        return jsonify({
+            'error': 'Export job not found or expired',
+            'service': 'Prism Analytics Engine'
+        }), 404
+    
+    result = {
+        'job_id': job_id,
+        'status': job['status'],
+        'filename': job['filename'],
+        'created_at': job['created_at'],
+        'finished_at': job['finished_at'],
+        'service': 'Prism Analytics Engine'
+    }
+    if job['status'] == 'completed':
+        result['download_url'] = url_for('download_export', job_id=job_id)
+    elif job['status'] == 'failed':
+        result['error'] = job['error']
+    
+    # Still queued or running: 202 tells pollers to come back
+    return jsonify(result), 200 if job['status'] in ('completed', 'failed') else 202
+
+@app.route('/api/export/<job_id>/download', methods=['GET'])
+def download_export(job_id):
+    """Gzipped CSV written by a completed background export"""
+    job = _read_export_status(job_id)
+    path = _export_path(job_id, '.csv.gz')
+    if job is None or job['status'] != 'completed' or not os.path.exists(path):
+        return jsonify({
+            'error': 'Export file not available',
+            'service': 'Prism Analytics Engine'
+        }), 404
+    
+    return send_file(path, mimetype='application/gzip',
+                     as_attachment=True, download_name=job['filename'])
+
 # Add this to your src/api/routes.py file
 
+def _serialize_track_metadata(track_metadata, **extra) -> Dict:
+    """JSON-ready dict for an enhanced TrackMetadata; extra keys follow 'status'"""
+    return {
+        'isrc': track_metadata.isrc,
+        'status': 'completed',
+        **extra,
+        
+        # Basic Information
+        'track_data': {
+            'title': track_metadata.title,
+            'artist': track_metadata.artist,
+            'album': track_metadata.album,
+            'duration_ms': track_metadata.duration_ms,
+            'release_date': track_metadata.release_date,
+            'genre': track_metadata.genre,
+            'tags': track_metadata.tags
+        },
+        
+        # Comprehensive Credits
+        'credits': {
+            'composers': track_metadata.credits.composers,
+            'lyricists': track_metadata.credits.lyricists,
+            'producers': track_metadata.credits.producers,
+            'performers': track_metadata.credits.performers,
+            'engineers': track_metadata.credits.engineers,
+            'other_credits': track_metadata.credits.other_credits
+        },
+        
+        # Lyrics Information
+        'lyrics': {
+            'content': track_metadata.lyrics,
+            'language': track_metadata.lyrics_language,
+            'copyright': track_metadata.lyrics_copyright,
+            'source': 'Available' if track_metadata.lyrics else None
+        },
+        
+        # Technical Details
+        'technical': {
+            'key': track_metadata.key,
+            'tempo_bpm': track_metadata.tempo_bpm,
+            'time_signature': track_metadata.time_signature,
+            'energy': track_metadata.energy,
+            'valence': track_metadata.valence,
+            'danceability': track_metadata.danceability,
+            'acousticness': track_metadata.acousticness,
+            'instrumentalness': track_metadata.instrumentalness,
+            'speechiness': track_metadata.speechiness,
+            'loudness': track_metadata.loudness
+        },
+        
+        # Publishing & Rights
+        'rights': {
+            'publisher': track_metadata.publisher,
+            'record_label': track_metadata.record_label,
+            'copyright_info': track_metadata.copyright_info,
+            'publishing_splits': track_metadata.publishing_splits
+        },
+        
+        # Platform Information
+        'platform_availability': track_metadata.platform_availability,
+        'platform_ids': track_metadata.platform_ids,
+        
+        # Recording Information
+        'recording_info': {
+            'location': track_metadata.recording_location,
+            'date': track_metadata.recording_date
+        },
+        
+        # Metadata
+        'data_sources_used': track_metadata.data_sources,
+        'confidence_score': track_metadata.confidence_score,
+        'service': 'Prism Analytics Engine',
+        'timestamp': datetime.utcnow().isoformat()
+    }
+
 @app.route('/api/analyze-isrc-enhanced', methods=['POST'])
 def analyze_isrc_enhanced():
     """
     Enhanced ISRC analysis with comprehensive track metadata for distribution teams
     """
     try:
-        data = request.get_json()
+        data = _json_body()
         
         if not data or 'isrc' not in data:
             return jsonify({
@@ -1092,93 +1755,15 @@ def analyze_isrc_enhanced():
         
         isrc = result  # Use cleaned ISRC
         
-        # Import the enhanced collector
-        from src.services.enhanced_track_metadata import EnhancedTrackMetadataCollector
-        
-        # Initialize enhanced collector
-        enhanced_collector = EnhancedTrackMetadataCollector(rate_limiter)
-        
         logger.info(f"Starting enhanced processing for ISRC: {isrc}")
         start_time = time.time()
         
         # Collect comprehensive track metadata
-        track_metadata = enhanced_collector.collect_comprehensive_track_data(isrc)
+        track_metadata = get_track_metadata(isrc)
         
         processing_time = round(time.time() - start_time, 2)
         
-        # Convert to JSON-serializable format
-        result = {
-            'isrc': track_metadata.isrc,
-            'status': 'completed',
-            'processing_time': processing_time,
-            
-            # Basic Information
-            'track_data': {
-                'title': track_metadata.title,
-                'artist': track_metadata.artist,
-                'album': track_metadata.album,
-                'duration_ms': track_metadata.duration_ms,
-                'release_date': track_metadata.release_date.isoformat() if track_metadata.release_date else None,
-                'genre': track_metadata.genre,
-                'tags': track_metadata.tags
-            },
-            
-            # Comprehensive Credits
-            'credits': {
-                'composers': track_metadata.credits.composers,
-                'lyricists': track_metadata.credits.lyricists,
-                'producers': track_metadata.credits.producers,
-                'performers': track_metadata.credits.performers,
-                'engineers': track_metadata.credits.engineers,
-                'other_credits': track_metadata.credits.other_credits
-            },
-            
-            # Lyrics Information
-            'lyrics': {
-                'content': track_metadata.lyrics,
-                'language': track_metadata.lyrics_language,
-                'copyright': track_metadata.lyrics_copyright,
-                'source': 'Available' if track_metadata.lyrics else None
-            },
-            
-            # Technical Details
-            'technical': {
-                'key': track_metadata.key,
-                'tempo_bpm': track_metadata.tempo_bpm,
-                'time_signature': track_metadata.time_signature,
-                'energy': track_metadata.energy,
-                'valence': track_metadata.valence,
-                'danceability': track_metadata.danceability,
-                'acousticness': track_metadata.acousticness,
-                'instrumentalness': track_metadata.instrumentalness,
-                'speechiness': track_metadata.speechiness,
-                'loudness': track_metadata.loudness
-            },
-            
-            # Publishing & Rights
-            'rights': {
-                'publisher': track_metadata.publisher,
-                'record_label': track_metadata.record_label,
-                'copyright_info': track_metadata.copyright_info,
-                'publishing_splits': track_metadata.publishing_splits
-            },
-            
-            # Platform Information
-            'platform_availability': track_metadata.platform_availability,
-            'platform_ids': track_metadata.platform_ids,
-            
-            # Recording Information
-            'recording_info': {
-                'location': track_metadata.recording_location,
-                'date': track_metadata.recording_date.isoformat() if track_metadata.recording_date else None
-            },
-            
-            # Metadata
-            'data_sources_used': track_metadata.data_sources,
-            'confidence_score': track_metadata.confidence_score,
-            'service': 'Prism Analytics Engine',
-            'timestamp': datetime.utcnow().isoformat()
-        }
+        result = _serialize_track_metadata(track_metadata, processing_time=processing_time)
         
         logger.info(f"Enhanced ISRC {isrc} processed successfully in {processing_time}s")
         return jsonify(result)
@@ -1209,87 +1794,10 @@ def get_enhanced_track_data(isrc):
         
         clean_isrc = result
         
-        # Import the enhanced collector
-        from src.services.enhanced_track_metadata import EnhancedTrackMetadataCollector
-        
-        # Initialize enhanced collector
-        enhanced_collector = EnhancedTrackMetadataCollector(rate_limiter)
-        
         # Collect comprehensive track metadata
-        track_metadata = enhanced_collector.collect_comprehensive_track_data(clean_isrc)
+        track_metadata = get_track_metadata(clean_isrc)
         
-        # Convert to JSON-serializable format (same as above)
-        result = {
-            'isrc': track_metadata.isrc,
-            'status': 'completed',
-            
-            # Basic Information
-            'track_data': {
-                'title': track_metadata.title,
-                'artist': track_metadata.artist,
-                'album': track_metadata.album,
-                'duration_ms': track_metadata.duration_ms,
-                'release_date': track_metadata.release_date.isoformat() if track_metadata.release_date else None,
-                'genre': track_metadata.genre,
-                'tags': track_metadata.tags
-            },
-            
-            # Comprehensive Credits
-            'credits': {
-                'composers': track_metadata.credits.composers,
-                'lyricists': track_metadata.credits.lyricists,
-                'producers': track_metadata.credits.producers,
-                'performers': track_metadata.credits.performers,
-                'engineers': track_metadata.credits.engineers,
-                'other_credits': track_metadata.credits.other_credits
-            },
-            
-            # Lyrics Information
-            'lyrics': {
-                'content': track_metadata.lyrics,
-                'language': track_metadata.lyrics_language,
-                'copyright': track_metadata.lyrics_copyright,
-                'source': 'Available' if track_metadata.lyrics else None
-            },
-            
-            # Technical Details
-            'technical': {
-                'key': track_metadata.key,
-                'tempo_bpm': track_metadata.tempo_bpm,
-                'time_signature': track_metadata.time_signature,
-                'energy': track_metadata.energy,
-                'valence': track_metadata.valence,
-                'danceability': track_metadata.danceability,
-                'acousticness': track_metadata.acousticness,
-                'instrumentalness': track_metadata.instrumentalness,
-                'speechiness': track_metadata.speechiness,
-                'loudness': track_metadata.loudness
-            },
-            
-            # Publishing & Rights
-            'rights': {
-                'publisher': track_metadata.publisher,
-                'record_label': track_metadata.record_label,
-                'copyright_info': track_metadata.copyright_info,
-                'publishing_splits': track_metadata.publishing_splits
-            },
-            
-            # Platform Information
-            'platform_availability': track_metadata.platform_availability,
-            'platform_ids': track_metadata.platform_ids,
-            
-            # Recording Information
-            'recording_info': {
-                'location': track_metadata.recording_location,
-                'date': track_metadata.recording_date.isoformat() if track_metadata.recording_date else None
-            },
-            
-            # Metadata
-            'data_sources_used': track_metadata.data_sources,
-            'confidence_score': track_metadata.confidence_score,
-            'service': 'Prism Analytics Engine',
-            'timestamp': datetime.utcnow().isoformat()
-        }
+        result = _serialize_track_metadata(track_metadata)
         
         return jsonify(result)
         
@@ -1300,21 +1808,48 @@ def get_enhanced_track_data(isrc):
             'service': 'Prism Analytics Engine'
         }), 500
 
+# Dashboard and YouTube aggregates: a few COUNT/SUM queries per call, reused
+# for a short window and validated by ETag so polling clients get 304s
+STATS_CACHE_TTL_SECONDS = 30
+_stats_cache = TTLCache(maxsize=64, ttl=STATS_CACHE_TTL_SECONDS)
+_stats_cache_lock = threading.Lock()
+
+def _cached_stats(key, compute) -> Tuple[Any, str]:
+    """(compute() result, ETag) for key; empty results (failed queries) aren't kept"""
+    with _stats_cache_lock:
+        entry = _stats_cache.get(key)
+    if entry is None:
+        value = compute()
+        entry = (value, hashlib.blake2b(_dumps(value), digest_size=8).hexdigest())
+        if value:
+            with _stats_cache_lock:
+                _stats_cache[key] = entry
+    return entry
+
+def _stats_response(payload: Dict, etag: str) -> Response:
+    """jsonify(payload) with the stats validators, or 304 when the client's copy is current"""
+    response = Response(status=304) if request.if_none_match.contains(etag) else jsonify(payload)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'max-age={STATS_CACHE_TTL_SECONDS}'
+    return response
+
+def _dashboard_stats() -> Dict:
+    return db_manager.get_dashboard_stats() if hasattr(db_manager, 'get_dashboard_stats') else {}
+
 # Dashboard statistics
 @app.route('/api/dashboard/stats', methods=['GET'])
 def dashboard_stats():
     """Get comprehensive dashboard statistics"""
     try:
-        stats = db_manager.get_dashboard_stats() if hasattr(db_manager, 'get_dashboard_stats') else {}
+        stats, etag = _cached_stats('dashboard', _dashboard_stats)
         
         # Add service metadata
-        stats.update({
+        return _stats_response({
+            **stats,
             'service': 'Prism Analytics Engine',
             'generated_at': datetime.utcnow().isoformat(),
             'company': 'Precise Digital'
-        })
-        
-        return jsonify(stats)
+        }, etag)
         
     except Exception as e:
         logger.error(f"Error in dashboard_stats: {e}")
@@ -1329,7 +1864,7 @@ def dashboard_stats():
 def test_youtube_integration():
     """Test YouTube API integration for a specific artist"""
     try:
-        data = request.get_json()
+        data = _json_body()
         
         is_valid, error_msg = validate_request_data(data, ['artist_name'])
         if not is_valid:
@@ -1382,13 +1917,16 @@ def get_youtube_opportunities():
     try:
         limit = request.args.get('limit', 20, type=int)
         
-        opportunities = db_manager.get_youtube_opportunities(limit=limit) if hasattr(db_manager, 'get_youtube_opportunities') else []
+        opportunities, etag = _cached_stats(
+            ('youtube_opportunities', limit),
+            lambda: db_manager.get_youtube_opportunities(limit=limit) if hasattr(db_manager, 'get_youtube_opportunities') else []
+        )
         
-        return jsonify({
+        return _stats_response({
             'youtube_opportunities': opportunities,
             'generated_at': datetime.utcnow().isoformat(),
             'service': 'Prism Analytics Engine'
-        })
+        }, etag)
         
     except Exception as e:
         logger.error(f"Error in get_youtube_opportunities: {e}")
@@ -1401,24 +1939,24 @@ def get_youtube_opportunities():
 def get_youtube_stats():
     """Get overall YouTube integration statistics"""
     try:
-        stats = db_manager.get_dashboard_stats() if hasattr(db_manager, 'get_dashboard_stats') else {}
+        stats, etag = _cached_stats('dashboard', _dashboard_stats)
         youtube_stats = stats.get('youtube_statistics', {})
         
         total_artists = stats.get('total_artists', 0)
         artists_with_youtube = youtube_stats.get('artists_with_youtube', 0)
         coverage_percentage = (artists_with_youtube / max(total_artists, 1)) * 100
         
-        return jsonify({
+        return _stats_response({
             'total_artists': total_artists,
             'artists_with_youtube_channels': artists_with_youtube,
             'youtube_coverage_percentage': round(coverage_percentage, 1),
             'total_youtube_subscribers': youtube_stats.get('total_youtube_subscribers', 0),
             'average_youtube_subscribers': round(youtube_stats.get('avg_youtube_subscribers', 0)),
             'high_potential_channels': youtube_stats.get('high_potential_channels', 0),
-            'api_status': 'available' if settings.apis['youtube'].api_key else 'not_configured',
+            'api_status': _YT_API_STATUS,
             'generated_at': datetime.utcnow().isoformat(),
             'service': 'Prism Analytics Engine'
-        })
+        }, etag)
         
     except Exception as e:
         logger.error(f"Error in get_youtube_stats: {e}")
@@ -1641,8 +2179,12 @@ if __name__ == '__main__':
     
     # Run the app
     logger.info("🎵 Starting Prism Analytics Engine API Server")
+    # Debug (FLASK_DEBUG=true) enables the debugger only; the reloader's
+    # source-tree scan and second process are left to `python run.py`
     app.run(
         host=settings.app.host,
         port=settings.app.port,
-        debug=settings.app.debug
+        debug=settings.app.debug,
+        use_reloader=False,
+        threaded=True
     )
\ No newline at end of file
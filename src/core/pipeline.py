@@ -2,7 +2,7 @@
 Main processing pipeline for lead generation with YouTube integration
 Orchestrates API calls, data aggregation, and scoring
 """
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import traceback
@@ -10,7 +10,7 @@ import traceback
 from src.core.rate_limiter import RateLimitManager
 from src.core.scoring import LeadScoringEngine
 from src.integrations.base_client import musicbrainz_client, spotify_client, lastfm_client, youtube_client
-from config.database import DatabaseManager
+from config.database import db_manager
 from src.utils.validators import validate_isrc
 from config.settings import settings
 
@@ -23,7 +23,7 @@ class LeadAggregationPipeline:
     def __init__(self, rate_manager: RateLimitManager):
         self.rate_manager = rate_manager
         self.scoring_engine = LeadScoringEngine()
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager  # shared engine and connection pool
         
         # Processing statistics
         self.stats = {
@@ -148,23 +148,7 @@ class LeadAggregationPipeline:
                 print("  8. Saving to database...")
                 try:
                     with self.db_manager as db:
-                        # Prepare YouTube data for database
-                        youtube_data_for_db = self._prepare_youtube_data_for_db(result.get('youtube_data', {}))
-                        
-                        artist_id = db.save_artist_data({
-                            'name': artist_name,
-                            'musicbrainz_id': mb_data.get('artist', {}).get('musicbrainz_artist_id'),
-                            'spotify_id': spotify_data.get('spotify_id') if spotify_data else None,
-                            'country': mb_data.get('artist', {}).get('country'),
-                            'region': self._determine_region(mb_data.get('artist', {}).get('country')),
-                            'genre': self._extract_primary_genre(result),
-                            'monthly_listeners': spotify_data.get('followers', 0) if spotify_data else 0,
-                            'scores': scores,
-                            'track_data': result['track_data'],
-                            'contacts': contacts,
-                            **youtube_data_for_db  # NEW: Include YouTube data
-                        })
-                        result['artist_id'] = artist_id
+                        result['artist_id'] = db.save_artist_data(self._artist_record(result))
                 except Exception as e:
                     result['errors'].append(f"Database save failed: {str(e)}")
             
@@ -185,6 +169,52 @@ class LeadAggregationPipeline:
         
         return result
     
+    def _artist_record(self, result: Dict) -> Dict:
+        """Artist, track and contact payload for DatabaseManager.save_artist_data()"""
+        mb_artist = result['musicbrainz_data'].get('artist', {})
+        spotify_data = result.get('spotify_data') or {}
+        
+        return {
+            'name': mb_artist.get('name'),
+            'musicbrainz_id': mb_artist.get('musicbrainz_artist_id'),
+            'spotify_id': spotify_data.get('spotify_id'),
+            'country': mb_artist.get('country'),
+            'region': self._determine_region(mb_artist.get('country')),
+            'genre': self._extract_primary_genre(result),
+            'monthly_listeners': spotify_data.get('followers', 0),
+            'scores': result['scores'],
+            'track_data': result['track_data'],
+            'contacts': result['contacts'],
+            **self._prepare_youtube_data_for_db(result.get('youtube_data', {}))
+        }
+    
+    def _save_bulk_results(self, results: List[Dict]):
+        """
+        Save one batch's completed results in one transaction
+        
+        Artists still go through save_artist_data() (matched by MusicBrainz ID,
+        Spotify ID or name); their tracks are collected and written with one
+        batched ISRC upsert.
+        """
+        completed = [r for r in results if r.get('status') == 'completed']
+        if not completed:
+            return
+        
+        try:
+            with self.db_manager as db:
+                track_rows = []
+                for result in completed:
+                    record = self._artist_record(result)
+                    track_data = record.pop('track_data') or {}
+                    result['artist_id'] = db.save_artist_data(record)
+                    if track_data.get('isrc'):
+                        track_rows.append({**track_data, 'artist_id': result['artist_id']})
+                db.upsert_tracks(track_rows)
+        except Exception as e:
+            for result in completed:
+                result.pop('artist_id', None)
+                result['errors'].append(f"Database save failed: {str(e)}")
+    
     def process_bulk(self, isrcs: List[str], batch_size: int = 10) -> Dict:
         """
         Process multiple ISRCs in batches with rate limiting
@@ -211,25 +241,25 @@ class LeadAggregationPipeline:
         results = []
         batch_num = 1
         
-        # Process in batches to manage memory and rate limits
-        for i in range(0, total_isrcs, batch_size):
-            batch = isrcs[i:i + batch_size]
-            print(f"\nProcessing batch {batch_num} ({len(batch)} ISRCs)...")
-            
-            batch_results = []
-            for isrc in batch:
-                result = self.process_isrc(isrc, save_to_db=True)
-                batch_results.append(result)
+        # Process in batches to manage memory; ISRCs within a batch run
+        # concurrently (BULK_MAX_WORKERS threads, since the work is outbound
+        # HTTP) and the rate limiter paces each API. Each batch is saved as
+        # soon as it finishes, so a bad row or a crash only loses that batch.
+        with ThreadPoolExecutor(max_workers=max(1, min(batch_size, settings.bulk_max_workers))) as executor:
+            for i in range(0, total_isrcs, batch_size):
+                batch = isrcs[i:i + batch_size]
+                print(f"\nProcessing batch {batch_num} ({len(batch)} ISRCs)...")
                 
-                # Rate limiting between requests
-                if self.stats['processed'] % 5 == 0:
-                    print(f"  Progress: {self.stats['processed']}/{total_isrcs} processed")
-                    # Brief pause to respect rate limits
-                    import time
-                    time.sleep(1)
-            
-            results.extend(batch_results)
-            batch_num += 1
+                batch_results = list(executor.map(lambda isrc: self.process_isrc(isrc, save_to_db=False), batch))
+                self._save_bulk_results(batch_results)
+                results.extend(batch_results)
+                print(f"  Progress: {len(results)}/{total_isrcs} processed")
+                batch_num += 1
+        
+        # Worker threads share self.stats, so recount from the results
+        self.stats['processed'] = len(results)
+        self.stats['successful'] = sum(1 for r in results if r.get('status') == 'completed')
+        self.stats['failed'] = self.stats['processed'] - self.stats['successful']
         
         # Calculate final statistics
         processing_time = (datetime.now() - self.stats['start_time']).total_seconds()
@@ -545,12 +575,8 @@ class LeadAggregationPipeline:
         country = str(country).upper().strip()
         if not country:
             return 'unknown'
-            
-        for region, countries in settings.target_regions.items():
-            if country in countries:
-                return region
         
-        return 'other'
+        return settings.get_region_for_country(country)
     
     def _safe_int(self, value) -> int:
         """Safely convert value to integer, return 0 if not possible"""
@@ -5,20 +5,89 @@ Updated for Prism Analytics Engine enhanced track metadata collection
 import os
 import time
 import json
+import threading
 from typing import Dict, List, Optional
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
+from config.settings import get_settings
+
 logger = logging.getLogger(__name__)
 
+def _build_session() -> requests.Session:
+    """
+    HTTP session shared by every API client
+    
+    Keep-alive pools per host avoid a TCP/TLS handshake per request. Retries
+    cover connection errors and transient 5xx responses only; 429s are left
+    to the rate limiter.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+class TokenBucket:
+    """
+    Per-second limiter: `capacity` tokens, refilled continuously at `rate`/sec
+    
+    Refill is computed lazily from time.monotonic() on each call, so there is
+    no per-request history to trim. Not thread-safe on its own; callers hold
+    the API's lock.
+    """
+    __slots__ = ('capacity', 'rate', 'tokens', 'last')
+    
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+    
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+    
+    def wait_time(self, n: float = 1) -> float:
+        """Seconds until `n` tokens are available (0 if they are now)"""
+        self._refill()
+        return max(0.0, (n - self.tokens) / self.rate)
+    
+    def try_acquire(self, n: float = 1) -> bool:
+        self._refill()
+        if self.tokens >= n:
+            self.tokens -= n
+            return True
+        return False
+    
+    def reset(self):
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+
 class RateLimitManager:
     """
     Enhanced rate limiter with lyrics APIs for comprehensive track metadata
     """
     
     def __init__(self):
+        # Request headers come prebuilt from settings (shared, read-only)
+        settings = get_settings()
+        
         # Load configuration from environment variables with enhanced APIs
         self.api_configs = {
             'musicbrainz': {
@@ -26,7 +95,7 @@ class RateLimitManager:
                 'requests_per_minute': int(os.getenv('MUSICBRAINZ_RATE_LIMIT', 50)),
                 'requests_per_day': None,
                 'base_url': 'https://musicbrainz.org/ws/2/',
-                'headers': {'User-Agent': f"PreciseDigitalLeadGen/1.0 ({os.getenv('CONTACT_EMAIL', 'contact@precise.digital')})"},
+                'headers': settings.get_headers('musicbrainz'),
                 'description': '1 req/sec - respectful usage'
             },
             'spotify': {
@@ -68,7 +137,7 @@ class RateLimitManager:
                 'requests_per_minute': 60,
                 'requests_per_day': None,
                 'base_url': 'https://api.discogs.com/',
-                'headers': {'User-Agent': f"PreciseDigitalLeadGen/1.0 ({os.getenv('CONTACT_EMAIL', 'contact@precise.digital')})"},
+                'headers': settings.get_headers('discogs'),
                 'description': '60 req/min, 1 req/sec'
             },
             # Enhanced APIs for lyrics and metadata
@@ -99,19 +168,26 @@ class RateLimitManager:
             }
         }
         
-        # Request tracking with separate queues for different time windows
-        self.request_history_second = defaultdict(deque)
+        # Per-second limits are token buckets; longer windows keep request
+        # timestamps so status can report exact counts
+        self.second_buckets = {
+            api_name: TokenBucket(config['requests_per_second'], config['requests_per_second'])
+            for api_name, config in self.api_configs.items()
+            if config.get('requests_per_second')
+        }
         self.request_history_minute = defaultdict(deque)
         self.request_history_hour = defaultdict(deque)
         self.daily_counters = defaultdict(int)
         self.youtube_quota_used = 0
         self.last_reset = defaultdict(lambda: datetime.now().date())
         
+        # One lock per API so concurrent callers (bulk processing) check and
+        # record against the windows atomically without blocking other APIs
+        self._locks = {api_name: threading.Lock() for api_name in self.api_configs}
+        
         # HTTP session with proper configuration
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': f"PreciseDigitalLeadGen/1.0 ({os.getenv('CONTACT_EMAIL', 'contact@precise.digital')})"
-        })
+        self.session = _build_session()
+        self.session.headers.update(settings.get_headers('default'))
         
         # Set timeouts from environment
         self.timeout = int(os.getenv('SCRAPING_TIMEOUT', 10))
@@ -133,11 +209,6 @@ class RateLimitManager:
         """Remove old requests from tracking queues"""
         current_time = time.time()
         
-        # Clean requests older than 1 second
-        second_queue = self.request_history_second[api_name]
-        while second_queue and current_time - second_queue[0] > 1.0:
-            second_queue.popleft()
-        
         # Clean requests older than 1 minute
         minute_queue = self.request_history_minute[api_name]
         while minute_queue and current_time - minute_queue[0] > 60.0:
@@ -174,14 +245,11 @@ class RateLimitManager:
         current_time = time.time()
         
         # Check per-second limit
-        if config.get('requests_per_second'):
-            current_second_requests = len(self.request_history_second[api_name])
-            if current_second_requests >= config['requests_per_second']:
-                if self.request_history_second[api_name]:
-                    oldest_request = self.request_history_second[api_name][0]
-                    wait_time = 1.0 - (current_time - oldest_request)
-                    if wait_time > 0:
-                        return False, wait_time
+        bucket = self.second_buckets.get(api_name)
+        if bucket:
+            wait_time = bucket.wait_time()
+            if wait_time > 0:
+                return False, wait_time
         
         # Check per-minute limit
         if config.get('requests_per_minute'):
@@ -234,31 +302,43 @@ class RateLimitManager:
         elif quota_cost is None:
             quota_cost = 1
         
-        # Check if we can make the request
-        can_request, wait_time = self._can_make_request(api_name, quota_cost)
-        
-        if not can_request:
-            if wait_time > 3600:  # More than 1 hour
-                logger.warning(f"Daily limit exceeded for {api_name}. Wait time: {wait_time/3600:.1f} hours")
-                return None
-            elif wait_time > 60:  # More than 1 minute but less than 1 hour
-                logger.info(f"Rate limit exceeded for {api_name}. Wait time: {wait_time/60:.1f} minutes")
-                return None
-            else:
-                logger.info(f"Rate limiting {api_name}. Waiting {wait_time:.1f} seconds...")
-                time.sleep(wait_time + 0.1)  # Small buffer
+        with self._locks[api_name]:
+            # Check if we can make the request
+            can_request, wait_time = self._can_make_request(api_name, quota_cost)
+            
+            if not can_request:
+                if wait_time > 3600:  # More than 1 hour
+                    logger.warning(f"Daily limit exceeded for {api_name}. Wait time: {wait_time/3600:.1f} hours")
+                    return None
+                elif wait_time > 60:  # More than 1 minute but less than 1 hour
+                    logger.info(f"Rate limit exceeded for {api_name}. Wait time: {wait_time/60:.1f} minutes")
+                    return None
+                else:
+                    logger.info(f"Rate limiting {api_name}. Waiting {wait_time:.1f} seconds...")
+                    time.sleep(wait_time + 0.1)  # Small buffer
+            
+            # Record the request
+            current_time = time.time()
+            if api_name in self.second_buckets:
+                self.second_buckets[api_name].try_acquire()
+            self.request_history_minute[api_name].append(current_time)
+            self.request_history_hour[api_name].append(current_time)
+            self.daily_counters[api_name] += 1
+            
+            # Track YouTube quota
+            if api_name == 'youtube':
+                self.youtube_quota_used += quota_cost
+                logger.debug(f"YouTube quota used: +{quota_cost}, total: {self.youtube_quota_used}")
         
         # Build URL
         base_url = config['base_url'].rstrip('/')
         endpoint = endpoint.lstrip('/')
         url = f"{base_url}/{endpoint}" if endpoint else base_url
         
-        # Prepare headers
-        request_headers = {}
-        if config.get('headers'):
-            request_headers.update(config['headers'])
+        # Prepare headers (reuse the configured dict unless the caller adds to it)
+        request_headers = config.get('headers') or None
         if headers:
-            request_headers.update(headers)
+            request_headers = {**(request_headers or {}), **headers}
         
         # Add API keys based on service
         if not params:
@@ -276,18 +356,6 @@ class RateLimitManager:
             params['apikey'] = config['api_key']
         
         try:
-            # Record the request
-            current_time = time.time()
-            self.request_history_second[api_name].append(current_time)
-            self.request_history_minute[api_name].append(current_time)
-            self.request_history_hour[api_name].append(current_time)
-            self.daily_counters[api_name] += 1
-            
-            # Track YouTube quota
-            if api_name == 'youtube':
-                self.youtube_quota_used += quota_cost
-                logger.debug(f"YouTube quota used: +{quota_cost}, total: {self.youtube_quota_used}")
-            
             logger.debug(f"Making {method} request to {api_name}: {url}")
             
             # Make the request
@@ -349,7 +417,8 @@ class RateLimitManager:
             self._reset_daily_counter_if_needed(api_name)
             
             # Basic counters
-            requests_this_second = len(self.request_history_second[api_name])
+            bucket = self.second_buckets.get(api_name)
+            requests_this_second = round(bucket.capacity - bucket.available()) if bucket else 0
             requests_this_minute = len(self.request_history_minute[api_name])
             requests_this_hour = len(self.request_history_hour[api_name])
             requests_today = self.daily_counters[api_name]
@@ -403,7 +472,8 @@ class RateLimitManager:
     def reset_counters(self, api_name: str = None):
         """Reset counters for testing (specify api_name or reset all)"""
         if api_name:
-            self.request_history_second[api_name].clear()
+            if api_name in self.second_buckets:
+                self.second_buckets[api_name].reset()
             self.request_history_minute[api_name].clear()
             self.request_history_hour[api_name].clear()
             self.daily_counters[api_name] = 0
@@ -411,7 +481,8 @@ class RateLimitManager:
                 self.youtube_quota_used = 0
             logger.info(f"Counters reset for {api_name}")
         else:
-            self.request_history_second.clear()
+            for bucket in self.second_buckets.values():
+                bucket.reset()
             self.request_history_minute.clear()
             self.request_history_hour.clear()
             self.daily_counters.clear()
@@ -19,6 +19,7 @@ class LeadScoringEngine:
     def __init__(self):
         self.weights = settings.scoring_weights
         self.target_regions = settings.target_regions
+        self.region_by_code = settings.region_by_code
         self.major_platforms = settings.major_platforms
         
         # Major label keywords for independence detection
@@ -158,7 +159,8 @@ class LeadScoringEngine:
         if not isinstance(platforms_available, list):
             platforms_available = []
             
-        missing_platforms = [p for p in self.major_platforms if p not in platforms_available]
+        available = set(platforms_available)
+        missing_platforms = [p for p in self.major_platforms if p not in available]
         
         if len(missing_platforms) >= 3:
             score += self.weights['opportunity']['missing_platforms']
@@ -267,14 +269,9 @@ class LeadScoringEngine:
         if not country_str:
             return self.weights['geographic']['other']
         
-        # Check against target regions
-        for region, score_value in self.weights['geographic'].items():
-            region_countries = self.target_regions.get(region, [])
-            if country_str in region_countries:
-                return score_value
-        
-        # Default for unmatched countries
-        return self.weights['geographic']['other']
+        # Check against target regions; unmatched countries fall through to 'other'
+        region = self.region_by_code.get(country_str, 'other')
+        return self.weights['geographic'].get(region, self.weights['geographic']['other'])
     
     def _get_most_recent_release_date(self, track_data: Dict, spotify_data: Dict) -> Optional[datetime]:
         """Extract most recent release date from available data"""
@@ -402,7 +399,8 @@ class LeadScoringEngine:
         # Platform availability
         platforms = track_data.get('platforms_available', [])
         if isinstance(platforms, list):
-            missing = [p for p in self.major_platforms if p not in platforms]
+            available = set(platforms)
+            missing = [p for p in self.major_platforms if p not in available]
             if missing:
                 factors.append(f"Missing from platforms: {', '.join(missing[:3])}")
         
@@ -453,11 +451,11 @@ class LeadScoringEngine:
         if country:
             # Find which region this country belongs to
             country_str = self._safe_str(country).upper()
-            for region, countries in self.target_regions.items():
-                if country_str in countries:
-                    region_name = region.replace('_', ' ').title()
-                    factors.append(f"Located in target region: {region_name} ({country_str})")
-                    return factors
+            region = self.region_by_code.get(country_str)
+            if region:
+                region_name = region.replace('_', ' ').title()
+                factors.append(f"Located in target region: {region_name} ({country_str})")
+                return factors
             
             factors.append(f"Outside target regions: {country_str}")
         else:
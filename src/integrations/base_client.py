@@ -3,7 +3,11 @@ API client imports and utility functions for music lead generation.
 Fixed version with proper type hints to resolve Pylance errors.
 """
 
-from typing import Any, Protocol, Dict, Optional, Union
+import functools
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Protocol, Dict, List, Optional, Tuple, Union
 from .base_api import BaseAPIClient
 
 # Define protocols for type safety
@@ -46,63 +50,62 @@ _spotify_client: Optional[Union[SpotifyClientProtocol, FallbackClient]] = None
 _lastfm_client: Optional[Union[LastFmClientProtocol, FallbackClient]] = None
 _youtube_client: Optional[Union[YouTubeClientProtocol, FallbackClient]] = None
 
-def _initialize_clients() -> None:
-    """Initialize all API clients with guaranteed non-None return values"""
-    global _musicbrainz_client, _spotify_client, _lastfm_client, _youtube_client
-    
-    if _musicbrainz_client is not None:
-        return  # Already initialized
-    
-    # Import and initialize each client with guaranteed fallback
-    try:
-        from .musicbrainz import MusicBrainzClient
-        _musicbrainz_client = MusicBrainzClient()
-        print("✅ MusicBrainz client imported successfully")
-    except ImportError as e:
-        print(f"⚠️  MusicBrainz client import failed: {e}")
-        _musicbrainz_client = FallbackClient("MusicBrainz")
-    except Exception as e:
-        print(f"⚠️  MusicBrainz client initialization error: {e}")
-        _musicbrainz_client = FallbackClient("MusicBrainz")
+# (module, class, display name) for each client, in initialization order
+_CLIENT_SPECS = (
+    ('.musicbrainz', 'MusicBrainzClient', 'MusicBrainz'),
+    ('.spotify', 'SpotifyClient', 'Spotify'),
+    ('.lastfm', 'LastFmClient', 'Last.fm'),
+    ('.youtube', 'YouTubeClient', 'YouTube'),
+)
 
-    try:
-        from .spotify import SpotifyClient
-        _spotify_client = SpotifyClient()
-        print("✅ Spotify client imported successfully")
-    except ImportError as e:
-        print(f"⚠️  Spotify client import failed: {e}")
-        _spotify_client = FallbackClient("Spotify")
-    except Exception as e:
-        print(f"⚠️  Spotify client initialization error: {e}")
-        _spotify_client = FallbackClient("Spotify")
+_init_lock = threading.Lock()
 
+def _build_client(module_name: str, class_name: str, label: str) -> Tuple[Optional[Any], List[str]]:
+    """Import and construct one client, returning it (or None) with its status messages"""
     try:
-        from .lastfm import LastFmClient
-        _lastfm_client = LastFmClient()
-        print("✅ Last.fm client imported successfully")
+        module = importlib.import_module(module_name, __package__)
+        client = getattr(module, class_name)()
+        return client, [f"✅ {label} client imported successfully"]
     except ImportError as e:
-        print(f"⚠️  Last.fm client import failed: {e}")
-        _lastfm_client = FallbackClient("Last.fm")
+        if label == 'YouTube':
+            return None, [f"❌ YouTube client import failed: {e}", "YouTube integration will be disabled"]
+        return None, [f"⚠️  {label} client import failed: {e}"]
     except Exception as e:
-        print(f"⚠️  Last.fm client initialization error: {e}")
-        _lastfm_client = FallbackClient("Last.fm")
+        if label == 'YouTube':
+            return None, [f"⚠️  YouTube client initialization warning: {e}"]
+        return None, [f"⚠️  {label} client initialization error: {e}"]
 
-    try:
-        from .youtube import YouTubeClient
-        _youtube_client = YouTubeClient()
-        print("✅ YouTube client imported successfully")
-        from config.settings import settings
-        if settings.apis['youtube'].api_key:
-            print("🎥 YouTube integration: ENABLED with API key")
-        else:
-            print("🎥 YouTube integration: AVAILABLE but no API key configured")
-    except ImportError as e:
-        print(f"❌ YouTube client import failed: {e}")
-        print("YouTube integration will be disabled")
-        _youtube_client = FallbackClient("YouTube")
-    except Exception as e:
-        print(f"⚠️  YouTube client initialization warning: {e}")
-        _youtube_client = FallbackClient("YouTube")
+def _initialize_clients() -> None:
+    """Initialize all API clients with guaranteed non-None return values"""
+    global _musicbrainz_client, _spotify_client, _lastfm_client, _youtube_client
+    
+    if _youtube_client is not None:
+        return  # Already initialized (assigned last)
+    
+    with _init_lock:
+        if _youtube_client is not None:
+            return
+        
+        # Client construction is independent (imports plus e.g. Spotify's token
+        # request), so build all four concurrently and report in a fixed order
+        with ThreadPoolExecutor(max_workers=len(_CLIENT_SPECS)) as executor:
+            results = list(executor.map(lambda spec: _build_client(*spec), _CLIENT_SPECS))
+        
+        clients = []
+        for (_, _, label), (client, messages) in zip(_CLIENT_SPECS, results):
+            for message in messages:
+                print(message)
+            clients.append(client if client is not None else FallbackClient(label))
+        
+        if not isinstance(clients[3], FallbackClient):
+            from config.settings import settings
+            if settings.apis['youtube'].api_key:
+                print("🎥 YouTube integration: ENABLED with API key")
+            else:
+                print("🎥 YouTube integration: AVAILABLE but no API key configured")
+        
+        _musicbrainz_client, _spotify_client, _lastfm_client = clients[:3]
+        _youtube_client = clients[3]
 
 # Typed getters that guarantee non-None returns
 def get_musicbrainz_client() -> Union[MusicBrainzClientProtocol, FallbackClient]:
@@ -152,8 +155,14 @@ spotify_client: Union[SpotifyClientProtocol, FallbackClient] = LazyClient(get_sp
 lastfm_client: Union[LastFmClientProtocol, FallbackClient] = LazyClient(get_lastfm_client, "Last.fm")  # type: ignore
 youtube_client: Union[YouTubeClientProtocol, FallbackClient] = LazyClient(get_youtube_client, "YouTube")  # type: ignore
 
+@functools.lru_cache(maxsize=1)
 def check_client_availability() -> Dict[str, bool]:
-    """Check which clients are available and properly configured"""
+    """
+    Check which clients are available and properly configured
+    
+    Clients are initialized once per process, so the result is memoized;
+    callers must not mutate the returned dict.
+    """
     _initialize_clients()  # Ensure clients are initialized
     
     # Get the actual client instances (guaranteed non-None)
@@ -283,5 +292,3 @@ __all__ = [
     'get_integration_summary',
     'test_all_integrations'
 ]
-
-print("✅ Base API client module loaded with type safety")
\ No newline at end of file
@@ -7,6 +7,9 @@ from typing import Dict, List, Optional
 from .base_api import BaseAPIClient
 from config.settings import settings
 
+# Settings are immutable, so whether Last.fm is usable is resolved once
+_LF_ENABLED = bool(settings.apis['lastfm'].api_key)
+
 
 class LastFmClient(BaseAPIClient):
     """Last.fm API client for social listening data"""
@@ -16,7 +19,7 @@ class LastFmClient(BaseAPIClient):
     
     def get_artist_info(self, artist_name: str) -> Optional[Dict]:
         """Get artist information from Last.fm"""
-        if not settings.apis['lastfm'].api_key:
+        if not _LF_ENABLED:
             return None
         
         params = {
@@ -46,7 +49,7 @@ class LastFmClient(BaseAPIClient):
     
     def get_track_info(self, artist_name: str, track_title: str) -> Optional[Dict]:
         """Get track information from Last.fm"""
-        if not settings.apis['lastfm'].api_key:
+        if not _LF_ENABLED:
             return None
         
         params = {
@@ -3,7 +3,6 @@ Spotify Web API client extracted from existing base_client.py implementation.
 """
 
 import base64
-import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
@@ -36,8 +35,9 @@ class SpotifyClient(BaseAPIClient):
         
         data = {'grant_type': 'client_credentials'}
         
-        # Make direct request for authentication (bypass rate limiter)
-        response = requests.post(
+        # Make direct request for authentication (bypass rate limiting, but
+        # reuse the shared connection pool)
+        response = self.rate_limiter.session.post(
             'https://accounts.spotify.com/api/token',
             headers=headers,
             data=data,
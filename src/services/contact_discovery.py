@@ -3,7 +3,6 @@ Contact Discovery Service with YouTube Integration
 Finds contact information for artists from various sources including YouTube channels
 """
 import re
-import requests
 from urllib.parse import urlparse, urljoin
 from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
@@ -337,12 +336,12 @@ class ContactDiscoveryService:
             # Add rate limiting for web scraping
             time.sleep(2)  # Be respectful to websites
             
+            # The shared session already sends the configured User-Agent
             headers = {
-                'User-Agent': 'PreciseDigitalLeadGen/1.0 (contact@precise.digital)',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
             }
             
-            response = requests.get(website_url, headers=headers, timeout=10)
+            response = rate_limiter.session.get(website_url, headers=headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -439,11 +438,7 @@ class ContactDiscoveryService:
         try:
             time.sleep(1)  # Rate limiting
             
-            headers = {
-                'User-Agent': 'PreciseDigitalLeadGen/1.0 (contact@precise.digital)'
-            }
-            
-            response = requests.get(contact_url, headers=headers, timeout=10)
+            response = rate_limiter.session.get(contact_url, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -10,9 +10,10 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
-import requests
 from urllib.parse import quote_plus
 
+from src.core.rate_limiter import rate_limiter
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -378,7 +379,7 @@ class EnhancedTrackMetadataCollector:
             search_url = f"{self.lyrics_apis['genius']['base_url']}/search"
             params = {'q': f'{artist_name} {title}'}
             
-            response = requests.get(search_url, headers=headers, params=params, timeout=10)
+            response = rate_limiter.session.get(search_url, headers=headers, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('response', {}).get('hits'):
@@ -414,7 +415,7 @@ class EnhancedTrackMetadataCollector:
                 'format': 'json'
             }
             
-            response = requests.get(search_url, params=params, timeout=10)
+            response = rate_limiter.session.get(search_url, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('message', {}).get('body', {}).get('track_list'):
@@ -429,7 +430,7 @@ class EnhancedTrackMetadataCollector:
                         'format': 'json'
                     }
                     
-                    lyrics_response = requests.get(lyrics_url, params=lyrics_params, timeout=10)
+                    lyrics_response = rate_limiter.session.get(lyrics_url, params=lyrics_params, timeout=10)
                     if lyrics_response.status_code == 200:
                         lyrics_data = lyrics_response.json()
                         lyrics_body = lyrics_data.get('message', {}).get('body', {}).get('lyrics', {})
@@ -6,11 +6,15 @@ Part of the Prism Analytics Engine
 
 import os
 import sys
+import stat
+import functools
 import importlib
+import importlib.util
 import subprocess
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Any, Optional, Mapping
 from datetime import datetime
 
 # Add project root to path if not already there
@@ -18,9 +22,50 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+# Environment variables consulted during startup validation
+_ENV_KEYS = (
+    'SECRET_KEY', 'SPOTIFY_CLIENT_ID', 'SPOTIFY_CLIENT_SECRET', 'YOUTUBE_API_KEY',
+    'LASTFM_API_KEY', 'DATABASE_URL', 'FLASK_DEBUG', 'FLASK_ENV', 'PORT',
+    'RENDER', 'HEROKU', 'PRODUCTION'
+)
+
+# Python version check and report, resolved once at import. The config
+# dataclasses use slots=True, which needs Python 3.10+.
+_PY_REQUIRED = (3, 10)
+_PY_OK = sys.version_info >= _PY_REQUIRED
+_PY_VERSION = '.'.join(map(str, sys.version_info[:3]))
+_PY_OK_MESSAGE = f"Python {_PY_VERSION} (required: {_PY_REQUIRED[0]}.{_PY_REQUIRED[1]}+)"
+_PY_OLD_MESSAGE = f"Python {sys.version_info.major}.{sys.version_info.minor} is too old (required: {_PY_REQUIRED[0]}.{_PY_REQUIRED[1]}+)"
+
+# Environment variables reported by _validate_environment_variables
+_CRITICAL_ENV_VARS = (
+    ('SECRET_KEY', 'Flask secret key for security'),
+)
+_OPTIONAL_ENV_VARS = (
+    ('SPOTIFY_CLIENT_ID', 'Spotify API integration'),
+    ('SPOTIFY_CLIENT_SECRET', 'Spotify API integration'),
+    ('YOUTUBE_API_KEY', 'YouTube Data API integration'),
+    ('LASTFM_API_KEY', 'Last.fm API integration'),
+    ('DATABASE_URL', 'Database connection'),
+    ('FLASK_DEBUG', 'Debug mode setting'),
+)
+
+@functools.lru_cache(maxsize=1)
+def _env() -> Mapping[str, Optional[str]]:
+    """Read-only snapshot of the validation-relevant environment, taken on first use"""
+    return MappingProxyType({key: os.environ.get(key) for key in _ENV_KEYS})
+
+@functools.lru_cache(maxsize=1)
+def is_production() -> bool:
+    """True when running on a production host (Render, Heroku or PRODUCTION set)"""
+    env = _env()
+    return bool(env['RENDER'] or env['HEROKU'] or env['PRODUCTION'])
+
 class ValidationResult:
     """Container for validation results"""
     
+    __slots__ = ('category', 'name', 'passed', 'message', 'details', 'timestamp')
+    
     def __init__(self, category: str, name: str, passed: bool, message: str, details: Optional[Dict] = None):
         self.category = category
         self.name = name
@@ -35,7 +80,8 @@ class StartupValidator:
     Checks all critical components before application starts
     """
     
-    def __init__(self):
+    def __init__(self, verify_clients: bool = True):
+        self.verify_clients = verify_clients
         self.results: List[ValidationResult] = []
         self.logger = self._setup_logger()
         self.critical_dependencies = [
@@ -74,7 +120,13 @@ class StartupValidator:
         self._validate_configuration()
         self._validate_environment_variables()
         self._validate_database()
-        self._validate_api_integrations()
+        if self.verify_clients:
+            self._validate_api_integrations()
+        else:
+            self.results.append(ValidationResult(
+                'API Clients', 'Client Checks', True,
+                "API client checks skipped (enable with --verify or PDL_VERIFY_STARTUP)"
+            ))
         
         # Additional validations (warnings only)
         self._validate_optional_features()
@@ -87,19 +139,13 @@ class StartupValidator:
     def _validate_python_version(self):
         """Validate Python version compatibility"""
         try:
-            version_info = sys.version_info
-            required_version = (3, 8)
-            
-            if version_info >= required_version:
+            if _PY_OK:
                 self.results.append(ValidationResult(
-                    'System', 'Python Version', True,
-                    f"Python {version_info.major}.{version_info.minor}.{version_info.micro} (required: {required_version[0]}.{required_version[1]}+)",
-                    {'version': f"{version_info.major}.{version_info.minor}.{version_info.micro}"}
+                    'System', 'Python Version', True, _PY_OK_MESSAGE, {'version': _PY_VERSION}
                 ))
             else:
                 self.results.append(ValidationResult(
-                    'System', 'Python Version', False,
-                    f"Python {version_info.major}.{version_info.minor} is too old (required: {required_version[0]}.{required_version[1]}+)"
+                    'System', 'Python Version', False, _PY_OLD_MESSAGE
                 ))
         except Exception as e:
             self.results.append(ValidationResult(
@@ -153,10 +199,10 @@ class StartupValidator:
             'src/core/rate_limiter.py', 'src/core/scoring.py'
         ]
         
-        # Check directories
+        # Check directories (is_dir() is False for missing paths, so one stat each)
         for directory in required_directories:
             dir_path = project_root / directory
-            if dir_path.exists() and dir_path.is_dir():
+            if dir_path.is_dir():
                 self.results.append(ValidationResult(
                     'Project Structure', f'Directory: {directory}', True,
                     f"Directory exists: {directory}"
@@ -167,12 +213,16 @@ class StartupValidator:
                     f"Missing directory: {directory}"
                 ))
         
-        # Check files
+        # Check files with a single stat() each for existence, type and size
         for file_path in required_files:
             full_path = project_root / file_path
-            if full_path.exists() and full_path.is_file():
+            try:
+                file_stat = full_path.stat()
+            except OSError:
+                file_stat = None
+            if file_stat is not None and stat.S_ISREG(file_stat.st_mode):
                 # Check if file has content
-                if full_path.stat().st_size > 0:
+                if file_stat.st_size > 0:
                     self.results.append(ValidationResult(
                         'Project Structure', f'File: {file_path}', True,
                         f"File exists and has content: {file_path}"
@@ -251,24 +301,11 @@ class StartupValidator:
     def _validate_environment_variables(self):
         """Validate environment variables"""
         
-        # Critical environment variables
-        critical_env_vars = {
-            'SECRET_KEY': 'Flask secret key for security'
-        }
-        
-        # Optional but recommended environment variables
-        optional_env_vars = {
-            'SPOTIFY_CLIENT_ID': 'Spotify API integration',
-            'SPOTIFY_CLIENT_SECRET': 'Spotify API integration',
-            'YOUTUBE_API_KEY': 'YouTube Data API integration',
-            'LASTFM_API_KEY': 'Last.fm API integration',
-            'DATABASE_URL': 'Database connection',
-            'FLASK_DEBUG': 'Debug mode setting'
-        }
+        env = _env()
         
         # Check critical variables
-        for var_name, description in critical_env_vars.items():
-            value = os.getenv(var_name)
+        for var_name, description in _CRITICAL_ENV_VARS:
+            value = env[var_name]
             if value:
                 self.results.append(ValidationResult(
                     'Environment', f'Critical: {var_name}', True,
@@ -280,9 +317,9 @@ class StartupValidator:
                     f"{var_name} not set ({description})"
                 ))
         
-        # Check optional variables
-        for var_name, description in optional_env_vars.items():
-            value = os.getenv(var_name)
+        # Check optional but recommended variables
+        for var_name, description in _OPTIONAL_ENV_VARS:
+            value = env[var_name]
             if value:
                 # Hide sensitive values
                 display_value = f"{value[:8]}..." if len(value) > 8 else "***"
@@ -373,10 +410,18 @@ class StartupValidator:
             clients = {
                 'MusicBrainz': musicbrainz_client,
                 'Spotify': spotify_client,
-                'Last.fm': lastfm_client,
-                'YouTube': youtube_client
+                'Last.fm': lastfm_client
             }
             
+            # YouTube checks only apply when the integration is enabled
+            if _env()['YOUTUBE_API_KEY']:
+                clients['YouTube'] = youtube_client
+            else:
+                self.results.append(ValidationResult(
+                    'API Clients', 'YouTube', True,
+                    "YouTube integration disabled (YOUTUBE_API_KEY not set)"
+                ))
+            
             for client_name, client in clients.items():
                 try:
                     # Check if client is properly initialized
@@ -396,10 +441,9 @@ class StartupValidator:
                         f"{client_name} client error: {e}"
                     ))
             
-            # Test rate limiter
+            # Test rate limiter (the shared instance the clients use)
             try:
-                from src.core.rate_limiter import RateLimitManager
-                rate_limiter = RateLimitManager()
+                from src.core.rate_limiter import rate_limiter
                 status = rate_limiter.get_rate_limit_status()
                 
                 self.results.append(ValidationResult(
@@ -455,9 +499,13 @@ class StartupValidator:
                 "Gunicorn available for production deployment"
             ))
         except ImportError:
+            if importlib.util.find_spec('waitress') is not None:
+                message = "Gunicorn not available (Waitress will serve production)"
+            else:
+                message = "Gunicorn not available (development server only)"
             self.results.append(ValidationResult(
                 'Optional Features', 'Production Server', True,  # Not critical
-                "Gunicorn not available (development server only)"
+                message
             ))
     
     def _validate_performance_requirements(self):
@@ -511,8 +559,10 @@ class StartupValidator:
     def _validate_security_settings(self):
         """Validate security-related settings"""
         
+        env = _env()
+        
         # Check secret key security
-        secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+        secret_key = env['SECRET_KEY'] or 'dev-secret-key-change-in-production'
         if secret_key == 'dev-secret-key-change-in-production':
             self.results.append(ValidationResult(
                 'Security', 'Secret Key', False,
@@ -530,10 +580,9 @@ class StartupValidator:
             ))
         
         # Check debug mode in production
-        debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
-        is_production = os.getenv('RENDER') or os.getenv('HEROKU') or os.getenv('PRODUCTION')
+        debug_mode = (env['FLASK_DEBUG'] or 'False').lower() == 'true'
         
-        if debug_mode and is_production:
+        if debug_mode and is_production():
             self.results.append(ValidationResult(
                 'Security', 'Debug Mode', False,
                 "Debug mode enabled in production (security risk)"
@@ -618,12 +667,14 @@ class StartupValidator:
         # Return True if no critical failures
         return critical_failures == 0
 
-def validate_startup_configuration() -> bool:
+def validate_startup_configuration(verify_clients: bool = True) -> bool:
     """
     Main validation function called during startup
     Returns True if validation passes, False otherwise
+    
+    verify_clients=False skips importing and checking the API clients.
     """
-    validator = StartupValidator()
+    validator = StartupValidator(verify_clients)
     return validator.validate_all()
 
 def run_validation_only():
@@ -3,7 +3,47 @@ Validation utilities for Precise Digital Lead Generation Tool
 Validates ISRCs, email addresses, and other input formats
 """
 import re
-from typing import Tuple
+from typing import Literal, Optional, Tuple, get_args
+
+from pydantic import BaseModel
+
+# Well-formed ISRC after cleaning: CC + XXX + YY + NNNNN, ASCII only
+_ISRC_RE = re.compile(r'[A-Z]{2}[A-Z0-9]{3}[0-9]{2}[A-Z0-9]{5}')
+
+# Separators stripped from ISRC input in a single pass
+_ISRC_SEPARATORS = str.maketrans('', '', '- _')
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$')
+_MUSICBRAINZ_ID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+# Spotify IDs are base62
+_SPOTIFY_ID_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+
+# Common ISO 3166-1 alpha-2 country codes
+_COUNTRY_CODES = frozenset({
+    'AD', 'AE', 'AF', 'AG', 'AI', 'AL', 'AM', 'AO', 'AQ', 'AR', 'AS', 'AT',
+    'AU', 'AW', 'AX', 'AZ', 'BA', 'BB', 'BD', 'BE', 'BF', 'BG', 'BH', 'BI',
+    'BJ', 'BL', 'BM', 'BN', 'BO', 'BQ', 'BR', 'BS', 'BT', 'BV', 'BW', 'BY',
+    'BZ', 'CA', 'CC', 'CD', 'CF', 'CG', 'CH', 'CI', 'CK', 'CL', 'CM', 'CN',
+    'CO', 'CR', 'CU', 'CV', 'CW', 'CX', 'CY', 'CZ', 'DE', 'DJ', 'DK', 'DM',
+    'DO', 'DZ', 'EC', 'EE', 'EG', 'EH', 'ER', 'ES', 'ET', 'FI', 'FJ', 'FK',
+    'FM', 'FO', 'FR', 'GA', 'GB', 'GD', 'GE', 'GF', 'GG', 'GH', 'GI', 'GL',
+    'GM', 'GN', 'GP', 'GQ', 'GR', 'GS', 'GT', 'GU', 'GW', 'GY', 'HK', 'HM',
+    'HN', 'HR', 'HT', 'HU', 'ID', 'IE', 'IL', 'IM', 'IN', 'IO', 'IQ', 'IR',
+    'IS', 'IT', 'JE', 'JM', 'JO', 'JP', 'KE', 'KG', 'KH', 'KI', 'KM', 'KN',
+    'KP', 'KR', 'KW', 'KY', 'KZ', 'LA', 'LB', 'LC', 'LI', 'LK', 'LR', 'LS',
+    'LT', 'LU', 'LV', 'LY', 'MA', 'MC', 'MD', 'ME', 'MF', 'MG', 'MH', 'MK',
+    'ML', 'MM', 'MN', 'MO', 'MP', 'MQ', 'MR', 'MS', 'MT', 'MU', 'MV', 'MW',
+    'MX', 'MY', 'MZ', 'NA', 'NC', 'NE', 'NF', 'NG', 'NI', 'NL', 'NO', 'NP',
+    'NR', 'NU', 'NZ', 'OM', 'PA', 'PE', 'PF', 'PG', 'PH', 'PK', 'PL', 'PM',
+    'PN', 'PR', 'PS', 'PT', 'PW', 'PY', 'QA', 'RE', 'RO', 'RS', 'RU', 'RW',
+    'SA', 'SB', 'SC', 'SD', 'SE', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM',
+    'SN', 'SO', 'SR', 'SS', 'ST', 'SV', 'SX', 'SY', 'SZ', 'TC', 'TD', 'TF',
+    'TG', 'TH', 'TJ', 'TK', 'TL', 'TM', 'TN', 'TO', 'TR', 'TT', 'TV', 'TW',
+    'TZ', 'UA', 'UG', 'UM', 'US', 'UY', 'UZ', 'VA', 'VC', 'VE', 'VG', 'VI',
+    'VN', 'VU', 'WF', 'WS', 'YE', 'YT', 'ZA', 'ZM', 'ZW'
+})
 
 def validate_isrc(isrc_string) -> Tuple[bool, str]:
     """
@@ -24,7 +64,11 @@ def validate_isrc(isrc_string) -> Tuple[bool, str]:
         return False, "ISRC cannot be empty"
     
     # Remove common separators and convert to uppercase
-    cleaned = isrc_str.replace('-', '').replace(' ', '').replace('_', '').upper()
+    cleaned = isrc_str.translate(_ISRC_SEPARATORS).upper()
+    
+    # Fast path: the common well-formed case needs no further checks
+    if _ISRC_RE.fullmatch(cleaned):
+        return True, cleaned
     
     # Check length
     if len(cleaned) != 12:
@@ -86,10 +130,7 @@ def validate_email(email: str) -> Tuple[bool, str]:
     
     email = str(email).strip().lower()
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if re.match(pattern, email):
+    if _EMAIL_RE.match(email):
         return True, email
     else:
         return False, "Invalid email format"
@@ -113,10 +154,7 @@ def validate_url(url: str) -> Tuple[bool, str]:
     if not url.startswith(('http://', 'https://')):
         url = 'https://' + url
     
-    # Basic URL pattern
-    pattern = r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$'
-    
-    if re.match(pattern, url):
+    if _URL_RE.match(url):
         return True, url
     else:
         return False, "Invalid URL format"
@@ -141,8 +179,7 @@ def validate_spotify_id(spotify_id: str) -> Tuple[bool, str]:
         return False, f"Spotify ID must be 22 characters long, got {len(spotify_id)}"
     
     # Check if it contains only valid base62 characters
-    valid_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
-    if not all(c in valid_chars for c in spotify_id):
+    if not _SPOTIFY_ID_CHARS.issuperset(spotify_id):
         return False, "Spotify ID contains invalid characters"
     
     return True, spotify_id
@@ -163,9 +200,7 @@ def validate_musicbrainz_id(mb_id: str) -> Tuple[bool, str]:
     mb_id = str(mb_id).strip().lower()
     
     # UUID pattern: 8-4-4-4-12 hexadecimal digits
-    pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    
-    if re.match(pattern, mb_id):
+    if _MUSICBRAINZ_ID_RE.match(mb_id):
         return True, mb_id
     else:
         return False, "Invalid MusicBrainz ID format (must be UUID)"
@@ -185,40 +220,44 @@ def validate_country_code(country_code: str) -> Tuple[bool, str]:
     
     country_code = str(country_code).strip().upper()
     
-    # List of common ISO 3166-1 alpha-2 country codes
-    valid_codes = {
-        'AD', 'AE', 'AF', 'AG', 'AI', 'AL', 'AM', 'AO', 'AQ', 'AR', 'AS', 'AT',
-        'AU', 'AW', 'AX', 'AZ', 'BA', 'BB', 'BD', 'BE', 'BF', 'BG', 'BH', 'BI',
-        'BJ', 'BL', 'BM', 'BN', 'BO', 'BQ', 'BR', 'BS', 'BT', 'BV', 'BW', 'BY',
-        'BZ', 'CA', 'CC', 'CD', 'CF', 'CG', 'CH', 'CI', 'CK', 'CL', 'CM', 'CN',
-        'CO', 'CR', 'CU', 'CV', 'CW', 'CX', 'CY', 'CZ', 'DE', 'DJ', 'DK', 'DM',
-        'DO', 'DZ', 'EC', 'EE', 'EG', 'EH', 'ER', 'ES', 'ET', 'FI', 'FJ', 'FK',
-        'FM', 'FO', 'FR', 'GA', 'GB', 'GD', 'GE', 'GF', 'GG', 'GH', 'GI', 'GL',
-        'GM', 'GN', 'GP', 'GQ', 'GR', 'GS', 'GT', 'GU', 'GW', 'GY', 'HK', 'HM',
-        'HN', 'HR', 'HT', 'HU', 'ID', 'IE', 'IL', 'IM', 'IN', 'IO', 'IQ', 'IR',
-        'IS', 'IT', 'JE', 'JM', 'JO', 'JP', 'KE', 'KG', 'KH', 'KI', 'KM', 'KN',
-        'KP', 'KR', 'KW', 'KY', 'KZ', 'LA', 'LB', 'LC', 'LI', 'LK', 'LR', 'LS',
-        'LT', 'LU', 'LV', 'LY', 'MA', 'MC', 'MD', 'ME', 'MF', 'MG', 'MH', 'MK',
-        'ML', 'MM', 'MN', 'MO', 'MP', 'MQ', 'MR', 'MS', 'MT', 'MU', 'MV', 'MW',
-        'MX', 'MY', 'MZ', 'NA', 'NC', 'NE', 'NF', 'NG', 'NI', 'NL', 'NO', 'NP',
-        'NR', 'NU', 'NZ', 'OM', 'PA', 'PE', 'PF', 'PG', 'PH', 'PK', 'PL', 'PM',
-        'PN', 'PR', 'PS', 'PT', 'PW', 'PY', 'QA', 'RE', 'RO', 'RS', 'RU', 'RW',
-        'SA', 'SB', 'SC', 'SD', 'SE', 'SG', 'SH', 'SI', 'SJ', 'SK', 'SL', 'SM',
-        'SN', 'SO', 'SR', 'SS', 'ST', 'SV', 'SX', 'SY', 'SZ', 'TC', 'TD', 'TF',
-        'TG', 'TH', 'TJ', 'TK', 'TL', 'TM', 'TN', 'TO', 'TR', 'TT', 'TV', 'TW',
-        'TZ', 'UA', 'UG', 'UM', 'US', 'UY', 'UZ', 'VA', 'VC', 'VE', 'VG', 'VI',
-        'VN', 'VU', 'WF', 'WS', 'YE', 'YT', 'ZA', 'ZM', 'ZW'
-    }
-    
     if len(country_code) != 2:
         return False, "Country code must be 2 characters"
     
-    if country_code in valid_codes:
+    if country_code in _COUNTRY_CODES:
         return True, country_code
     else:
         return False, f"Invalid country code: {country_code}"
 
 # Batch validation functions
+def _well_formed_isrcs(cleaned: list):
+    """
+    Vectorised _ISRC_RE.fullmatch over already-cleaned strings
+    
+    Returns a bool mask; rows it rejects still go through validate_isrc()
+    for the error message. Falls back to the compiled regex without numpy.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [_ISRC_RE.fullmatch(value) is not None for value in cleaned]
+    
+    # Lengths come from Python: numpy drops trailing NULs from fixed-width strings
+    lengths = np.fromiter(map(len, cleaned), dtype=np.intp, count=len(cleaned))
+    chars = np.array(cleaned, dtype='U12')
+    codes = chars.view(np.uint32).reshape(len(cleaned), 12)
+    
+    letter = (codes >= ord('A')) & (codes <= ord('Z'))
+    digit = (codes >= ord('0')) & (codes <= ord('9'))
+    alnum = letter | digit
+    
+    return (
+        (lengths == 12)
+        & letter[:, :2].all(axis=1)
+        & alnum[:, 2:5].all(axis=1)
+        & digit[:, 5:7].all(axis=1)
+        & alnum[:, 7:].all(axis=1)
+    )
+
 def validate_isrc_batch(isrcs: list) -> Tuple[list, list]:
     """
     Validate a batch of ISRCs
@@ -231,8 +270,15 @@ def validate_isrc_batch(isrcs: list) -> Tuple[list, list]:
     """
     valid_isrcs = []
     invalid_isrcs = []
+    if not isrcs:
+        return valid_isrcs, invalid_isrcs
+    
+    cleaned = [str(isrc).strip().translate(_ISRC_SEPARATORS).upper() if isrc else '' for isrc in isrcs]
     
-    for isrc in isrcs:
+    for isrc, value, well_formed in zip(isrcs, cleaned, _well_formed_isrcs(cleaned)):
+        if well_formed:
+            valid_isrcs.append(value)
+            continue
         is_valid, result = validate_isrc(isrc)
         if is_valid:
             valid_isrcs.append(result)
@@ -241,6 +287,16 @@ def validate_isrc_batch(isrcs: list) -> Tuple[list, list]:
     
     return valid_isrcs, invalid_isrcs
 
+# Outreach pipeline stages, in display order
+OutreachStatus = Literal['not_contacted', 'contacted', 'responded', 'interested', 'not_interested', 'converted']
+OUTREACH_STATUSES = get_args(OutreachStatus)
+
+class OutreachUpdate(BaseModel):
+    """Body of an outreach status update; decode with model_validate_json()"""
+    status: OutreachStatus
+    notes: Optional[str] = None
+    method: str = 'manual'
+
 # Test function
 def test_validators():
     """Test all validation functions"""
@@ -8,9 +8,27 @@ import tempfile
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from src.models.database import Base, Artist, Track
+# The global db_manager is built when config.database is first imported; point
+# it at a throwaway SQLite file so tests never touch data/ or a real server
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='prism-tests-'), 'app.db')
+
+from config.database import Base, db_manager
 from src.core.rate_limiter import RateLimitManager
-from config.settings import settings
+
+@pytest.fixture(scope='session', autouse=True)
+def app_tables():
+    """Create the schema behind the global db_manager (used by the API)"""
+    Base.metadata.create_all(db_manager.engine)
+    yield
+    db_manager.engine.dispose()
+
+@pytest.fixture
+def clean_app_db():
+    """Global db_manager with every table emptied before the test"""
+    with db_manager.engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    return db_manager
 
 @pytest.fixture
 def temp_db():
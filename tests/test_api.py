@@ -4,7 +4,18 @@ Test API endpoints
 """
 import pytest
 import json
+import gzip
+import io
+import os
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.api import routes
 from src.api.routes import app
+from config.database import Artist
 
 @pytest.fixture
 def client():
@@ -110,4 +121,199 @@ def test_export_endpoint(client):
     if response.status_code == 200:
         data = json.loads(response.data)
         assert 'csv_data' in data
-        assert 'filename' in data
\ No newline at end of file
+        assert 'filename' in data
+
+@pytest.fixture
+def fresh_caches(clean_app_db, monkeypatch):
+    """Empty database with the stats and search caches cleared"""
+    routes._stats_cache.clear()
+    routes._search_cache.clear()
+    monkeypatch.setattr(routes, '_search_frequency', routes._AccessFrequency())
+    yield clean_app_db
+    routes._stats_cache.clear()
+    routes._search_cache.clear()
+
+def _add_artist(db, name, score=60):
+    with db.get_session() as session:
+        session.add(Artist(name=name, total_score=score, lead_tier='B'))
+
+def test_dashboard_stats_not_modified(client, fresh_caches):
+    """A repeat request with the ETag gets an empty 304"""
+    first = client.get('/api/dashboard/stats')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert first.headers['Cache-Control'] == f'max-age={routes.STATS_CACHE_TTL_SECONDS}'
+    
+    repeat = client.get('/api/dashboard/stats', headers={'If-None-Match': etag})
+    assert repeat.status_code == 304
+    assert repeat.data == b''
+    assert repeat.headers['ETag'] == etag
+
+def test_dashboard_stats_etag_changes_with_data(client, fresh_caches):
+    etag = client.get('/api/dashboard/stats').headers['ETag']
+    
+    _add_artist(fresh_caches, 'Stats Artist')
+    routes._stats_cache.clear()  # as if the TTL had run out
+    
+    response = client.get('/api/dashboard/stats', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+def test_empty_stats_are_not_cached(client, fresh_caches):
+    with patch.object(routes.db_manager, 'get_dashboard_stats', return_value={}) as stats:
+        client.get('/api/dashboard/stats')
+        client.get('/api/dashboard/stats')
+        assert stats.call_count == 2
+        
+        stats.return_value = {'total_artists': 1}
+        client.get('/api/dashboard/stats')
+        client.get('/api/dashboard/stats')
+        assert stats.call_count == 3
+
+def test_leads_not_modified(client, fresh_caches):
+    _add_artist(fresh_caches, 'Leads Artist')
+    
+    first = client.get('/api/leads')
+    assert first.status_code == 200
+    assert len(json.loads(first.data)['leads']) == 1
+    etag = first.headers['ETag']
+    
+    repeat = client.get('/api/leads', headers={'If-None-Match': etag})
+    assert repeat.status_code == 304
+    assert repeat.data == b''
+    assert repeat.headers['ETag'] == etag
+    
+    _add_artist(fresh_caches, 'Another Artist')
+    changed = client.get('/api/leads', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+    assert len(json.loads(changed.data)['leads']) == 2
+
+def test_cached_search_revalidates(client, fresh_caches):
+    """Searches served from the admitted-search cache still answer 304"""
+    _add_artist(fresh_caches, 'Searchable Artist')
+    url = '/api/leads?search=Searchable'
+    
+    for _ in range(routes.SEARCH_CACHE_ADMIT_HITS):
+        response = client.get(url)
+        assert response.status_code == 200
+        body = response.data
+    etag = response.headers['ETag']
+    assert list(routes._search_cache) == [(('search', 'Searchable'),)]
+    
+    # Cache hits never open a session
+    with patch.object(routes.db_manager, 'SessionLocal', side_effect=AssertionError('cache miss')):
+        hit = client.get(url)
+        assert hit.status_code == 200
+        assert hit.data == body
+        assert hit.headers['ETag'] == etag
+        assert hit.headers['Cache-Control'] == 'private, must-revalidate'
+        
+        not_modified = client.get(url, headers={'If-None-Match': etag})
+        assert not_modified.status_code == 304
+        assert not_modified.data == b''
+        assert not_modified.headers['ETag'] == etag
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(routes, 'EXPORT_DIR', str(tmp_path))
+    return tmp_path
+
+def _write_finished_export(export_dir, job_id, body=b'name\nExport Artist\n'):
+    """Job files as another worker would leave them in the shared EXPORT_DIR"""
+    (export_dir / f'{job_id}.json').write_bytes(json.dumps({
+        'status': 'completed',
+        'filename': 'leads.csv.gz',
+        'error': None,
+        'created_at': '2024-01-01T00:00:00',
+        'finished_at': '2024-01-01T00:00:05'
+    }).encode())
+    (export_dir / f'{job_id}.csv.gz').write_bytes(gzip.compress(body))
+
+def test_export_status_read_from_shared_dir(client, export_dir):
+    """Status and download work for jobs this process never saw"""
+    job_id = uuid.uuid4().hex
+    _write_finished_export(export_dir, job_id)
+    
+    status = client.get(f'/api/export/{job_id}')
+    assert status.status_code == 200
+    data = json.loads(status.data)
+    assert data['status'] == 'completed'
+    assert data['download_url'] == f'/api/export/{job_id}/download'
+    
+    download = client.get(data['download_url'])
+    assert download.status_code == 200
+    assert gzip.decompress(download.data) == b'name\nExport Artist\n'
+
+def test_export_status_expired_or_unknown(client, export_dir):
+    job_id = uuid.uuid4().hex
+    _write_finished_export(export_dir, job_id)
+    expired = time.time() - routes.EXPORT_JOB_TTL_SECONDS - 1
+    for path in export_dir.iterdir():
+        os.utime(path, (expired, expired))
+    
+    assert client.get(f'/api/export/{job_id}').status_code == 404
+    assert client.get(f'/api/export/{job_id}/download').status_code == 404
+    assert client.get(f'/api/export/{uuid.uuid4().hex}').status_code == 404
+    assert client.get('/api/export/..%2Fetc').status_code == 404
+    
+    routes._purge_expired_exports()
+    assert list(export_dir.iterdir()) == []
+
+def test_unknown_sort_by_shares_the_default_statement(client, fresh_caches):
+    """Arbitrary sort_by values fall back to total_score instead of caching new statements"""
+    routes._leads_statements.cache_clear()
+    
+    for sort_by in ('total_score', 'bogus', 'also_bogus', 'name'):
+        assert client.get(f'/api/leads?sort_by={sort_by}').status_code == 200
+    
+    assert routes._leads_statements.cache_info().currsize == 2
+
+@pytest.mark.parametrize('path', ['/', '/api/'])
+def test_static_bodies_include_timestamp(client, path):
+    """Root and documentation bodies are complete JSON with integration flags from settings"""
+    response = client.get(path)
+    assert response.status_code == 200
+    
+    data = json.loads(response.data)
+    assert datetime.fromisoformat(data['timestamp'])
+    configured = data['integrations']['youtube']
+    if isinstance(configured, dict):
+        configured = configured['status']
+    assert configured.lower().endswith('configured')
+    assert ('not' not in configured.lower()) == routes.settings.is_api_configured('youtube')
+
+def _upload(client, body, filename='isrcs.txt'):
+    return client.post('/api/upload-isrcs', data={'file': (io.BytesIO(body), filename)},
+                       content_type='multipart/form-data')
+
+def test_upload_dedupes_isrcs(client):
+    response = _upload(client, b'USRC17607839\nusrc-176-07839\nGBUM71505078\n')
+    assert response.status_code == 200
+    
+    data = json.loads(response.data)
+    assert data['isrcs'] == ['USRC17607839', 'GBUM71505078']
+    assert data['count'] == 2
+
+def test_upload_over_limit_reports_numeric_count(client, monkeypatch):
+    """'found' stays a number; truncated says reading stopped at the limit"""
+    monkeypatch.setattr(routes, 'settings', SimpleNamespace(max_bulk_isrcs=2))
+    body = b'\n'.join(f'USRC176{n:05d}'.encode() for n in range(5))
+    
+    response = _upload(client, body)
+    assert response.status_code == 400
+    
+    data = json.loads(response.data)
+    assert data['found'] == 3
+    assert data['truncated'] is True
+
+def test_export_row_writes_social_handles_as_json():
+    """The Python CSV path matches the jsonb text PostgreSQL's COPY path writes"""
+    handles = {'youtube': 'https://youtube.com/@artist', 'ig': '@artíst'}
+    row = ('Artist', 'NZ', 'new_zealand', 'pop', 70, 30, 20, 20, 'B', 0,
+           None, 'not_contacted', None, None, handles, None)
+    
+    cell = routes._export_row(row, include_youtube_data=False)[14]
+    
+    assert cell == '{"ig": "@artíst", "youtube": "https://youtube.com/@artist"}'
+    assert json.loads(cell) == handles
@@ -4,8 +4,10 @@ Test database operations
 """
 import pytest
 from datetime import datetime
+from sqlalchemy import inspect, text
 
-from src.models.database import Artist, Track, ContactAttempt, DatabaseManager
+import config.database as database
+from config.database import Artist, Track, ContactAttempt, DatabaseManager
 
 def test_artist_creation(temp_db):
     """Test creating artist record"""
@@ -124,5 +126,138 @@ def test_get_leads_filtering(temp_db):
     assert len(nz_leads) == 1
     assert nz_leads[0].country == 'NZ'
 
+def _upsert_manager(temp_db):
+    """DatabaseManager whose upsert_tracks() writes through the test session"""
+    manager = DatabaseManager()
+    manager.session = temp_db
+    return manager
+
+def _saved_artist(temp_db, name='Upsert Artist'):
+    artist = Artist(name=name, total_score=50, lead_tier='B')
+    temp_db.add(artist)
+    temp_db.commit()
+    return artist
+
+def test_upsert_tracks_last_row_wins_per_isrc(temp_db):
+    """Duplicate ISRCs in one batch collapse to the last row"""
+    artist = _saved_artist(temp_db)
+    
+    written = _upsert_manager(temp_db).upsert_tracks([
+        {'isrc': 'USRC17607839', 'artist_id': artist.id, 'title': 'First Take'},
+        {'isrc': 'GBUM71505078', 'artist_id': artist.id, 'title': 'Other Track'},
+        {'isrc': 'USRC17607839', 'artist_id': artist.id, 'title': 'Final Take'},
+    ])
+    temp_db.commit()
+    
+    assert written == 2
+    assert temp_db.query(Track).count() == 2
+    assert temp_db.query(Track).filter_by(isrc='USRC17607839').one().title == 'Final Take'
+
+def test_upsert_tracks_updates_existing_row(temp_db):
+    """An existing ISRC is updated in place; columns not in the rows are kept"""
+    old_artist = _saved_artist(temp_db, 'Old Artist')
+    new_artist = _saved_artist(temp_db, 'New Artist')
+    temp_db.add(Track(isrc='USRC17607839', title='Old Title', label='Kept Label', artist_id=old_artist.id))
+    temp_db.commit()
+    
+    _upsert_manager(temp_db).upsert_tracks([
+        {'isrc': 'USRC17607839', 'artist_id': new_artist.id, 'title': 'New Title', 'not_a_column': 1}
+    ])
+    temp_db.commit()
+    
+    track = temp_db.query(Track).filter_by(isrc='USRC17607839').one()
+    assert temp_db.query(Track).count() == 1
+    assert track.title == 'New Title'
+    assert track.artist_id == new_artist.id
+    assert track.label == 'Kept Label'
+
+def test_upsert_tracks_row_fallback_for_other_dialects(temp_db, monkeypatch):
+    """Dialects without ON CONFLICT fall back to per-row ORM writes"""
+    artist = _saved_artist(temp_db)
+    temp_db.add(Track(isrc='USRC17607839', title='Old Title', artist_id=artist.id))
+    temp_db.commit()
+    monkeypatch.setattr(temp_db.get_bind().dialect, 'name', 'mysql')
+    added = []
+    original_add = temp_db.add
+    monkeypatch.setattr(temp_db, 'add', lambda obj: added.append(obj) or original_add(obj))
+    
+    written = _upsert_manager(temp_db).upsert_tracks([
+        {'isrc': 'USRC17607839', 'artist_id': artist.id, 'title': 'Updated'},
+        {'isrc': 'GBUM71505078', 'artist_id': artist.id, 'title': None},
+        {'isrc': 'GBUM71505078', 'artist_id': artist.id, 'title': None},
+    ])
+    temp_db.commit()
+    
+    assert written == 2
+    assert [track.isrc for track in added] == ['USRC17607839', 'GBUM71505078']
+    assert temp_db.query(Track).filter_by(isrc='USRC17607839').one().title == 'Updated'
+    assert temp_db.query(Track).filter_by(isrc='GBUM71505078').one().title == 'Unknown Track'
+
+def test_upsert_tracks_ignores_rows_without_isrc(temp_db):
+    """Rows with no ISRC are skipped and nothing is executed"""
+    assert _upsert_manager(temp_db).upsert_tracks([{'isrc': None, 'artist_id': 1}]) == 0
+    assert temp_db.query(Track).count() == 0
+
+@pytest.fixture
+def migration_db(tmp_path, monkeypatch):
+    """Global db_manager (and init_db()) pointed at an empty SQLite file"""
+    monkeypatch.chdir(tmp_path)  # init_db() creates data/ in the working directory
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'migrations.db'}")
+    manager = DatabaseManager()
+    monkeypatch.setattr(database, 'db_manager', manager)
+    yield manager
+    manager.engine.dispose()
+
+def _youtube_column_names(engine):
+    return {
+        column['name'] for column in inspect(engine).get_columns('artists')
+        if column['name'].startswith('youtube_')
+    }
+
+def _forbid_column_inspection(monkeypatch):
+    def inspected(engine):
+        raise AssertionError('artists columns inspected after the migration was recorded')
+    monkeypatch.setattr(database, '_youtube_columns_missing', inspected)
+
+def test_init_db_records_youtube_migration(migration_db, monkeypatch):
+    """A fresh schema already has the YouTube columns, so init_db() records them"""
+    database.init_db()
+    
+    assert database.is_migration_applied(database.YOUTUBE_MIGRATION, migration_db.engine)
+    
+    _forbid_column_inspection(monkeypatch)
+    assert database.check_youtube_migration_needed() is False
+
+def test_legacy_schema_migrated_once(migration_db, monkeypatch):
+    """A pre-YouTube artists table is migrated, recorded, then only looked up"""
+    with migration_db.engine.begin() as conn:
+        conn.execute(text('CREATE TABLE artists (id INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL)'))
+    
+    assert not database.is_migration_applied(database.YOUTUBE_MIGRATION, migration_db.engine)
+    assert database.check_youtube_migration_needed() is True
+    
+    database.migrate_youtube_fields()
+    
+    expected = {column.name for column in Artist.__table__.columns if column.name.startswith('youtube_')}
+    assert _youtube_column_names(migration_db.engine) == expected
+    assert database.is_migration_applied(database.YOUTUBE_MIGRATION, migration_db.engine)
+    
+    # The second check is a migration_history lookup, not a schema inspection
+    _forbid_column_inspection(monkeypatch)
+    assert database.check_youtube_migration_needed() is False
+
+def test_existing_schema_without_history_is_recorded(migration_db, monkeypatch):
+    """Databases that predate migration_history are inspected once and recorded"""
+    database.Base.metadata.create_all(
+        migration_db.engine,
+        tables=[table for table in database.Base.metadata.sorted_tables if table.name != 'migration_history']
+    )
+    
+    assert database.check_youtube_migration_needed() is False
+    assert database.is_migration_applied(database.YOUTUBE_MIGRATION, migration_db.engine)
+    
+    _forbid_column_inspection(monkeypatch)
+    assert database.check_youtube_migration_needed() is False
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 
 from src.core.pipeline import LeadAggregationPipeline
 from src.core.rate_limiter import RateLimitManager
+from config.database import Artist, Track
 
 @pytest.fixture
 def pipeline():
@@ -73,4 +74,78 @@ def test_processing_stats(pipeline):
     assert 'processed' in stats
     assert 'successful' in stats
     assert 'failed' in stats
-    assert 'elapsed_time' in stats
\ No newline at end of file
+    assert 'elapsed_time' in stats
+
+def _completed_result(isrc, artist_name, mb_artist_id, title):
+    """Minimal completed process_isrc() result for _save_bulk_results()"""
+    return {
+        'isrc': isrc,
+        'status': 'completed',
+        'musicbrainz_data': {'artist': {'name': artist_name, 'musicbrainz_artist_id': mb_artist_id, 'country': 'NZ'}},
+        'spotify_data': {},
+        'youtube_data': {},
+        'scores': {'total_score': 70, 'independence_score': 30, 'opportunity_score': 20,
+                   'geographic_score': 20, 'tier': 'B'},
+        'track_data': {'isrc': isrc, 'title': title},
+        'contacts': [],
+        'errors': []
+    }
+
+def test_save_bulk_results_batches_tracks(pipeline, clean_app_db):
+    """Bulk save writes each artist once and upserts their tracks by ISRC"""
+    results = [
+        _completed_result('USRC17607839', 'Bulk Artist', 'mb-bulk-1', 'First'),
+        _completed_result('GBUM71505078', 'Bulk Artist', 'mb-bulk-1', 'Second'),
+        _completed_result('USRC17607839', 'Bulk Artist', 'mb-bulk-1', 'First (Remaster)'),
+        {'isrc': 'NZABC2400001', 'status': 'failed', 'errors': ['lookup failed']},
+    ]
+    
+    pipeline._save_bulk_results(results)
+    
+    with clean_app_db.get_session() as session:
+        artists = session.query(Artist).all()
+        tracks = {t.isrc: t for t in session.query(Track).all()}
+    
+    assert len(artists) == 1
+    assert set(tracks) == {'USRC17607839', 'GBUM71505078'}
+    assert tracks['USRC17607839'].title == 'First (Remaster)'
+    assert all(t.artist_id == artists[0].id for t in tracks.values())
+    assert [r.get('artist_id') for r in results[:3]] == [artists[0].id] * 3
+    assert 'artist_id' not in results[3]
+
+def test_save_bulk_results_rolls_back_on_failure(pipeline, clean_app_db):
+    """A failed upsert rolls back the whole batch and reports it on every result"""
+    results = [_completed_result('USRC17607839', 'Rollback Artist', 'mb-rollback', 'Track')]
+    
+    with patch.object(clean_app_db, 'upsert_tracks', side_effect=RuntimeError('boom')):
+        pipeline._save_bulk_results(results)
+    
+    with clean_app_db.get_session() as session:
+        assert session.query(Artist).count() == 0
+    assert 'artist_id' not in results[0]
+    assert 'Database save failed: boom' in results[0]['errors']
+
+def test_process_bulk_saves_each_batch(pipeline, clean_app_db):
+    """Finished batches are committed before the next one runs"""
+    results = {
+        'USRC17607839': _completed_result('USRC17607839', 'First Batch Artist', 'mb-batch-1', 'One'),
+        'GBUM71505078': _completed_result('GBUM71505078', 'Second Batch Artist', 'mb-batch-2', 'Two'),
+    }
+    saved = []
+    save_bulk_results = pipeline._save_bulk_results
+    
+    def save_batch(batch_results):
+        if saved:
+            raise RuntimeError('crashed in the second batch')
+        saved.append([r['isrc'] for r in batch_results])
+        save_bulk_results(batch_results)
+    
+    with patch.object(pipeline, 'process_isrc', side_effect=lambda isrc, save_to_db: results[isrc]), \
+            patch.object(pipeline, '_save_bulk_results', side_effect=save_batch):
+        with pytest.raises(RuntimeError):
+            pipeline.process_bulk(list(results), batch_size=1)
+    
+    assert saved == [['USRC17607839']]
+    with clean_app_db.get_session() as session:
+        assert [a.name for a in session.query(Artist).all()] == ['First Batch Artist']
+        assert [t.isrc for t in session.query(Track).all()] == ['USRC17607839']
@@ -0,0 +1,176 @@
+# tests/test_rate_limiter.py
+"""
+Test the per-second token buckets and per-API locking in the rate limiter
+"""
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core import rate_limiter as rate_limiter_module
+from src.core.rate_limiter import RateLimitManager, TokenBucket
+from config.settings import get_settings
+
+class FakeClock:
+    """Stands in for the `time` module; sleep() advances the clock instead of blocking"""
+    
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self._lock = threading.Lock()
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def time(self) -> float:
+        return 1_700_000_000.0 + self.now
+    
+    def sleep(self, seconds: float):
+        with self._lock:
+            self.now += seconds
+    
+    def advance(self, seconds: float):
+        self.sleep(seconds)
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch.object(rate_limiter_module, 'time', fake):
+        yield fake
+
+def test_token_bucket_exhaustion(clock):
+    """A full bucket allows `capacity` immediate acquisitions, then refuses"""
+    bucket = TokenBucket(capacity=5, rate=5)
+    
+    assert all(bucket.try_acquire() for _ in range(5))
+    assert not bucket.try_acquire()
+    assert bucket.available() == 0
+    assert bucket.wait_time() == pytest.approx(0.2)
+
+def test_token_bucket_refill(clock):
+    """Tokens come back at `rate` per second and never exceed capacity"""
+    bucket = TokenBucket(capacity=2, rate=1)
+    assert bucket.try_acquire(2)
+    
+    clock.advance(0.5)
+    assert bucket.available() == pytest.approx(0.5)
+    assert not bucket.try_acquire()
+    assert bucket.wait_time() == pytest.approx(0.5)
+    
+    clock.advance(0.5)
+    assert bucket.try_acquire()
+    
+    clock.advance(60)
+    assert bucket.available() == 2
+
+def test_token_bucket_reset(clock):
+    bucket = TokenBucket(capacity=3, rate=1)
+    assert bucket.try_acquire(3)
+    
+    bucket.reset()
+    
+    assert bucket.available() == 3
+    assert bucket.last == clock.now
+
+def test_reset_counters_single_api(clock):
+    """reset_counters(api) refills that API's bucket and clears its windows only"""
+    manager = RateLimitManager()
+    for api_name in ('musicbrainz', 'discogs'):
+        assert manager.second_buckets[api_name].try_acquire()
+        manager.request_history_minute[api_name].append(clock.time())
+        manager.request_history_hour[api_name].append(clock.time())
+        manager.daily_counters[api_name] = 1
+    
+    manager.reset_counters('musicbrainz')
+    
+    assert manager.second_buckets['musicbrainz'].available() == 1
+    assert not manager.request_history_minute['musicbrainz']
+    assert not manager.request_history_hour['musicbrainz']
+    assert manager.daily_counters['musicbrainz'] == 0
+    assert manager._can_make_request('musicbrainz') == (True, 0)
+    
+    assert manager.second_buckets['discogs'].available() == 0
+    assert len(manager.request_history_minute['discogs']) == 1
+    assert manager.daily_counters['discogs'] == 1
+
+def test_reset_counters_all_apis(clock):
+    manager = RateLimitManager()
+    for bucket in manager.second_buckets.values():
+        bucket.try_acquire(bucket.capacity)
+    manager.daily_counters['lastfm'] = 7
+    manager.youtube_quota_used = 500
+    
+    manager.reset_counters()
+    
+    for bucket in manager.second_buckets.values():
+        assert bucket.available() == bucket.capacity
+    assert not manager.daily_counters
+    assert manager.youtube_quota_used == 0
+
+def test_headers_come_from_settings():
+    """The limiter sends the prebuilt settings headers rather than its own copies"""
+    settings = get_settings()
+    manager = RateLimitManager()
+    
+    assert manager.api_configs['musicbrainz']['headers'] is settings.get_headers('musicbrainz')
+    assert manager.api_configs['discogs']['headers'] is settings.get_headers('discogs')
+    assert manager.session.headers['User-Agent'] == settings.get_headers('default')['User-Agent']
+
+class RecordingBucket(TokenBucket):
+    """Token bucket that records when tokens are taken and whether the API lock was held"""
+    
+    def __init__(self, capacity, rate, clock, lock):
+        super().__init__(capacity, rate)
+        self.clock = clock
+        self.lock = lock
+        self.acquired = []
+    
+    def try_acquire(self, n: float = 1) -> bool:
+        granted = super().try_acquire(n)
+        self.acquired.append((self.clock.now, granted, self.lock.locked()))
+        return granted
+
+@pytest.mark.parametrize('api_name', ['musicbrainz', 'lastfm'])
+def test_make_request_respects_per_second_limit_across_threads(clock, api_name):
+    """Concurrent callers never take more tokens than the bucket allows"""
+    manager = RateLimitManager()
+    limit = manager.api_configs[api_name]['requests_per_second']
+    bucket = RecordingBucket(limit, limit, clock, manager._locks[api_name])
+    manager.second_buckets[api_name] = bucket
+    
+    response = Mock(status_code=200, headers={'content-type': 'application/json'})
+    response.json.return_value = {}
+    manager.session = Mock()
+    manager.session.get.return_value = response
+    
+    threads_count, requests_per_thread = 4, 5
+    results = []
+    
+    def worker():
+        for _ in range(requests_per_thread):
+            results.append(manager.make_request(api_name, 'endpoint'))
+    
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    total = threads_count * requests_per_thread
+    assert results == [{}] * total
+    assert manager.session.get.call_count == total
+    assert len(bucket.acquired) == total
+    
+    # Every token was taken with the API lock held and none was refused,
+    # i.e. callers waited for the bucket instead of racing past it
+    assert all(granted and locked for _, granted, locked in bucket.acquired)
+    
+    # Bucket bound: any run of k requests spanning dt seconds fits in
+    # capacity + rate * dt tokens
+    times = [at for at, _, _ in bucket.acquired]
+    assert times == sorted(times)
+    for i in range(total):
+        for j in range(i, total):
+            assert j - i + 1 <= limit + limit * (times[j] - times[i]) + 1e-9
+    
+    if limit == 1:
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert min(gaps) >= 1.0
@@ -0,0 +1,86 @@
+# tests/test_validators.py
+"""
+Test that batch ISRC validation agrees with validate_isrc()
+"""
+import sys
+import pytest
+
+from src.utils import validators
+from src.utils.validators import validate_isrc, validate_isrc_batch
+
+ISRC_CASES = [
+    'USRC17607839',            # well-formed
+    'usrc17607839',            # lowercase
+    'UsRc17607839',            # mixed case
+    'US-RC1-76-07839',         # hyphens
+    'US RC1 76 07839',         # spaces
+    'US_RC1_76_07839',         # underscores
+    '  USRC17607839\t',        # surrounding whitespace
+    'GBAYE0601498',            # alphanumeric registrant
+    'USRC176ABC12',            # alphanumeric designation code
+    'FRZ03A1B2C3D',            # letters and digits mixed in the designation
+    '',                        # empty
+    '   ',                     # whitespace only
+    '---',                     # separators only
+    None,                      # missing
+    'USRC1760783',             # 11 characters
+    'USRC176078391',           # 13 characters
+    'USRC17607839ZZZZ',        # far too long
+    'X',                       # far too short
+    '1SRC17607839',            # digit in country code
+    'USRC1A607839',            # letter in year
+    'USRC17607$39',            # punctuation
+    'USRC176078.9',            # dot is not a separator
+    'ÜSRC17607839',            # non-ASCII letter
+    'USRC17607839\x00',        # trailing NUL
+    'USRC1760783\x00',         # NUL padding to 12
+    12345678901,               # non-string input
+]
+
+@pytest.fixture(params=['numpy', 'no-numpy'])
+def numpy_mode(request, monkeypatch):
+    """Run once with the numpy mask and once with the regex fallback"""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+    return request.param
+
+def _expected(isrcs):
+    valid, invalid = [], []
+    for isrc in isrcs:
+        is_valid, result = validate_isrc(isrc)
+        if is_valid:
+            valid.append(result)
+        else:
+            invalid.append({'isrc': isrc, 'error': result})
+    return valid, invalid
+
+@pytest.mark.parametrize('isrc', ISRC_CASES, ids=repr)
+def test_batch_matches_single_validation(numpy_mode, isrc):
+    assert validate_isrc_batch([isrc]) == _expected([isrc])
+
+def test_batch_matches_single_validation_mixed(numpy_mode):
+    """Order and error messages are preserved across a mixed batch"""
+    assert validate_isrc_batch(ISRC_CASES) == _expected(ISRC_CASES)
+
+def test_mask_matches_regex(numpy_mode):
+    cleaned = [
+        str(isrc).strip().translate(validators._ISRC_SEPARATORS).upper() if isrc else ''
+        for isrc in ISRC_CASES
+    ]
+    expected = [validators._ISRC_RE.fullmatch(value) is not None for value in cleaned]
+    
+    assert [bool(flag) for flag in validators._well_formed_isrcs(cleaned)] == expected
+
+def test_numpy_and_fallback_agree(monkeypatch):
+    pytest.importorskip('numpy')
+    with_numpy = validate_isrc_batch(ISRC_CASES)
+    
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    without_numpy = validate_isrc_batch(ISRC_CASES)
+    
+    assert with_numpy == without_numpy
+
+def test_empty_batch(numpy_mode):
+    assert validate_isrc_batch([]) == ([], [])
@@ -50,4 +50,4 @@ app = create_app()
 if __name__ == "__main__":
     # This should never run in production with Gunicorn
     print("⚠️  Warning: Running in fallback mode. Use Gunicorn for production!")
-    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=False)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=False, use_reloader=False, threaded=True)
\ No newline at end of file